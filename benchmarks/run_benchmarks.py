@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+페니의 게임 성능 벤치마크
+시뮬레이터별 초당 게임 수, 트레이너의 초당 에피소드 수, 8x8 토너먼트 실행 시간과
+최대 메모리 사용량을 측정하고 저장된 기준값(baseline.json)과 비교
+
+사용법:
+    python benchmarks/run_benchmarks.py                 # 기준값과 비교 (회귀 시 종료 코드 1)
+    python benchmarks/run_benchmarks.py --save          # 현재 결과를 기준값으로 저장
+    python benchmarks/run_benchmarks.py -k batch        # 이름에 'batch'가 포함된 항목만 실행
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from batch_simulator import count_wins, simulate_matchups, simulate_single_game
+from corrected_strategy import StrategyValidator
+from exact_probability import _cached_matrix, win_probability_matrix
+from main_rl_trainer import PenneysRLTrainer
+from parallel_runner import parallel_count_wins, parallel_win_matrix
+from pattern_automaton import all_patterns
+from verification_study import HeadToHeadTournament
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), 'baseline.json')
+SEED = 12345
+
+
+# 각 벤치마크는 작업을 수행하고 (처리량 단위 수, 단위 이름)을 반환
+
+def bench_simulate_single_game():
+    random.seed(SEED)
+    games = 20000
+    for _ in range(games):
+        simulate_single_game('HTH', 'HHT')
+    return games, 'games'
+
+
+def bench_count_wins():
+    games = 1000000
+    count_wins('HTH', 'HHT', games, SEED)
+    return games, 'games'
+
+
+def bench_count_wins_k10():
+    games = 20000
+    count_wins('HTHHTHTTHT', 'THTHHTHTTH', games, SEED)
+    return games, 'games'
+
+
+def bench_count_wins_wave_k10():
+    games = 20000
+    count_wins('HTHHTHTTHT', 'THTHHTHTTH', games, SEED, method='wave')
+    return games, 'games'
+
+
+def bench_simulate_matchups():
+    rng = np.random.default_rng(SEED)
+    games = 1000000
+    simulate_matchups(rng.integers(0, 8, games), rng.integers(0, 8, games), 3, rng)
+    return games, 'games'
+
+
+def bench_parallel_count_wins():
+    games = 4000000
+    parallel_count_wins('HTH', 'HHT', games, seed=SEED, max_workers=os.cpu_count())
+    return games, 'games'
+
+
+def bench_trainer_train():
+    random.seed(SEED)
+    episodes = 20000
+    trainer = PenneysRLTrainer()
+    with contextlib.redirect_stdout(io.StringIO()):
+        trainer.train(episodes)
+    return episodes, 'episodes'
+
+
+def bench_trainer_train_batched():
+    episodes = 500000
+    trainer = PenneysRLTrainer()
+    with contextlib.redirect_stdout(io.StringIO()):
+        trainer.train_batched(episodes, seed=SEED)
+    return episodes, 'episodes'
+
+
+def bench_validate_strategy():
+    games = 100000
+    with contextlib.redirect_stdout(io.StringIO()):
+        StrategyValidator(SEED).validate_strategy(games)
+    return games * 8, 'games'
+
+
+def bench_tournament():
+    games = 100000
+    with contextlib.redirect_stdout(io.StringIO()):
+        HeadToHeadTournament(SEED).tournament(games)
+    return games * 16, 'games'
+
+
+def bench_tournament_8x8():
+    games = 100000
+    parallel_win_matrix(all_patterns(3), games, seed=SEED, max_workers=os.cpu_count())
+    return games * 64, 'games'
+
+
+def bench_exact_matrix_8x8():
+    repeats = 100
+    for _ in range(repeats):
+        # 캐시를 비워 매번 새로 계산
+        _cached_matrix.cache_clear()
+        win_probability_matrix()
+    return repeats, 'matrices'
+
+
+BENCHMARKS = {
+    name[len('bench_'):]: func
+    for name, func in sorted(globals().items())
+    if name.startswith('bench_') and callable(func)
+}
+
+
+def run_benchmark(func, repeat):
+    """repeat번 실행한 가장 빠른 시간과, 별도 1회 실행의 최대 메모리 사용량 측정"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        units, unit = func()
+        best = min(best, time.perf_counter() - start)
+
+    # tracemalloc은 실행 속도를 떨어뜨리므로 시간 측정과 분리
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return {
+        'seconds': best,
+        'rate': units / best,
+        'unit': f'{unit}/s',
+        'peak_mb': peak / 2 ** 20,
+    }
+
+
+def compare(results, baseline, tolerance):
+    """기준값 대비 처리량이 줄었거나 메모리가 늘어난 항목 목록 반환"""
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        base = baseline[name]
+        if result['rate'] < base['rate'] * (1 - tolerance):
+            regressions.append(f"{name}: {result['rate']:.3g} < {base['rate']:.3g} {result['unit']}")
+        if result['peak_mb'] > base['peak_mb'] * (1 + tolerance) + 1:
+            regressions.append(f"{name}: peak {result['peak_mb']:.1f} MB > {base['peak_mb']:.1f} MB")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="페니의 게임 성능 벤치마크")
+    parser.add_argument('-k', dest='pattern', default='', help="이름에 포함된 문자열로 항목 선택")
+    parser.add_argument('--repeat', type=int, default=3, help="반복 횟수 (가장 빠른 결과 사용)")
+    parser.add_argument('--save', action='store_true', help="결과를 기준값으로 저장")
+    parser.add_argument('--tolerance', type=float, default=0.25, help="허용 회귀 비율")
+    parser.add_argument('--baseline', default=BASELINE_PATH, help="기준값 파일 경로")
+    args = parser.parse_args()
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    results = {}
+    print(f"{'벤치마크':<24} {'처리량':>16} {'시간(s)':>9} {'메모리(MB)':>11} {'기준 대비':>9}")
+    print("-" * 75)
+    for name, func in BENCHMARKS.items():
+        if args.pattern not in name:
+            continue
+        result = run_benchmark(func, args.repeat)
+        results[name] = result
+
+        ratio = ''
+        if name in baseline:
+            ratio = f"{result['rate'] / baseline[name]['rate']:.2f}x"
+        print(f"{name:<24} {result['rate']:>10.3g} {result['unit']:<5} "
+              f"{result['seconds']:>9.3f} {result['peak_mb']:>11.1f} {ratio:>9}")
+
+    if args.save:
+        baseline.update(results)
+        with open(args.baseline, 'w') as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+            f.write('\n')
+        print(f"\n기준값 저장: {args.baseline}")
+        return 0
+
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print("\n⚠️  성능 회귀 발견:")
+        for line in regressions:
+            print(f"  {line}")
+        return 1
+
+    print("\n✅ 회귀 없음")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
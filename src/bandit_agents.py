@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+다중 슬롯머신(bandit) 에이전트
+상대 배열(상태)마다 2^k개 응답(팔)의 베르누이 보상 문제로 보고
+UCB1, KL-UCB, 톰슨 샘플링(베타 사후분포)으로 탐색을 줄여 최적 응답을 빠르게 식별
+모든 에이전트는 상태 배치 단위로 벡터화되어 있고 PenneysRLTrainer에 그대로 연결됨
+"""
+
+import random
+from collections import deque
+
+import numpy as np
+
+from exact_probability import win_probability_array
+from pattern_automaton import all_patterns
+
+# 누적 후회(regret) 기록 개수
+REGRET_HISTORY = 1000
+
+
+class BanditAgent:
+    """상태별 베르누이 bandit 공통 기반 클래스
+
+    successes[s, a], failures[s, a] -> 상태 s에서 응답 a의 승리/패배 횟수
+    보상은 트레이너가 주는 ±1을 (r + 1) / 2 로 변환하여 사용
+    win_matrix가 주어지면(기본: 정확한 승률 행렬) 매 갱신마다 기대 후회를 누적
+    """
+
+    def __init__(self, k=3, win_matrix=None):
+        self.k = k
+        self.sequences = all_patterns(k)
+        self.n_actions = len(self.sequences)
+        self.successes = np.zeros((self.n_actions, self.n_actions))
+        self.failures = np.zeros((self.n_actions, self.n_actions))
+
+        if win_matrix is None:
+            codes = np.arange(self.n_actions)
+            win_matrix = win_probability_array(codes[:, None], codes[None, :], k)
+        self.win_matrix = np.asarray(win_matrix, dtype=np.float64)
+        self._gaps = self.win_matrix.max(axis=1, keepdims=True) - self.win_matrix
+
+        self.plays = 0
+        self.cumulative_regret = 0.0
+        self.regret_history = deque(maxlen=REGRET_HISTORY)
+
+        # 순차 학습(train)용 난수 생성기: 전역 random 시드를 따름
+        self._rng = None
+
+    @property
+    def pulls(self):
+        return self.successes + self.failures
+
+    @property
+    def q_table(self):
+        """상태별 응답의 추정 승률 (탐욕 정책과 평가에 사용)"""
+        return (self.successes + 1) / (self.pulls + 2)
+
+    def index_table(self, rng):
+        """(상태, 응답)별 선택 지수. 하위 클래스에서 구현"""
+        raise NotImplementedError
+
+    def choose_actions(self, states, rng):
+        """상태 배치에 대한 응답 선택"""
+        return np.argmax(self.index_table(rng)[states], axis=1)
+
+    def update_q_table_batch(self, states, actions, rewards):
+        """경험 배치로 승리/패배 횟수와 후회 갱신"""
+        wins = (np.asarray(rewards) + 1) / 2
+        np.add.at(self.successes, (states, actions), wins)
+        np.add.at(self.failures, (states, actions), 1 - wins)
+
+        self.plays += states.size
+        self.cumulative_regret += float(self._gaps[states, actions].sum())
+        self.regret_history.append((self.plays, self.cumulative_regret))
+
+    def choose_action(self, state):
+        if self._rng is None:
+            self._rng = np.random.default_rng(random.getrandbits(64))
+        return int(self.choose_actions(np.array([state]), self._rng)[0])
+
+    def update_q_table(self, state, action, reward):
+        self.update_q_table_batch(np.array([state]), np.array([action]), np.array([reward]))
+
+    def get_best_action(self, state):
+        return np.argmax(self.q_table[state])
+
+    def get_state(self):
+        """체크포인트에 저장할 배열 사전"""
+        return {
+            'successes': self.successes,
+            'failures': self.failures,
+            'regret': np.array([self.plays, self.cumulative_regret]),
+        }
+
+    def set_state(self, data):
+        self.successes = data['successes'].copy()
+        self.failures = data['failures'].copy()
+        self.plays = int(data['regret'][0])
+        self.cumulative_regret = float(data['regret'][1])
+
+    def _untried_bonus(self, rng):
+        """아직 시도하지 않은 응답을 먼저 고르도록 큰 값과 무작위 순서를 부여"""
+        return np.where(self.pulls == 0, 1e9 + rng.random(self.pulls.shape), 0.0)
+
+
+class UCB1Agent(BanditAgent):
+    """UCB1: 평균 + sqrt(2 ln t / n)
+
+    배치 안의 같은 상태는 같은 응답을 고르므로 작은 num_envs에서 가장 효율적
+    """
+
+    def index_table(self, rng):
+        pulls = self.pulls
+        totals = pulls.sum(axis=1, keepdims=True)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            means = self.successes / pulls
+            bonus = np.sqrt(2 * np.log(np.maximum(totals, 1)) / pulls)
+        index = np.where(pulls > 0, means + bonus, 0.0)
+        return index + self._untried_bonus(rng)
+
+
+def _bernoulli_kl(p, q):
+    """베르누이 분포 KL(p || q)"""
+    p = np.clip(p, 1e-12, 1 - 1e-12)
+    q = np.clip(q, 1e-12, 1 - 1e-12)
+    return p * np.log(p / q) + (1 - p) * np.log((1 - p) / (1 - q))
+
+
+class KLUCBAgent(BanditAgent):
+    """KL-UCB: n KL(평균 || q) <= ln t 를 만족하는 가장 큰 q (이분법)"""
+
+    BISECTION_STEPS = 32
+
+    def index_table(self, rng):
+        pulls = self.pulls
+        totals = pulls.sum(axis=1, keepdims=True)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            means = np.where(pulls > 0, self.successes / pulls, 0.0)
+            budget = np.log(np.maximum(totals, 1)) / pulls
+
+        lower = means.copy()
+        upper = np.ones_like(means)
+        for _ in range(self.BISECTION_STEPS):
+            middle = (lower + upper) / 2
+            inside = _bernoulli_kl(means, middle) <= budget
+            lower = np.where(inside, middle, lower)
+            upper = np.where(inside, upper, middle)
+
+        index = np.where(pulls > 0, lower, 0.0)
+        return index + self._untried_bonus(rng)
+
+
+class ThompsonAgent(BanditAgent):
+    """톰슨 샘플링: Beta(승리 + 1, 패배 + 1) 사후분포에서 게임마다 독립 추출
+
+    index_table은 (상태, 응답)마다 사후분포 표본 하나를 뽑은 테이블이고,
+    choose_actions는 배치 안의 같은 상태도 게임마다 따로 뽑도록 상태 행만 추출
+    """
+
+    def index_table(self, rng):
+        return rng.beta(self.successes + 1, self.failures + 1)
+
+    def choose_actions(self, states, rng):
+        samples = rng.beta(self.successes[states] + 1, self.failures[states] + 1)
+        return np.argmax(samples, axis=1)
+
+
+AGENTS = {
+    'ucb1': UCB1Agent,
+    'kl-ucb': KLUCBAgent,
+    'thompson': ThompsonAgent,
+}
+
+
+def make_agent(name, k=3, win_matrix=None):
+    """이름으로 bandit 에이전트 생성"""
+    if name not in AGENTS:
+        raise ValueError(f"Unknown bandit agent: {name}")
+    return AGENTS[name](k, win_matrix)
@@ -0,0 +1,452 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+벡터화된 페니의 게임 배치 시뮬레이터
+패턴 오토마톤의 전이 테이블 위에서 N개의 게임을 한 번에 진행 (임의 길이 k 지원)
+"""
+
+import random
+
+import numpy as np
+
+from pattern_automaton import all_patterns, get_automaton, encode_sequence
+
+
+def flip_coins(rng, size, p_heads=0.5, dtype=np.uint8):
+    """동전 size개 던지기 (H=0, T=1). p_heads는 앞면이 나올 확률"""
+    if p_heads == 0.5:
+        return rng.integers(0, 2, size=size, dtype=dtype)
+    return (rng.random(size) >= p_heads).astype(dtype)
+
+
+def simulate_single_game(seq1, seq2, max_length=None, p_heads=0.5, rng=None):
+    """단일 게임 시뮬레이션. 1이면 seq1, 2이면 seq2 승리
+
+    rng는 random.Random 인스턴스 (지정하지 않으면 전역 random 사용)
+    """
+    rng = rng or random
+    if seq1 == seq2:
+        return rng.choice([1, 2])
+
+    automaton = get_automaton((seq1, seq2))
+    transitions = automaton.transition_list
+    accept = automaton.accept_list
+
+    state = 0
+    flips = 0
+    while max_length is None or flips < max_length:
+        coin = rng.getrandbits(1) if p_heads == 0.5 else int(rng.random() >= p_heads)
+        state = transitions[state][coin]
+        flips += 1
+        if accept[state] != -1:
+            return accept[state] + 1
+
+    return rng.choice([1, 2])  # 극히 드문 경우
+
+
+def simulate_games(seq1, seq2, num_games, rng=None, max_length=50000, p_heads=0.5,
+                   return_lengths=False):
+    """N개의 게임을 동시에 시뮬레이션. 각 게임의 승자(1 또는 2) 배열 반환
+
+    return_lengths가 참이면 (승자 배열, 게임 길이(동전 던진 횟수) 배열)을 반환
+    """
+    rng = np.random.default_rng(rng)
+    winners = np.zeros(num_games, dtype=np.uint8)
+    lengths = np.zeros(num_games, dtype=np.uint32) if return_lengths else None
+
+    if seq1 == seq2:
+        winners[:] = rng.integers(1, 3, size=num_games)
+        return (winners, lengths) if return_lengths else winners
+
+    automaton = get_automaton((seq1, seq2))
+    # 상태 수가 작으면 uint8로 처리하여 메모리 대역폭 절약
+    dtype = np.uint8 if automaton.n_states <= 128 else np.int32
+    # (상태 << 1) | 동전 으로 인덱싱하는 1차원 전이 테이블
+    transitions = automaton.transitions.ravel().astype(dtype)
+    accept = automaton.accept
+
+    # 진행 중인 게임의 인덱스와 오토마톤 상태
+    active = np.arange(num_games)
+    states = np.zeros(num_games, dtype=dtype)
+
+    for flips in range(1, max_length + 1):
+        if active.size == 0:
+            break
+
+        coins = flip_coins(rng, active.size, p_heads, dtype)
+        states = np.take(transitions, (states << 1) | coins)
+        matched = np.take(accept, states)
+        finished = matched >= 0
+
+        if finished.any():
+            winners[active[finished]] = matched[finished] + 1
+            if return_lengths:
+                lengths[active[finished]] = flips
+            remaining = ~finished
+            active = active[remaining]
+            states = states[remaining]
+
+    # 극히 드문 경우 (max_length 초과) - 기존 구현과 동일하게 무작위 처리
+    if active.size:
+        winners[active] = rng.integers(1, 3, size=active.size)
+        if return_lengths:
+            lengths[active] = max_length
+
+    return (winners, lengths) if return_lengths else winners
+
+
+# 웨이브 시뮬레이터: 한 번에 던지는 동전 수 (uint64 한 개)
+WAVE_BITS = 64
+
+
+def _match_masks(words, codes, k):
+    """words의 각 비트 위치 q에서 끝나는 길이 k 창이 codes[n]과 같으면 결과 n의 q번 비트가 1
+
+    창은 비트 q + k - 1(먼저 던진 동전)부터 q(나중)까지. 창이 word 안에 들어오는 q <= 64 - k 만 유효.
+    코드 비트 i와 (word >> i)의 q번 비트를 비교하여 k번의 시프트 AND로 64개 위치를 동시에 검사
+    """
+    masks = [None] * len(codes)
+    for i in range(k):
+        shifted = words >> np.uint64(i)
+        inverted = ~shifted
+        for n, code in enumerate(codes):
+            term = shifted if (code >> i) & 1 else inverted
+            masks[n] = term if masks[n] is None else masks[n] & term
+    valid = np.uint64((1 << (WAVE_BITS - k + 1)) - 1)
+    return [mask & valid for mask in masks]
+
+
+def _highest_bit(values):
+    """각 값의 최상위 1 비트의 (위치, 그 비트만 남긴 값). 값은 0이 아니어야 함"""
+    for shift in (1, 2, 4, 8, 16, 32):
+        values = values | (values >> np.uint64(shift))
+    top = values ^ (values >> np.uint64(1))
+    return np.log2(top.astype(np.float64)).astype(np.int64), top
+
+
+def _high_bits(count):
+    """상위 count개 비트가 1인 uint64 마스크 값"""
+    return ((1 << WAVE_BITS) - 1) ^ ((1 << (WAVE_BITS - count)) - 1)
+
+
+def simulate_games_wave(seq1, seq2, num_games, rng=None, max_length=50000, p_heads=0.5,
+                        return_lengths=False):
+    """웨이브 방식 시뮬레이션. simulate_games와 같은 인자와 반환값
+
+    게임마다 uint64 난수 하나로 동전 64개를 한꺼번에 던지고(첫 동전이 최상위 비트),
+    시프트 마스크 비교로 64개 위치의 패턴 일치를 동시에 찾는다. 웨이브 경계에 걸친 창은
+    이전 웨이브의 마지막 k - 1개 동전(tail)을 앞에 붙인 두 번째 word로 검사하고,
+    첫 웨이브에는 tail이 없으므로 이 창들을 무시한다. 끝난 게임은 웨이브마다 제거한다.
+    긴 게임(큰 k)에서 동전당 파이썬 반복을 1/64로 줄인다. 편향 동전, 길이가 다른 패턴,
+    k > 32 는 simulate_games로 처리한다.
+    """
+    k = len(seq1)
+    if p_heads != 0.5 or len(seq2) != k or seq1 == seq2 or k > WAVE_BITS // 2:
+        return simulate_games(seq1, seq2, num_games, rng, max_length, p_heads, return_lengths)
+
+    rng = np.random.default_rng(rng)
+    winners = np.zeros(num_games, dtype=np.uint8)
+    lengths = np.zeros(num_games, dtype=np.uint32) if return_lengths else None
+    codes = (encode_sequence(seq1), encode_sequence(seq2))
+    tail_bits = k - 1
+
+    active = np.arange(num_games)
+    tails = np.zeros(num_games, dtype=np.uint64)
+    flips = 0
+
+    while active.size and flips < max_length:
+        words = rng.integers(0, 2 ** 64, size=active.size, dtype=np.uint64)
+        # max_length를 넘는 위치(웨이브 안 stop번째 동전 이후에 끝나는 창)는 제외
+        stop = min(WAVE_BITS, max_length - flips)
+
+        # word 안의 창: 위치 j = 63 - q 번째 동전에서 끝남 (j >= k - 1)
+        mask1, mask2 = _match_masks(words, codes, k)
+        limit = np.uint64(_high_bits(stop))
+        mask1 &= limit
+        mask2 &= limit
+        hits = mask1 | mask2
+        finished = hits != 0
+        positions = np.zeros(active.size, dtype=np.int64)
+        second_won = np.zeros(active.size, dtype=bool)
+        if finished.any():
+            q, top = _highest_bit(hits[finished])
+            positions[finished] = WAVE_BITS - 1 - q
+            second_won[finished] = (top & mask2[finished]) != 0
+
+        # 경계에 걸친 창 (j < k - 1): tail 뒤에 word 앞부분을 붙인 word에서 q = 64 - k - j
+        boundary = min(stop, tail_bits) if flips else 0
+        if boundary:
+            joined = (tails << np.uint64(WAVE_BITS - tail_bits)) | (words >> np.uint64(tail_bits))
+            mask1, mask2 = _match_masks(joined, codes, k)
+            limit = np.uint64(_high_bits(k - 1 + boundary) ^ _high_bits(k - 1))
+            mask1 &= limit
+            mask2 &= limit
+            hits = mask1 | mask2
+            early = hits != 0
+            if early.any():
+                q, top = _highest_bit(hits[early])
+                positions[early] = WAVE_BITS - k - q
+                second_won[early] = (top & mask2[early]) != 0
+                finished |= early
+
+        if finished.any():
+            done = active[finished]
+            winners[done] = np.where(second_won[finished], 2, 1)
+            if return_lengths:
+                lengths[done] = flips + positions[finished] + 1
+            remaining = ~finished
+            active = active[remaining]
+            words = words[remaining]
+
+        tails = words & np.uint64((1 << tail_bits) - 1)
+        flips += WAVE_BITS
+
+    if active.size:
+        winners[active] = rng.integers(1, 3, size=active.size)
+        if return_lengths:
+            lengths[active] = max_length
+
+    return (winners, lengths) if return_lengths else winners
+
+
+def simulate_matchups(first, second, k=3, rng=None, max_length=50000, p_heads=0.5,
+                      return_lengths=False):
+    """서로 다른 대결 쌍을 한 번에 시뮬레이션. first[i] vs second[i] 게임의 승자(1 또는 2) 배열 반환
+
+    first, second는 길이 k 패턴의 인덱스(정수 코드) 배열
+    return_lengths가 참이면 (승자 배열, 게임 길이 배열)을 반환 (같은 배열끼리의 대결은 길이 0)
+    """
+    rng = np.random.default_rng(rng)
+    first = np.asarray(first)
+    second = np.asarray(second)
+    num_games = first.size
+    winners = np.zeros(num_games, dtype=np.uint8)
+    lengths = np.zeros(num_games, dtype=np.uint32) if return_lengths else None
+
+    # 같은 배열끼리의 대결은 무작위
+    same = first == second
+    winners[same] = rng.integers(1, 3, size=int(np.count_nonzero(same)))
+
+    # 모든 2^k 패턴의 오토마톤: 동전이 k개 이상 나오면 상태가 곧 최근 k개 동전의 패턴
+    automaton = get_automaton(tuple(all_patterns(k)))
+    transitions = automaton.transitions.ravel()
+    accept = automaton.accept
+
+    active = np.flatnonzero(~same)
+    first = first[active]
+    second = second[active]
+    states = np.zeros(active.size, dtype=np.int32)
+
+    for flips in range(1, max_length + 1):
+        if active.size == 0:
+            break
+
+        coins = flip_coins(rng, active.size, p_heads, np.int32)
+        states = np.take(transitions, (states << 1) | coins)
+        matched = np.take(accept, states)
+        hit1 = matched == first
+        hit2 = matched == second
+        finished = hit1 | hit2
+
+        if finished.any():
+            winners[active[hit1]] = 1
+            winners[active[hit2]] = 2
+            if return_lengths:
+                lengths[active[finished]] = flips
+            remaining = ~finished
+            active = active[remaining]
+            states = states[remaining]
+            first = first[remaining]
+            second = second[remaining]
+
+    if active.size:
+        winners[active] = rng.integers(1, 3, size=active.size)
+        if return_lengths:
+            lengths[active] = max_length
+
+    return (winners, lengths) if return_lengths else winners
+
+
+# 코인 스트림 방식: 한 번에 비교하는 (스트림 × 대결 쌍) 원소 수
+STREAM_BLOCK = 1 << 20
+
+# 한 번에 진행하는 코인 스트림 수 (첫 등장 시각 행렬과 진행 중 배열의 메모리를 제한)
+STREAM_CHUNK = 1 << 15
+
+
+def first_hit_times(num_streams, k=3, rng=None, max_length=50000, p_heads=0.5):
+    """스트림마다 모든 2^k 패턴이 처음 완성되는 시각(동전 수) 행렬 (num_streams, 2^k)
+
+    동전 하나를 던질 때마다 최근 k개 동전의 코드가 곧 그 시각에 완성된 패턴이므로
+    한 번의 진행으로 모든 패턴의 첫 등장 시각을 얻는다. 모든 패턴이 나온 스트림은 제거.
+    max_length 안에 나오지 않은 패턴은 max_length + 1
+    """
+    rng = np.random.default_rng(rng)
+    size = 1 << k
+    mask = size - 1
+    never = max_length + 1
+    times = np.full(num_streams * size, never, dtype=np.int32)
+
+    active = np.arange(num_streams)
+    windows = np.zeros(num_streams, dtype=np.int64)
+    missing = np.full(num_streams, size)
+
+    for flips in range(1, max_length + 1):
+        if active.size == 0:
+            break
+
+        coins = flip_coins(rng, active.size, p_heads, np.int64)
+        windows = ((windows << 1) | coins) & mask
+        if flips < k:
+            continue
+
+        cells = active * size + windows
+        new = np.take(times, cells) == never
+        times[cells[new]] = flips
+        missing -= new
+
+        finished = missing == 0
+        if finished.any():
+            remaining = ~finished
+            active = active[remaining]
+            windows = windows[remaining]
+            missing = missing[remaining]
+
+    return times.reshape(num_streams, size)
+
+
+def count_pair_wins(first, second, num_games, k=3, rng=None, chunk_size=STREAM_CHUNK,
+                    p_heads=0.5, max_length=50000):
+    """코드 배열 first[i] 대 second[i] 대결에서 second[i]의 승리 횟수 배열
+
+    같은 코인 스트림들의 첫 등장 시각으로 모든 대결 쌍의 결과를 한꺼번에 얻는다.
+    num_games는 스칼라 또는 쌍별 게임 수 배열 (쌍 i는 앞쪽 num_games[i]개 스트림을 사용).
+    같은 배열끼리의 대결과 max_length 초과는 기존 시뮬레이터와 같이 무작위로 결정
+    """
+    rng = np.random.default_rng(rng)
+    first = np.asarray(first, dtype=np.int64).ravel()
+    second = np.asarray(second, dtype=np.int64).ravel()
+    num_games = np.broadcast_to(np.asarray(num_games, dtype=np.int64), first.shape)
+    wins = np.zeros(first.size, dtype=np.int64)
+    total = int(num_games.max()) if first.size else 0
+
+    done = 0
+    while done < total:
+        batch = min(chunk_size, total - done)
+        times = first_hit_times(batch, k, rng, max_length, p_heads)
+        used = np.clip(num_games - done, 0, batch)
+        streams = np.arange(batch)[:, None]
+
+        pairs = max(1, STREAM_BLOCK // batch)
+        for start in range(0, first.size, pairs):
+            block = slice(start, start + pairs)
+            first_times = times[:, first[block]]
+            second_times = times[:, second[block]]
+            valid = streams < used[None, block]
+            wins[block] += np.count_nonzero((second_times < first_times) & valid, axis=0)
+            ties = np.count_nonzero((second_times == first_times) & valid, axis=0)
+            if ties.any():
+                wins[block] += rng.binomial(ties, 0.5)
+
+        done += batch
+
+    return wins
+
+
+def stream_win_matrix(num_games, k=3, rng=None, chunk_size=STREAM_CHUNK, p_heads=0.5):
+    """모든 2^k x 2^k 대결의 승리 횟수 행렬. wins[i, j] = 패턴 j가 패턴 i를 이긴 횟수"""
+    size = 1 << k
+    codes = np.arange(size)
+    wins = count_pair_wins(np.repeat(codes, size), np.tile(codes, size), num_games, k, rng,
+                           chunk_size, p_heads)
+    return wins.reshape(size, size)
+
+
+def _stream_beats(times, first, second, rng):
+    """스트림별로 second 패턴이 first 패턴보다 먼저 나왔는지 (동시/둘 다 미등장은 무작위)"""
+    first_times = times[:, first]
+    second_times = times[:, second]
+    ties = second_times == first_times
+    beats = second_times < first_times
+    if ties.any():
+        beats |= ties & (rng.random(ties.shape) < 0.5)
+    return beats
+
+
+def paired_differences(opponents, responses_a, responses_b, num_games, k=3, rng=None,
+                       antithetic=True, chunk_size=STREAM_CHUNK, p_heads=0.5, max_length=50000):
+    """같은 코인 스트림에서 두 응답(responses_a[i], responses_b[i])을 상대 opponents[i]와 대결
+
+    공통 난수로 두 응답의 결과가 양의 상관을 가지므로 승률 차이의 분산이 크게 줄어든다.
+    antithetic이면 각 스트림의 앞/뒤를 뒤집은 보완 스트림도 함께 사용하는데, 보완 스트림에서
+    패턴 x의 첫 등장 시각은 원래 스트림에서 보완 패턴 ~x의 첫 등장 시각이므로 추가 시뮬레이션이 없다.
+    (보완 스트림은 공정한 동전에서만 같은 분포이므로 p_heads == 0.5 에서만 허용)
+
+    스트림 하나를 표본 단위로 한 합계 사전을 반환한다. 단위의 차이는 (a 승리 - b 승리)로
+    antithetic이면 -2..2, 아니면 -1..1 의 정수:
+        wins_a, wins_b       쌍별 승리 수 (게임 수 = num_games * (2 if antithetic else 1))
+        differences, squares 쌍별 단위 차이의 합과 제곱합
+        total_difference, total_square  모든 쌍의 차이를 더한 단위 값의 합과 제곱합
+                             (쌍들이 같은 스트림을 공유하므로 전체 평균의 표준오차에 필요)
+    """
+    if antithetic and p_heads != 0.5:
+        raise ValueError("Antithetic streams require a fair coin (p_heads=0.5)")
+    rng = np.random.default_rng(rng)
+    opponents = np.asarray(opponents, dtype=np.int64).ravel()
+    responses_a = np.asarray(responses_a, dtype=np.int64).ravel()
+    responses_b = np.asarray(responses_b, dtype=np.int64).ravel()
+    mask = (1 << k) - 1
+
+    totals = {name: np.zeros(opponents.size, dtype=np.int64)
+              for name in ('wins_a', 'wins_b', 'differences', 'squares')}
+    totals['total_difference'] = 0
+    totals['total_square'] = 0
+    done = 0
+    while done < num_games:
+        batch = min(chunk_size, num_games - done)
+        times = first_hit_times(batch, k, rng, max_length, p_heads)
+
+        wins_a = _stream_beats(times, opponents, responses_a, rng).astype(np.int64)
+        wins_b = _stream_beats(times, opponents, responses_b, rng).astype(np.int64)
+        if antithetic:
+            wins_a += _stream_beats(times, opponents ^ mask, responses_a ^ mask, rng)
+            wins_b += _stream_beats(times, opponents ^ mask, responses_b ^ mask, rng)
+
+        differences = wins_a - wins_b
+        unit_totals = differences.sum(axis=1)
+        totals['wins_a'] += wins_a.sum(axis=0)
+        totals['wins_b'] += wins_b.sum(axis=0)
+        totals['differences'] += differences.sum(axis=0)
+        totals['squares'] += (differences * differences).sum(axis=0)
+        totals['total_difference'] += int(unit_totals.sum())
+        totals['total_square'] += int((unit_totals * unit_totals).sum())
+        done += batch
+
+    return totals
+
+
+SIMULATORS = {
+    'automaton': simulate_games,
+    'wave': simulate_games_wave,
+}
+
+
+def count_wins(seq1, seq2, num_games, rng=None, chunk_size=1000000, p_heads=0.5, method='automaton'):
+    """seq2의 승리 횟수 계산 (메모리 사용량 제한을 위해 청크 단위로 진행)
+
+    method는 'automaton'(동전 한 개씩 상태 전이) 또는 'wave'(64개씩 비트 비교)
+    """
+    if method not in SIMULATORS:
+        raise ValueError(f"Unknown simulation method: {method}")
+    simulate = SIMULATORS[method]
+    rng = np.random.default_rng(rng)
+    wins = 0
+    remaining = num_games
+
+    while remaining > 0:
+        batch = min(chunk_size, remaining)
+        winners = simulate(seq1, seq2, batch, rng, p_heads=p_heads)
+        wins += int(np.count_nonzero(winners == 2))
+        remaining -= batch
+
+    return wins
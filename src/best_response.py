@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+긴 패턴의 최적 응답 구조적 탐색
+2^k개 후보를 모두 훑는 대신 구조적으로 가능한 후보만 상관 다항식 공식으로 평가
+
+상대 패턴 A에 대한 후보 (모두 O(k)개):
+    x + A[:-1]               (x = H, T; 공정한 동전에서는 최적 응답이 항상 이 형태)
+    그 패턴들의 한 동전 뒤집기 이웃
+    c^j + A[:k-j]            (j = 2..k, 편향된 동전에서 자주 나오는 면 c의 연속 + A의 접두사)
+    c^k 의 한 동전 뒤집기 이웃 (편향된 동전에서 상대가 약할 때의 범용 응답)
+겹침 길이는 접두사 함수(KMP)로 O(k)에 구하므로 후보 하나의 평가도 O(k)이다.
+작은 k에서는 전수 탐색(ResponseTable)과 승률이 같은지 verify_against_brute_force로 확인
+
+사용법:
+    python src/best_response.py                # k <= 10 전수 검증 후 긴 패턴 예시
+    python src/best_response.py HTHHTTHTHHTHTTTHTHHT
+"""
+
+import math
+import sys
+from fractions import Fraction
+
+from pattern_automaton import COINS
+
+FLIP = {'H': 'T', 'T': 'H'}
+
+# 승리 비율 뺄셈의 결과가 빼지는 상관값의 이 비율 이하이면 float 계산 대신 정확한 유리수로 계산
+CANCELLATION = 1e-6
+
+
+def _overlaps(seq_a, seq_b):
+    """seq_a의 접미사 = seq_b의 접두사 가 되는 모든 길이 m (내림차순)
+
+    seq_b + 구분자 + seq_a 의 접두사 함수에서 마지막 위치의 경계 사슬을 따라감 (O(k))
+    """
+    text = seq_b + '#' + seq_a
+    border = [0] * len(text)
+    for i in range(1, len(text)):
+        length = border[i - 1]
+        while length and text[i] != text[length]:
+            length = border[length - 1]
+        if text[i] == text[length]:
+            length += 1
+        border[i] = length
+
+    lengths = []
+    length = border[-1]
+    while length:
+        lengths.append(length)
+        length = border[length - 1]
+    return lengths
+
+
+def leading_number(seq_a, seq_b):
+    """콘웨이 리딩 넘버 (exact_probability.leading_number와 같은 값, O(k))"""
+    return sum(1 << (m - 1) for m in _overlaps(seq_a, seq_b))
+
+
+def win_odds(seq1, seq2):
+    """공정한 동전에서 seq2가 seq1을 이길 정수 비율 (seq2_odds, seq1_odds)"""
+    if seq1 == seq2:
+        return 1, 1
+    seq2_odds = leading_number(seq1, seq1) - leading_number(seq1, seq2)
+    seq1_odds = leading_number(seq2, seq2) - leading_number(seq2, seq1)
+    return seq2_odds, seq1_odds
+
+
+def _log_prefix_costs(sequence, p_heads):
+    """costs[m] = -log P(sequence[:m])"""
+    log_heads, log_tails = -math.log(p_heads), -math.log(1 - p_heads)
+    costs = [0.0]
+    for coin in sequence:
+        costs.append(costs[-1] + (log_heads if coin == 'H' else log_tails))
+    return costs
+
+
+def win_probability(seq1, seq2, p_heads=0.5):
+    """seq2가 seq1을 이길 확률 (공정한 동전은 정확한 Fraction, 그 외 float)
+
+    편향된 동전의 상관값 항 1 / P(접두사)는 k가 길면 float 범위를 넘으므로
+    로그로 계산한 뒤 가장 큰 항으로 나누어 비율만 유지한다.
+    """
+    if p_heads == 0.5:
+        seq2_odds, seq1_odds = win_odds(seq1, seq2)
+        return Fraction(seq2_odds, seq2_odds + seq1_odds)
+    if seq1 == seq2:
+        return 0.5
+
+    costs = {seq: _log_prefix_costs(seq, p_heads) for seq in (seq1, seq2)}
+    terms = {}
+    for seq_a, seq_b in ((seq1, seq1), (seq1, seq2), (seq2, seq2), (seq2, seq1)):
+        terms[seq_a, seq_b] = [costs[seq_b][m] for m in _overlaps(seq_a, seq_b)]
+    shift = max(max(values) for values in terms.values() if values)
+
+    def correlation(seq_a, seq_b):
+        return sum(math.exp(cost - shift) for cost in terms[seq_a, seq_b])
+
+    seq2_odds = correlation(seq1, seq1) - correlation(seq1, seq2)
+    seq1_odds = correlation(seq2, seq2) - correlation(seq2, seq1)
+    # 긴 연속 패턴에서는 두 상관값이 거의 같아 뺄셈에서 자릿수가 사라지므로 정확한 유리수로 다시 계산
+    if (seq2_odds <= CANCELLATION * correlation(seq1, seq1)
+            or seq1_odds <= CANCELLATION * correlation(seq2, seq2)):
+        return float(_exact_win_probability(seq1, seq2, Fraction(p_heads)))
+    return min(max(seq2_odds / (seq2_odds + seq1_odds), 0.0), 1.0)
+
+
+def _exact_win_probability(seq1, seq2, p_heads):
+    """편향된 동전(Fraction)에서 seq2가 seq1을 이길 정확한 확률 (O(k) 항의 유리수 합)"""
+    def correlation(seq_a, seq_b):
+        total = Fraction(0)
+        for m in _overlaps(seq_a, seq_b):
+            heads = seq_b[:m].count('H')
+            total += 1 / (p_heads ** heads * (1 - p_heads) ** (m - heads))
+        return total
+
+    seq2_odds = correlation(seq1, seq1) - correlation(seq1, seq2)
+    seq1_odds = correlation(seq2, seq2) - correlation(seq2, seq1)
+    return seq2_odds / (seq2_odds + seq1_odds)
+
+
+def _flip_neighbours(sequence):
+    return [sequence[:i] + FLIP[coin] + sequence[i + 1:] for i, coin in enumerate(sequence)]
+
+
+def candidate_responses(sequence, p_heads=0.5):
+    """구조적 후보 응답 목록 (중복 제거)"""
+    k = len(sequence)
+    primary = [coin + sequence[:-1] for coin in COINS]
+    candidates = primary + [neighbour for seq in primary for neighbour in _flip_neighbours(seq)]
+    if p_heads != 0.5:
+        for coin in COINS:
+            candidates += [coin * j + sequence[:k - j] for j in range(2, k + 1)]
+            candidates += _flip_neighbours(coin * k)
+
+    return list(dict.fromkeys(candidates))
+
+
+def best_response(sequence, p_heads=0.5):
+    """(최적 응답, 승률). 공정한 동전에서 승률은 정확한 Fraction
+
+    같은 승률의 후보가 여럿이면 ResponseTable과 같이 코드(H=0, T=1)가 가장 작은 것을 고름
+    """
+    if not sequence or any(coin not in COINS for coin in sequence):
+        raise ValueError(f"Invalid sequence: {sequence}")
+
+    best, best_probability = None, None
+    for candidate in candidate_responses(sequence, p_heads):
+        probability = win_probability(sequence, candidate, p_heads)
+        if (best is None or probability > best_probability
+                or (probability == best_probability and candidate < best)):
+            best, best_probability = candidate, probability
+    return best, best_probability
+
+
+def verify_against_brute_force(max_k=10, p_heads=0.5, min_k=1):
+    """k = min_k..max_k의 모든 패턴에서 구조적 탐색이 전수 탐색과 같은 승률을 내는지 확인
+
+    반환: {k: (승률이 낮은 패턴 수, 응답이 다른 패턴 수(동률 포함))}
+    """
+    import numpy as np
+
+    from pattern_automaton import all_patterns
+    from response_table import ResponseTable
+
+    results = {}
+    for k in range(min_k, max_k + 1):
+        table = ResponseTable(k, p_heads)
+        worse = different = 0
+        for sequence in all_patterns(k):
+            response, probability = best_response(sequence, p_heads)
+            expected = table.win_probability(sequence)
+            if p_heads == 0.5:
+                worse += probability < expected
+            else:
+                worse += not np.isclose(probability, expected, rtol=1e-9) and probability < expected
+            different += response != table.respond(sequence)
+        results[k] = (worse, different)
+    return results
+
+
+def main():
+    if len(sys.argv) > 1:
+        for sequence in sys.argv[1:]:
+            response, probability = best_response(sequence.upper())
+            print(f"{sequence.upper()} -> {response}  {float(probability):.6f}")
+        return
+
+    print("구조적 탐색 vs 전수 탐색 (승률이 낮은 패턴 수 / 응답이 다른 패턴 수)")
+    for p_heads in (0.5, 0.4, 0.3):
+        results = verify_against_brute_force(10, p_heads)
+        summary = ", ".join(f"k={k}: {worse}/{different}" for k, (worse, different) in results.items())
+        print(f"p_heads={p_heads}: {summary}")
+
+    print("\n긴 패턴 예시:")
+    for sequence in ('HTHHTTHTHHTHTTTHTHHT', 'HHHHHHHHHHHHHHHHHHHHHHHHHHHHHH'):
+        response, probability = best_response(sequence)
+        print(f"{sequence} -> {response}  {float(probability):.6f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,52 +5,91 @@
 검증을 통해 확인된 수학적으로 증명된 최적 전략
 """
 
-import random
+import os
 import numpy as np
 from collections import defaultdict
 
+from batch_simulator import simulate_single_game
+from best_response import best_response
+from parallel_runner import parallel_count_wins
+from pattern_automaton import COINS, all_patterns, decode_sequence, encode_sequence
+from probability_cache import default_cache
+from response_table import get_response_table
+
 
 class ConwaysOptimalStrategy:
     """콘웨이의 최적 전략 구현"""
     
-    def __init__(self):
-        self.sequences = ['HHH', 'HHT', 'HTH', 'HTT', 'THH', 'THT', 'TTH', 'TTT']
+    # 이보다 긴 배열은 4^k 전수 테이블 대신 구조적 탐색(best_response)으로 필요할 때만 계산
+    TABLE_MAX_K = 12
+    
+    def __init__(self, k=3, p_heads=0.5):
+        self.k = k
+        self.p_heads = p_heads
         
-        # 검증된 올바른 전략 (콘웨이 규칙)
-        self.optimal_strategy = self._generate_conway_strategy()
+        if k > self.TABLE_MAX_K:
+            self.sequences = None
+            self.response_table = None
+            self.optimal_strategy = {}
+            self.verified_win_rates = {}
+            return
         
-        # 검증된 승률 데이터
-        self.verified_win_rates = {
-            'HHH': 87.51,  # THH vs HHH
-            'HHT': 74.94,  # THH vs HHT  
-            'HTH': 66.62,  # HHT vs HTH
-            'HTT': 66.75,  # HHT vs HTT
-            'THH': 66.64,  # TTH vs THH
-            'THT': 66.71,  # TTH vs THT
-            'TTH': 74.97,  # HTT vs TTH
-            'TTT': 87.43   # HTT vs TTT
-        }
-    
-    def _generate_conway_strategy(self):
-        """콘웨이 규칙에 따른 전략 생성"""
-        strategy = {}
+        self.sequences = all_patterns(k)
         
-        for seq in self.sequences:
-            A, B, C = seq[0], seq[1], seq[2]
-            flip_B = 'T' if B == 'H' else 'H'
-            strategy[seq] = flip_B + A + B
+        # 컴파일된 최적 응답 테이블 ((k, p_heads)별로 한 번만 계산되어 모든 인스턴스가 공유)
+        self.response_table = get_response_table(k, p_heads)
         
-        return strategy
+        # 검증된 올바른 전략 (공정한 동전, k=3에서는 콘웨이 규칙과 동일)
+        self.optimal_strategy = self.response_table.strategy
+        
+        # 검증된 승률 데이터 (정확한 확률에서 계산, 단위: %)
+        self.verified_win_rates = dict(zip(self.sequences, (self.response_table.win_probabilities * 100).tolist()))
+    
+    def _search(self, opponent_sequence):
+        """긴 배열의 최적 응답을 구조적 탐색으로 계산하여 기억"""
+        if len(opponent_sequence) != self.k or any(coin not in COINS for coin in opponent_sequence):
+            raise ValueError(f"Invalid sequence: {opponent_sequence}")
+        response, probability = best_response(opponent_sequence, self.p_heads)
+        self.optimal_strategy[opponent_sequence] = response
+        self.verified_win_rates[opponent_sequence] = float(probability) * 100
+        return response, probability
     
     def get_optimal_response(self, opponent_sequence):
         """상대 배열에 대한 최적 응답"""
         if opponent_sequence not in self.optimal_strategy:
-            raise ValueError(f"Invalid sequence: {opponent_sequence}")
+            if self.response_table is not None:
+                raise ValueError(f"Invalid sequence: {opponent_sequence}")
+            self._search(opponent_sequence)
         
         return self.optimal_strategy[opponent_sequence]
     
+    def get_optimal_responses(self, opponent_codes):
+        """상대 코드 배열에 대한 (최적 응답 코드, 승률) 배열을 한 번에 조회"""
+        if self.response_table is not None:
+            return self.response_table.lookup(opponent_codes)
+        
+        codes = np.asarray(opponent_codes)
+        responses = np.empty(codes.shape, dtype=np.int64)
+        probabilities = np.empty(codes.shape)
+        for i, code in enumerate(codes.flat):
+            sequence = decode_sequence(int(code), self.k)
+            responses.flat[i] = encode_sequence(self.get_optimal_response(sequence))
+            probabilities.flat[i] = self.verified_win_rates[sequence] / 100
+        return responses, probabilities
+    
+    def get_exact_win_probability(self, opponent_sequence):
+        """최적 응답의 승률 (공정한 동전은 정확한 Fraction, 그 외 float)"""
+        if self.response_table is not None:
+            return self.response_table.win_probability(opponent_sequence)
+        return self._search(opponent_sequence)[1]
+    
     def get_expected_win_rate(self, opponent_sequence):
         """예상 승률 반환"""
+        if self.response_table is None and opponent_sequence not in self.verified_win_rates:
+            try:
+                self._search(opponent_sequence)
+            except ValueError:
+                return 0.0
         return self.verified_win_rates.get(opponent_sequence, 0.0)
     
     def explain_rule(self, opponent_sequence):
@@ -64,25 +103,16 @@ class ConwaysOptimalStrategy:
 class StrategyValidator:
     """전략 검증 클래스"""
     
-    def __init__(self):
-        self.strategy = ConwaysOptimalStrategy()
+    def __init__(self, seed=None, max_workers=1, cache=None, p_heads=0.5):
+        self.strategy = ConwaysOptimalStrategy(p_heads=p_heads)
+        self.p_heads = p_heads
+        self.rng = np.random.default_rng(seed)
+        self.max_workers = max_workers
+        self.cache = cache
     
     def simulate_game(self, seq1, seq2, max_length=50000):
-        """정확한 게임 시뮬레이션"""
-        if seq1 == seq2:
-            return random.choice([1, 2])
-        
-        coin_sequence = ""
-        for _ in range(max_length):
-            coin_sequence += random.choice(['H', 'T'])
-            if len(coin_sequence) >= 3:
-                recent = coin_sequence[-3:]
-                if recent == seq1:
-                    return 1
-                elif recent == seq2:
-                    return 2
-        
-        return random.choice([1, 2])
+        """정확한 게임 시뮬레이션 (패턴 오토마톤 기반)"""
+        return simulate_single_game(seq1, seq2, max_length=max_length, p_heads=self.p_heads)
     
     def validate_strategy(self, num_games=100000):
         """전략 검증"""
@@ -99,23 +129,32 @@ class StrategyValidator:
             response = self.strategy.get_optimal_response(opponent)
             expected_rate = self.strategy.get_expected_win_rate(opponent)
             
-            wins = 0
-            for _ in range(num_games):
-                result = self.simulate_game(opponent, response)
-                if result == 2:  # response 승리
-                    wins += 1
+            # response 승리 횟수 (샤드별 난수 스트림으로 병렬 시뮬레이션)
+            def sample(n):
+                return parallel_count_wins(opponent, response, n,
+                                           seed=int(self.rng.integers(2**63)),
+                                           max_workers=self.max_workers,
+                                           p_heads=self.p_heads)
+            
+            # 캐시가 있으면 기존 표본을 재사용하고 부족한 만큼만 시뮬레이션
+            if self.cache is not None:
+                wins, games = self.cache.monte_carlo(opponent, response, num_games, sample,
+                                                     coin_bias=self.p_heads)
+            else:
+                wins, games = sample(num_games), num_games
             
-            actual_rate = (wins / num_games) * 100
+            actual_rate = (wins / games) * 100
             difference = actual_rate - expected_rate
             
             total_wins += wins
-            total_games += num_games
+            total_games += games
             
             print(f"   {opponent}   |   {response}   | {actual_rate:5.1f}% | {expected_rate:5.1f}% | {difference:+4.1f}%")
         
         overall_rate = (total_wins / total_games) * 100
         print("-" * 50)
-        print(f"전체 평균 |        | {overall_rate:5.1f}% | 73.9% |")
+        expected_overall = sum(self.strategy.verified_win_rates.values()) / len(self.strategy.verified_win_rates)
+        print(f"전체 평균 |        | {overall_rate:5.1f}% | {expected_overall:5.1f}% |")
         
         return overall_rate
 
@@ -209,7 +248,7 @@ def main():
     print("\n" + "🔬" * 20)
     print("검증 테스트를 실행하시겠습니까? (y/n)")
     if input().strip().lower() == 'y':
-        validator = StrategyValidator()
+        validator = StrategyValidator(max_workers=os.cpu_count(), cache=default_cache())
         validator.validate_strategy()
     
     print("\n" + "🎮" * 20)
@@ -1,49 +1,69 @@
+import os
 import numpy as np
-import random
 from collections import defaultdict
-import scipy.stats as stats
+
+from batch_simulator import count_wins, simulate_single_game
+from parallel_runner import parallel_count_wins, parallel_pair_wins
+from pattern_automaton import all_patterns, encode_sequence
+from probability_cache import default_cache
+from sequential_testing import sequential_estimate
 
 class RigorousVerification:
     """더욱 엄밀한 검증"""
     
-    def __init__(self):
-        self.sequences = ['HHH', 'HHT', 'HTH', 'HTT', 'THH', 'THT', 'TTH', 'TTT']
+    def __init__(self, seed=None, k=3, max_workers=1, cache=None):
+        self.sequences = all_patterns(k)
+        self.rng = np.random.default_rng(seed)
+        self.max_workers = max_workers
+        self.cache = cache
         
     def precise_game_simulation(self, seq1, seq2, max_length=50000):
-        """더 정밀한 게임 시뮬레이션"""
-        if seq1 == seq2:
-            return random.choice([1, 2])
-        
-        # 마르코프 체인 방식으로 정확한 시뮬레이션
-        coin_sequence = ""
-        
-        for _ in range(max_length):
-            coin_sequence += random.choice(['H', 'T'])
-            
-            if len(coin_sequence) >= 3:
-                # 가장 최근 3개 확인
-                recent = coin_sequence[-3:]
-                
-                if recent == seq1:
-                    return 1
-                elif recent == seq2:
-                    return 2
-        
-        # 매우 드문 경우
-        return random.choice([1, 2])
+        """더 정밀한 게임 시뮬레이션 (패턴 오토마톤 기반)"""
+        return simulate_single_game(seq1, seq2, max_length=max_length)
     
     def calculate_confidence_interval(self, seq1, seq2, num_sims=1000000, confidence=0.95):
         """신뢰구간을 포함한 정확한 확률 계산"""
-        wins = 0
+        # seq2 승리 횟수 (샤드별 난수 스트림으로 병렬 시뮬레이션)
+        def sample(n):
+            return parallel_count_wins(seq1, seq2, n,
+                                       seed=int(self.rng.integers(2**63)),
+                                       max_workers=self.max_workers)
+        
+        # 캐시가 있으면 기존 표본을 재사용하고 부족한 만큼만 시뮬레이션
+        if self.cache is not None:
+            wins, num_sims = self.cache.monte_carlo(seq1, seq2, num_sims, sample)
+        else:
+            wins = sample(num_sims)
+        
+        return self._normal_interval(wins, num_sims, confidence)
+    
+    def pair_confidence_intervals(self, pairs, num_sims=1000000, confidence=0.95):
+        """여러 (seq1, seq2) 쌍의 신뢰구간을 공유 코인 스트림으로 한 번에 계산
         
-        for _ in range(num_sims):
-            result = self.precise_game_simulation(seq1, seq2)
-            if result == 2:  # seq2 승리
-                wins += 1
+        스트림마다 모든 패턴의 첫 등장 시각을 구해 모든 쌍의 결과를 얻으므로
+        쌍마다 따로 시뮬레이션할 때보다 던지는 동전 수가 훨씬 적다.
+        반환: [(승률, 하한, 상한), ...] (pairs 순서)
+        """
+        def sample_pairs(unique_pairs, missing):
+            first = [encode_sequence(seq1) for seq1, _ in unique_pairs]
+            second = [encode_sequence(seq2) for _, seq2 in unique_pairs]
+            return parallel_pair_wins(first, second, missing, len(unique_pairs[0][0]),
+                                      seed=int(self.rng.integers(2**63)),
+                                      max_workers=self.max_workers)
         
+        if self.cache is not None:
+            counts = self.cache.monte_carlo_pairs(pairs, num_sims, sample_pairs)
+        else:
+            counts = [(int(wins), num_sims) for wins in sample_pairs(pairs, [num_sims] * len(pairs))]
+        
+        return [self._normal_interval(wins, games, confidence) for wins, games in counts]
+    
+    def _normal_interval(self, wins, num_sims, confidence):
+        """정규 근사 신뢰구간 (승률, 하한, 상한)"""
         win_rate = wins / num_sims
         
-        # 신뢰구간 계산
+        # 신뢰구간 계산 (scipy는 필요할 때만 불러옴)
+        from scipy import stats
         z_score = stats.norm.ppf((1 + confidence) / 2)
         margin_of_error = z_score * np.sqrt(win_rate * (1 - win_rate) / num_sims)
         
@@ -51,6 +71,16 @@ class RigorousVerification:
         ci_upper = win_rate + margin_of_error
         
         return win_rate, ci_lower, ci_upper
+    
+    def adaptive_confidence_interval(self, seq1, seq2, threshold=0.5, confidence=0.95,
+                                     method='wilson', max_sims=1000000):
+        """결론이 나는 즉시 중단하는 순차적 확률 계산 (사용한 게임 수 포함)"""
+        result = sequential_estimate(
+            lambda n: count_wins(seq1, seq2, n, self.rng),
+            threshold=threshold, confidence=confidence, method=method, max_games=max_sims
+        )
+        
+        return result['win_rate'], result['ci_lower'], result['ci_upper'], result['games']
 
 def analyze_original_rl_issues():
     """원래 RL 구현의 문제점 분석"""
@@ -87,7 +117,8 @@ def definitive_probability_analysis():
     print(f"\n🎯 결정적 확률 분석 (각 케이스당 500만 시뮬레이션)")
     print("=" * 80)
     
-    verifier = RigorousVerification()
+    cache = default_cache()
+    verifier = RigorousVerification(max_workers=os.cpu_count(), cache=cache)
     
     # 모든 가능한 케이스에 대해 정밀 분석
     all_cases = [
@@ -104,19 +135,22 @@ def definitive_probability_analysis():
         ('TTT', 'HTT', 'Both_same')
     ]
     
-    print("대결 구조 | 플레이어2 승률 | 95% 신뢰구간 | 전략")
+    print("대결 구조 | 플레이어2 승률 | 95% 신뢰구간 | 정확한 확률 | 전략")
     print("-" * 80)
     
     results = {}
     
-    for seq1, seq2, strategy in all_cases:
-        win_rate, ci_lower, ci_upper = verifier.calculate_confidence_interval(
-            seq1, seq2, num_sims=500000
-        )
+    # 모든 케이스를 같은 코인 스트림들에서 한 번에 시뮬레이션
+    intervals = verifier.pair_confidence_intervals(
+        [(seq1, seq2) for seq1, seq2, _ in all_cases], num_sims=500000
+    )
+    
+    for (seq1, seq2, strategy), (win_rate, ci_lower, ci_upper) in zip(all_cases, intervals):
+        exact = cache.exact_probability(seq1, seq2)
         
         results[(seq1, seq2)] = win_rate
         
-        print(f"{seq1} vs {seq2} | {win_rate:.4f} | [{ci_lower:.4f}, {ci_upper:.4f}] | {strategy}")
+        print(f"{seq1} vs {seq2} | {win_rate:.4f} | [{ci_lower:.4f}, {ci_upper:.4f}] | {float(exact):.4f} ({exact}) | {strategy}")
     
     return results
 
@@ -172,7 +206,7 @@ def corrected_strategy():
     print()
     
     correct_strategy = {}
-    sequences = ['HHH', 'HHT', 'HTH', 'HTT', 'THH', 'THT', 'TTH', 'TTT']
+    sequences = all_patterns(3)
     
     print("완전한 결정 테이블:")
     print("-" * 30)
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+페니의 게임 정확한 승률 계산
+콘웨이의 리딩 넘버(상관 관계) 공식과 흡수 마르코프 체인으로 유리수 확률을 계산
+"""
+
+from fractions import Fraction
+from functools import lru_cache
+
+import numpy as np
+
+from pattern_automaton import all_patterns, get_automaton
+
+SEQUENCES = all_patterns(3)
+
+
+def _coin_probability(p_heads):
+    """앞면 확률 정규화: 0.5는 정확한 Fraction(1, 2)로, Fraction은 그대로 사용"""
+    if p_heads == Fraction(1, 2):
+        return Fraction(1, 2)
+    if not 0 < p_heads < 1:
+        raise ValueError(f"Invalid coin bias: {p_heads}")
+    return p_heads
+
+
+def leading_number(seq_a, seq_b):
+    """콘웨이 리딩 넘버: seq_a의 접미사와 seq_b의 접두사가 길이 m만큼 겹치면 2^(m-1)을 더함"""
+    value = 0
+    for overlap in range(1, min(len(seq_a), len(seq_b)) + 1):
+        if seq_a[len(seq_a) - overlap:] == seq_b[:overlap]:
+            value += 1 << (overlap - 1)
+    return value
+
+
+def correlation(seq_a, seq_b, p_heads):
+    """편향된 동전의 상관값: 길이 m만큼 겹칠 때마다 1 / P(seq_b의 앞 m개)를 더함
+
+    공정한 동전에서는 리딩 넘버의 2배와 같다.
+    """
+    value = 0
+    prefix_probability = 1
+    for overlap in range(1, min(len(seq_a), len(seq_b)) + 1):
+        prefix_probability *= p_heads if seq_b[overlap - 1] == 'H' else 1 - p_heads
+        if seq_a[len(seq_a) - overlap:] == seq_b[:overlap]:
+            value += 1 / prefix_probability
+    return value
+
+
+def conway_win_probability(seq1, seq2, p_heads=Fraction(1, 2)):
+    """콘웨이 공식으로 seq2가 seq1을 이길 확률 계산
+
+    공정한 동전이나 Fraction 편향에서는 정확한 Fraction, float 편향에서는 float 반환
+    """
+    if seq1 == seq2:
+        return Fraction(1, 2)
+
+    p_heads = _coin_probability(p_heads)
+
+    # seq2 : seq1 승리 비율 = (AA - AB) : (BB - BA), A=seq1, B=seq2
+    if p_heads == Fraction(1, 2):
+        seq2_odds = leading_number(seq1, seq1) - leading_number(seq1, seq2)
+        seq1_odds = leading_number(seq2, seq2) - leading_number(seq2, seq1)
+        return Fraction(seq2_odds, seq2_odds + seq1_odds)
+
+    seq2_odds = correlation(seq1, seq1, p_heads) - correlation(seq1, seq2, p_heads)
+    seq1_odds = correlation(seq2, seq2, p_heads) - correlation(seq2, seq1, p_heads)
+    return seq2_odds / (seq2_odds + seq1_odds)
+
+
+def markov_win_probability(seq1, seq2, p_heads=Fraction(1, 2)):
+    """흡수 마르코프 체인을 풀어 seq2가 seq1을 이길 확률 계산 (검산용)"""
+    if seq1 == seq2:
+        return Fraction(1, 2)
+
+    p_heads = _coin_probability(p_heads)
+    coin_probabilities = (p_heads, 1 - p_heads)
+
+    # 상태: 두 패턴의 오토마톤에서 아직 흡수되지 않은 상태
+    automaton = get_automaton((seq1, seq2))
+    transient = [s for s in range(automaton.n_states) if automaton.accept_list[s] == -1]
+    index = {state: i for i, state in enumerate(transient)}
+    n = len(transient)
+
+    # x_s = p * x_next(H) + (1 - p) * x_next(T) 형태의 연립방정식 (x_s = seq2 승리 확률)
+    matrix = [[Fraction(0)] * (n + 1) for _ in range(n)]
+    for state, row in index.items():
+        matrix[row][row] += 1
+        for next_state, probability in zip(automaton.transition_list[state], coin_probabilities):
+            matched = automaton.accept_list[next_state]
+            if matched == 1:
+                matrix[row][n] += probability
+            elif matched == -1:
+                matrix[row][index[next_state]] -= probability
+
+    # 가우스 소거법 (Fraction 편향이면 유리수 연산이므로 오차 없음)
+    for col in range(n):
+        pivot = max(range(col, n), key=lambda r: abs(matrix[r][col]))
+        matrix[col], matrix[pivot] = matrix[pivot], matrix[col]
+        pivot_value = matrix[col][col]
+        matrix[col] = [value / pivot_value for value in matrix[col]]
+        for r in range(n):
+            if r != col and matrix[r][col] != 0:
+                factor = matrix[r][col]
+                matrix[r] = [a - factor * b for a, b in zip(matrix[r], matrix[col])]
+
+    return matrix[index[0]][n]
+
+
+@lru_cache(maxsize=None)
+def _cached_matrix(sequences, method, p_heads):
+    solver = conway_win_probability if method == 'conway' else markov_win_probability
+    return tuple(tuple(solver(seq1, seq2, p_heads) for seq2 in sequences) for seq1 in sequences)
+
+
+def win_probability_matrix(sequences=SEQUENCES, method='conway', p_heads=Fraction(1, 2)):
+    """전체 대결 행렬. matrix[i][j] = sequences[j]가 sequences[i]를 이길 확률"""
+    if method not in ('conway', 'markov'):
+        raise ValueError(f"Unknown method: {method}")
+    return [list(row) for row in _cached_matrix(tuple(sequences), method, _coin_probability(p_heads))]
+
+
+def verify_matrix(sequences=SEQUENCES, p_heads=Fraction(1, 2)):
+    """콘웨이 공식과 마르코프 체인 결과가 일치하는지 확인 (float 편향은 오차 허용)"""
+    conway = win_probability_matrix(sequences, 'conway', p_heads)
+    markov = win_probability_matrix(sequences, 'markov', p_heads)
+    return all(abs(a - b) <= 1e-9 for row_a, row_b in zip(conway, markov)
+               for a, b in zip(row_a, row_b))
+
+
+def leading_number_array(codes_a, codes_b, k):
+    """정수 코드 배열에 대한 벡터화된 리딩 넘버 (브로드캐스팅 지원, k <= 62)"""
+    codes_a = np.asarray(codes_a, dtype=np.int64)
+    codes_b = np.asarray(codes_b, dtype=np.int64)
+    value = np.zeros(np.broadcast(codes_a, codes_b).shape, dtype=np.int64)
+
+    for overlap in range(1, k + 1):
+        suffix = codes_a & ((1 << overlap) - 1)
+        prefix = codes_b >> (k - overlap)
+        value += (suffix == prefix).astype(np.int64) << (overlap - 1)
+
+    return value
+
+
+def win_odds_array(codes1, codes2, k):
+    """codes2가 codes1을 이길 확률을 정수 비율 (seq2_odds, seq1_odds)로 계산 (공정한 동전, 정확한 유리수)"""
+    codes1 = np.asarray(codes1, dtype=np.int64)
+    codes2 = np.asarray(codes2, dtype=np.int64)
+
+    seq2_odds = leading_number_array(codes1, codes1, k) - leading_number_array(codes1, codes2, k)
+    seq1_odds = leading_number_array(codes2, codes2, k) - leading_number_array(codes2, codes1, k)
+
+    # 같은 패턴끼리는 1 : 1
+    same = np.broadcast_to(codes1 == codes2, seq2_odds.shape)
+    seq2_odds = np.where(same, 1, seq2_odds)
+    seq1_odds = np.where(same, 1, seq1_odds)
+    return seq2_odds, seq1_odds
+
+
+def correlation_array(codes_a, codes_b, k, p_heads):
+    """정수 코드 배열에 대한 벡터화된 편향 동전 상관값 (codes_a, codes_b, p_heads 브로드캐스팅)"""
+    codes_a = np.asarray(codes_a, dtype=np.int64)
+    codes_b = np.asarray(codes_b, dtype=np.int64)
+    p_heads = np.asarray(p_heads, dtype=np.float64)
+    value = np.zeros(np.broadcast(codes_a, codes_b, p_heads).shape)
+
+    for overlap in range(1, k + 1):
+        prefix = codes_b >> (k - overlap)
+        tails = np.zeros(prefix.shape, dtype=np.int64)
+        for bit in range(overlap):
+            tails += (prefix >> bit) & 1
+        prefix_probability = p_heads ** (overlap - tails) * (1 - p_heads) ** tails
+        matches = (codes_a & ((1 << overlap) - 1)) == prefix
+        value += np.where(matches, 1 / prefix_probability, 0.0)
+
+    return value
+
+
+def win_probability_array(codes1, codes2, k, p_heads=0.5):
+    """codes2가 codes1을 이길 확률 (float, 코드와 p_heads 브로드캐스팅 지원)"""
+    if np.ndim(p_heads) == 0 and p_heads == 0.5:
+        seq2_odds, seq1_odds = win_odds_array(codes1, codes2, k)
+        return seq2_odds / (seq2_odds + seq1_odds)
+
+    codes1 = np.asarray(codes1, dtype=np.int64)
+    codes2 = np.asarray(codes2, dtype=np.int64)
+    seq2_odds = correlation_array(codes1, codes1, k, p_heads) - correlation_array(codes1, codes2, k, p_heads)
+    seq1_odds = correlation_array(codes2, codes2, k, p_heads) - correlation_array(codes2, codes1, k, p_heads)
+
+    same = np.broadcast_to(codes1 == codes2, seq2_odds.shape)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        probability = seq2_odds / (seq2_odds + seq1_odds)
+    return np.where(same, 0.5, probability)
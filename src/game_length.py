@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+게임 길이 분포 엔진
+패턴 오토마톤의 전이 행렬(흡수되지 않은 상태 사이의 부분 확률 행렬 Q)로부터
+게임 길이(동전 던진 횟수)의 정확한 PMF, 평균, 분산, 꼬리 한계를 계산하고
+역누적분포 방식의 벡터화 표본 추출기를 제공
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+from pattern_automaton import get_automaton
+
+# cutoff 계산 시 한 번에 건너뛰는 단계 수 (Q^BLOCK_STEPS 를 미리 계산)
+BLOCK_STEPS = 64
+
+
+class GameLengthDistribution:
+    """seq1 대 seq2 게임의 길이 분포
+
+    Q[i, j] = 흡수되지 않은 상태 i에서 한 번 던져 상태 j로 갈 확률
+    absorb[w][i] = 상태 i에서 한 번 던져 seq(w+1)이 완성될 확률
+    """
+
+    def __init__(self, seq1, seq2, p_heads=0.5):
+        if not 0 < p_heads < 1:
+            raise ValueError(f"p_heads must be in (0, 1): {p_heads}")
+        self.seq1 = seq1
+        self.seq2 = seq2
+        self.p_heads = p_heads
+
+        # 같은 배열끼리는 패턴 하나의 대기 시간 (승자는 무작위)
+        patterns = (seq1,) if seq1 == seq2 else (seq1, seq2)
+        automaton = get_automaton(patterns)
+        transient = np.flatnonzero(automaton.accept == -1)
+        index = np.full(automaton.n_states, -1)
+        index[transient] = np.arange(transient.size)
+
+        n = transient.size
+        Q = np.zeros((n, n))
+        absorb = np.zeros((2, n))
+        for coin, probability in enumerate((p_heads, 1 - p_heads)):
+            targets = automaton.transitions[transient, coin]
+            matched = automaton.accept[targets]
+            moving = matched == -1
+            np.add.at(Q, (np.flatnonzero(moving), index[targets[moving]]), probability)
+            for winner in range(len(patterns)):
+                absorb[winner] += probability * (matched == winner)
+        if len(patterns) == 1:
+            absorb[:] = absorb[0] / 2
+
+        self.Q = Q
+        self.absorb = absorb
+        self.n_states = n
+
+        # 기본 행렬 N = (I - Q)^-1 로 기대 흡수 시간 벡터 t = N 1
+        fundamental = np.linalg.inv(np.eye(n) - Q)
+        self._times = fundamental.sum(axis=1)
+        self._second = (2 * fundamental - np.eye(n)) @ self._times
+        self._start = int(index[0])
+
+    @property
+    def mean(self):
+        """평균 게임 길이"""
+        return float(self._times[self._start])
+
+    @property
+    def variance(self):
+        """게임 길이의 분산"""
+        return float(self._second[self._start] - self._times[self._start] ** 2)
+
+    @property
+    def spectral_radius(self):
+        """Q의 스펙트럼 반지름: P(L > n)은 점근적으로 이 값의 n제곱에 비례하여 감소"""
+        return float(np.max(np.abs(np.linalg.eigvals(self.Q))))
+
+    def pmf(self, n, winner=None):
+        """P(L = t), t = 0..n. winner(1 또는 2)를 주면 P(L = t, 해당 배열 승리)"""
+        weights = self.absorb.sum(axis=0) if winner is None else self.absorb[winner - 1]
+        result = np.zeros(n + 1)
+        state = np.zeros(self.n_states)
+        state[self._start] = 1.0
+        for t in range(1, n + 1):
+            result[t] = state @ weights
+            state = state @ self.Q
+        return result
+
+    def cdf(self, n):
+        """P(L <= t), t = 0..n"""
+        return np.cumsum(self.pmf(n))
+
+    def survival(self, n):
+        """P(L > n) 정확한 값"""
+        state = np.zeros(self.n_states)
+        state[self._start] = 1.0
+        return float((state @ np.linalg.matrix_power(self.Q, n)).sum())
+
+    def tail_bound(self, n):
+        """P(L > n)의 상한 (닫힌 형식)
+
+        Q t = t - 1 <= (1 - 1/max(t)) t 이고 t >= 1 이므로
+        P(L > n) = e0 Q^n 1 <= e0 Q^n t <= t[0] (1 - 1/max(t))^n
+        """
+        decay = 1 - 1 / self._times.max()
+        return min(1.0, float(self._times[self._start] * decay ** n))
+
+    def cutoff(self, probability):
+        """P(L > n) <= probability 를 만족하는 가장 작은 n (정확한 계산)"""
+        state = np.zeros(self.n_states)
+        state[self._start] = 1.0
+        if state.sum() <= probability:
+            return 0
+
+        # Q^BLOCK_STEPS 단위로 건너뛴 뒤 마지막 블록 안에서 한 단계씩 확인
+        block = np.linalg.matrix_power(self.Q, BLOCK_STEPS)
+        steps = 0
+        while True:
+            advanced = state @ block
+            if advanced.sum() <= probability:
+                break
+            state = advanced
+            steps += BLOCK_STEPS
+
+        while state.sum() > probability:
+            state = state @ self.Q
+            steps += 1
+        return steps
+
+    def sample(self, size, rng=None, return_winners=False, tail=2.0 ** -53):
+        """게임 길이 size개를 역누적분포로 한 번에 추출
+
+        P(L > n) <= tail 이 되는 n까지의 (길이, 승자) 결합 분포를 사용한다.
+        return_winners가 참이면 (길이 배열, 승자(1 또는 2) 배열)을 반환
+        """
+        rng = np.random.default_rng(rng)
+        n = self.cutoff(tail)
+        joint = np.stack([self.pmf(n, 1), self.pmf(n, 2)], axis=1).ravel()
+        cumulative = np.cumsum(joint)
+
+        uniforms = rng.random(size) * cumulative[-1]
+        outcomes = np.minimum(np.searchsorted(cumulative, uniforms, side='right'), joint.size - 1)
+        lengths = (outcomes >> 1).astype(np.uint32)
+        if return_winners:
+            return lengths, (outcomes & 1).astype(np.uint8) + 1
+        return lengths
+
+
+@lru_cache(maxsize=256)
+def get_length_distribution(seq1, seq2, p_heads=0.5):
+    """대결 쌍별 길이 분포를 한 번만 계산하여 재사용"""
+    return GameLengthDistribution(seq1, seq2, p_heads)
+
+
+def recommended_max_length(seq1, seq2, num_games, expected_overflows=1e-3, p_heads=0.5):
+    """num_games 게임 중 max_length를 넘는 게임 수의 기댓값이 expected_overflows 이하가 되는 max_length"""
+    return get_length_distribution(seq1, seq2, p_heads).cutoff(expected_overflows / num_games)
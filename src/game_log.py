@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+대용량 시뮬레이션용 게임 기록 형식 (열 기반, 청크 단위, 메모리 맵)
+디렉터리 하나에 열마다 고정 폭 이진 파일과 청크 경계를 담은 meta.json을 저장
+
+    pair_id.u16     대결 쌍 번호 (seq1 코드 << k | seq2 코드)
+    winner.u8       승자 (1 또는 2)
+    length.u16      게임 길이 (동전 던진 횟수, 65535에서 포화)
+    seed_chunk.u32  게임을 생성한 난수 청크 번호 (SeedSequence(seed, spawn_key=(seed_chunk,)))
+
+기록기는 NumPy 배열을 그대로 파일 끝에 덧붙이고, 읽기기는 memmap 위에서 블록 단위로
+승률과 길이 히스토그램을 집계하여 전체 파일을 메모리에 올리지 않음
+"""
+
+import json
+import os
+
+import numpy as np
+
+from batch_simulator import simulate_games, simulate_matchups
+from pattern_automaton import decode_sequence, encode_sequence
+
+FORMAT_VERSION = 1
+META_FILE = 'meta.json'
+COLUMNS = {
+    'pair_id': np.uint16,
+    'winner': np.uint8,
+    'length': np.uint16,
+    'seed_chunk': np.uint32,
+}
+MAX_LENGTH = np.iinfo(np.uint16).max
+
+# 집계 시 한 번에 읽는 행 수
+READ_BLOCK = 1 << 22
+
+
+def _column_path(directory, name):
+    return os.path.join(directory, f"{name}.{np.dtype(COLUMNS[name]).str[1:]}")
+
+
+def _read_meta(directory):
+    with open(os.path.join(directory, META_FILE)) as f:
+        return json.load(f)
+
+
+class GameLogWriter:
+    """게임 기록 디렉터리에 청크를 덧붙이는 기록기
+
+    이미 기록이 있으면 이어서 기록한다. meta.json은 청크마다 원자적으로 교체되므로
+    중간에 중단되어도 meta.json에 기록된 행까지는 항상 일관됨
+    """
+
+    def __init__(self, directory, k=3, seed=None):
+        if 2 * k > 16:
+            raise ValueError(f"pair_id (uint16) cannot encode patterns of length {k}")
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+
+        if os.path.exists(os.path.join(directory, META_FILE)):
+            self.meta = _read_meta(directory)
+            if self.meta['k'] != k:
+                raise ValueError(f"Log k={self.meta['k']} does not match k={k}")
+        else:
+            self.meta = {'version': FORMAT_VERSION, 'k': k, 'rows': 0, 'chunks': []}
+
+        self.k = k
+        stored_seed = self.meta.get('seed')
+        if seed is not None and stored_seed is not None and seed != stored_seed:
+            # 기존 청크는 저장된 시드로만 재현되므로 시드를 바꿔 이어 쓸 수 없음
+            raise ValueError(f"Log seed={stored_seed} does not match seed={seed}")
+        self.seed = stored_seed if seed is None else seed
+        if self.seed is None:
+            self.seed = int(np.random.SeedSequence().entropy)
+        self.meta['seed'] = self.seed
+
+        # meta.json 이후에 쓰다 만 행은 잘라냄
+        for name, dtype in COLUMNS.items():
+            with open(_column_path(directory, name), 'ab') as f:
+                f.truncate(self.meta['rows'] * np.dtype(dtype).itemsize)
+        self._write_meta()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self._write_meta()
+
+    @property
+    def next_seed_chunk(self):
+        chunks = self.meta['chunks']
+        return chunks[-1]['seed_chunk'] + 1 if chunks else 0
+
+    def pair_id(self, seq1, seq2):
+        for sequence in (seq1, seq2):
+            if len(sequence) != self.k:
+                raise ValueError(f"Sequence {sequence} does not have length k={self.k}")
+        return (encode_sequence(seq1) << self.k) | encode_sequence(seq2)
+
+    def _check_codes(self, codes):
+        """길이 k 패턴 코드 범위 [0, 2^k) 확인"""
+        if codes.size and (codes.min() < 0 or codes.max() >= 1 << self.k):
+            raise ValueError(f"Pattern codes must be in [0, {1 << self.k}) for k={self.k}")
+
+    def rng(self, seed_chunk):
+        """seed_chunk 번째 청크의 난수 생성기 (청크만 따로 재현 가능)"""
+        return np.random.default_rng(np.random.SeedSequence(self.seed, spawn_key=(seed_chunk,)))
+
+    def append(self, pair_ids, winners, lengths, seed_chunk):
+        """한 청크의 게임 기록 추가. pair_ids는 스칼라 또는 배열, lengths는 65535에서 포화"""
+        winners = np.asarray(winners, dtype=np.uint8)
+        rows = winners.size
+        pair_ids = np.asarray(pair_ids, dtype=np.int64)
+        if pair_ids.size and (pair_ids.min() < 0 or pair_ids.max() >= 1 << (2 * self.k)):
+            raise ValueError(f"Pair ids must be in [0, {1 << (2 * self.k)}) for k={self.k}")
+        columns = {
+            'pair_id': np.broadcast_to(pair_ids.astype(np.uint16), (rows,)),
+            'winner': winners,
+            'length': np.minimum(lengths, MAX_LENGTH).astype(np.uint16),
+            'seed_chunk': np.full(rows, seed_chunk, dtype=np.uint32),
+        }
+
+        for name, values in columns.items():
+            with open(_column_path(self.directory, name), 'ab') as f:
+                np.ascontiguousarray(values).tofile(f)
+
+        self.meta['chunks'].append({'offset': self.meta['rows'], 'rows': rows, 'seed_chunk': int(seed_chunk)})
+        self.meta['rows'] += rows
+        self._write_meta()
+
+    def record_games(self, seq1, seq2, num_games, chunk_size=1000000, p_heads=0.5):
+        """seq1 대 seq2 게임을 청크 단위로 시뮬레이션하며 기록"""
+        pair = self.pair_id(seq1, seq2)
+        remaining = num_games
+        while remaining > 0:
+            batch = min(chunk_size, remaining)
+            seed_chunk = self.next_seed_chunk
+            winners, lengths = simulate_games(seq1, seq2, batch, self.rng(seed_chunk),
+                                              p_heads=p_heads, return_lengths=True)
+            self.append(pair, winners, lengths, seed_chunk)
+            remaining -= batch
+
+    def record_matchups(self, first, second, p_heads=0.5):
+        """코드 배열 first[i] 대 second[i] 게임을 한 청크로 시뮬레이션하며 기록"""
+        first = np.asarray(first, dtype=np.int64)
+        second = np.asarray(second, dtype=np.int64)
+        self._check_codes(first)
+        self._check_codes(second)
+        seed_chunk = self.next_seed_chunk
+        winners, lengths = simulate_matchups(first, second, self.k, self.rng(seed_chunk),
+                                             p_heads=p_heads, return_lengths=True)
+        self.append((first << self.k) | second, winners, lengths, seed_chunk)
+
+    def _write_meta(self):
+        path = os.path.join(self.directory, META_FILE)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(self.meta, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+
+class GameLogReader:
+    """게임 기록 읽기기. 열은 memmap으로 열고 집계는 블록 단위로 수행"""
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.meta = _read_meta(directory)
+        self.k = self.meta['k']
+        self.rows = self.meta['rows']
+        self.chunks = self.meta['chunks']
+        self.columns = {
+            name: (np.memmap(_column_path(directory, name), dtype=dtype, mode='r', shape=(self.rows,))
+                   if self.rows else np.empty(0, dtype=dtype))
+            for name, dtype in COLUMNS.items()
+        }
+
+    def __len__(self):
+        return self.rows
+
+    def __getitem__(self, name):
+        return self.columns[name]
+
+    def pair_patterns(self, pair_id):
+        """pair_id -> (seq1, seq2)"""
+        mask = (1 << self.k) - 1
+        return decode_sequence(pair_id >> self.k, self.k), decode_sequence(pair_id & mask, self.k)
+
+    def chunk(self, index):
+        """index 번째 청크의 열 뷰 사전"""
+        chunk = self.chunks[index]
+        start, stop = chunk['offset'], chunk['offset'] + chunk['rows']
+        return {name: column[start:stop] for name, column in self.columns.items()}
+
+    def blocks(self, start=0, stop=None):
+        """[start, stop) 행을 READ_BLOCK 단위 열 뷰 사전으로 순회"""
+        stop = self.rows if stop is None else stop
+        for offset in range(start, stop, READ_BLOCK):
+            end = min(offset + READ_BLOCK, stop)
+            yield {name: column[offset:end] for name, column in self.columns.items()}
+
+    def win_counts(self, pair_id=None):
+        """대결 쌍별 (seq2 승리 수, 게임 수) 배열. pair_id를 주면 해당 쌍의 값만 반환"""
+        size = 1 << (2 * self.k)
+        wins = np.zeros(size, dtype=np.int64)
+        games = np.zeros(size, dtype=np.int64)
+        for block in self.blocks():
+            pairs = block['pair_id']
+            games += np.bincount(pairs, minlength=size)
+            wins += np.bincount(pairs, weights=block['winner'] == 2, minlength=size).astype(np.int64)
+
+        if pair_id is not None:
+            return int(wins[pair_id]), int(games[pair_id])
+        return wins, games
+
+    def win_rates(self):
+        """{(seq1, seq2): seq2 승률} (기록이 있는 쌍만)"""
+        wins, games = self.win_counts()
+        return {self.pair_patterns(int(pair)): wins[pair] / games[pair]
+                for pair in np.flatnonzero(games)}
+
+    def length_histogram(self, pair_id=None):
+        """게임 길이 히스토그램 (histogram[n] = 길이 n인 게임 수, 마지막 칸은 포화값)"""
+        histogram = np.zeros(MAX_LENGTH + 1, dtype=np.int64)
+        for block in self.blocks():
+            lengths = block['length']
+            if pair_id is not None:
+                lengths = lengths[block['pair_id'] == pair_id]
+            histogram += np.bincount(lengths, minlength=MAX_LENGTH + 1)
+
+        last = np.flatnonzero(histogram)
+        return histogram[:last[-1] + 1] if last.size else histogram[:0]
@@ -1,41 +1,118 @@
+import json
+import os
 import numpy as np
 import random
-from collections import defaultdict
-import matplotlib.pyplot as plt
+from collections import deque
+
+from bandit_agents import AGENTS, make_agent
+from batch_simulator import (SIMULATORS, count_pair_wins, simulate_matchups, simulate_single_game,
+                             stream_win_matrix)
+from exact_probability import win_probability_array
+from pattern_automaton import all_patterns, encode_sequence
 
 class PenneysGameEnvironment:
-    def __init__(self):
-        self.sequences = ['HHH', 'HHT', 'HTH', 'HTT', 'THH', 'THT', 'TTH', 'TTT']
+    # 'simulate' plays every game coin by coin; 'surrogate' draws each game's outcome
+    # as a Bernoulli sample from a win-probability matrix, so its cost does not
+    # depend on game length
+    MODES = ('simulate', 'surrogate')
+    
+    def __init__(self, k=3, mode='simulate', reward_matrix=None):
+        self.k = k
+        self.sequences = all_patterns(k)
         self.sequence_to_idx = {seq: i for i, seq in enumerate(self.sequences)}
         self.idx_to_sequence = {i: seq for i, seq in enumerate(self.sequences)}
+        self._win_matrix = None
+        self.mode = 'simulate'
+        self.reward_matrix = None
+        self.set_mode(mode, reward_matrix)
+        
+    def set_mode(self, mode, reward_matrix=None):
+        """Switch between full simulation and the surrogate Bernoulli environment.
+        
+        reward_matrix[i, j] is the probability that sequence j beats sequence i used by
+        the surrogate; it defaults to the exact win matrix and may instead be a Monte
+        Carlo estimate (see monte_carlo_win_matrix).
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown environment mode: {mode}")
+        if mode == 'surrogate':
+            if reward_matrix is None:
+                reward_matrix = self.win_matrix()
+            reward_matrix = np.asarray(reward_matrix, dtype=np.float64)
+            n = len(self.sequences)
+            if reward_matrix.shape != (n, n):
+                raise ValueError(f"Reward matrix must have shape ({n}, {n}), got {reward_matrix.shape}")
+            self.reward_matrix = reward_matrix
+        self.mode = mode
+    
+    def win_matrix(self):
+        """Exact win probabilities: matrix[i, j] = P(sequence j beats sequence i)"""
+        if self._win_matrix is None:
+            codes = np.arange(len(self.sequences))
+            self._win_matrix = win_probability_array(codes[:, None], codes[None, :], self.k)
+        return self._win_matrix
+    
+    def monte_carlo_win_matrix(self, num_games=100000, rng=None, cache=None):
+        """Estimated win matrix from num_games shared coin streams per pair.
+        
+        With a ProbabilityCache the stored samples are reused and extended, so repeated
+        hyperparameter studies do not pay for the same games twice.
+        """
+        n = len(self.sequences)
+        if cache is None:
+            return stream_win_matrix(num_games, self.k, rng) / num_games
+        
+        rng = np.random.default_rng(rng)
         
+        def sample_pairs(unique_pairs, missing):
+            first = [encode_sequence(seq1) for seq1, _ in unique_pairs]
+            second = [encode_sequence(seq2) for _, seq2 in unique_pairs]
+            return count_pair_wins(first, second, missing, self.k, rng)
+        
+        pairs = [(seq1, seq2) for seq1 in self.sequences for seq2 in self.sequences]
+        counts = cache.monte_carlo_pairs(pairs, num_games, sample_pairs)
+        return np.array([wins / games for wins, games in counts]).reshape(n, n)
+    
     def simulate_game(self, seq1, seq2):
         """Simulate a single game between two sequences. Returns 1 if seq1 wins, 2 if seq2 wins."""
-        if seq1 == seq2:
-            return random.choice([1, 2])
-        
-        coin_sequence = ""
-        while True:
-            coin_sequence += random.choice(['H', 'T'])
-            if len(coin_sequence) >= 3:
-                recent = coin_sequence[-3:]
-                if recent == seq1:
-                    return 1
-                elif recent == seq2:
-                    return 2
+        if self.mode == 'surrogate':
+            probability = self.reward_matrix[self.sequence_to_idx[seq1], self.sequence_to_idx[seq2]]
+            return 2 if random.random() < probability else 1
+        return simulate_single_game(seq1, seq2)
+    
+    def simulate_batch(self, seq1, seq2, num_games, rng=None, method='automaton'):
+        """Simulate num_games games at once. Returns an array of winners (1 or 2).
+        
+        method='wave' flips 64 coins per step with bit-parallel matching (best for long games).
+        """
+        if self.mode == 'surrogate':
+            probability = self.reward_matrix[self.sequence_to_idx[seq1], self.sequence_to_idx[seq2]]
+            rng = np.random.default_rng(rng)
+            return np.where(rng.random(num_games) < probability, 2, 1).astype(np.uint8)
+        return SIMULATORS[method](seq1, seq2, num_games, rng)
+    
+    def simulate_matchups(self, player1_idx, player2_idx, rng=None):
+        """Simulate one game per (player1_idx[i], player2_idx[i]) pair. Returns an array of winners (1 or 2)."""
+        if self.mode == 'surrogate':
+            rng = np.random.default_rng(rng)
+            probabilities = self.reward_matrix[player1_idx, player2_idx]
+            return np.where(rng.random(probabilities.shape) < probabilities, 2, 1).astype(np.uint8)
+        return simulate_matchups(player1_idx, player2_idx, self.k, rng)
 
 class QLearningAgent:
-    def __init__(self, learning_rate=0.1, discount_factor=0.95, epsilon=0.1):
-        self.q_table = defaultdict(lambda: np.zeros(8))  # 8 possible actions (sequences)
+    def __init__(self, learning_rate=0.1, discount_factor=0.95, epsilon=0.1, k=3):
+        self.sequences = all_patterns(k)
+        self.n_actions = len(self.sequences)  # 2^k possible actions (sequences)
+        # Dense Q-table: one row per opponent sequence (state), one column per response (action)
+        self.q_table = np.zeros((self.n_actions, self.n_actions))
         self.learning_rate = learning_rate
         self.discount_factor = discount_factor
         self.epsilon = epsilon
-        self.sequences = ['HHH', 'HHT', 'HTH', 'HTT', 'THH', 'THT', 'TTH', 'TTT']
         
     def choose_action(self, state):
         """Choose action using epsilon-greedy policy"""
         if random.random() < self.epsilon:
-            return random.randint(0, 7)  # Random action
+            return random.randint(0, self.n_actions - 1)  # Random action
         else:
             return np.argmax(self.q_table[state])  # Best action
     
@@ -46,12 +123,57 @@ class QLearningAgent:
     def get_best_action(self, state):
         """Get the best action for a given state (greedy)"""
         return np.argmax(self.q_table[state])
+    
+    def choose_actions(self, states, rng):
+        """Choose actions for a batch of states using epsilon-greedy policy"""
+        actions = np.argmax(self.q_table[states], axis=1)
+        explore = rng.random(states.size) < self.epsilon
+        actions[explore] = rng.integers(0, self.n_actions, size=int(np.count_nonzero(explore)))
+        return actions
+    
+    def update_q_table_batch(self, states, actions, rewards):
+        """Update Q-table from a batch of experiences, equivalent to applying them one by one in order"""
+        # Applying Q <- Q + lr * (r - Q) m times to one cell gives
+        # (1 - lr)^m * Q + sum_j lr * (1 - lr)^(m - 1 - j) * r_j, so each experience
+        # is weighted by its position among the experiences of the same (state, action)
+        cells = states * self.n_actions + actions
+        order = np.argsort(cells, kind='stable')
+        counts = np.bincount(cells, minlength=self.q_table.size)
+        starts = np.cumsum(counts) - counts
+        sorted_cells = cells[order]
+        later = counts[sorted_cells] - 1 - (np.arange(cells.size) - starts[sorted_cells])
+        
+        decay = 1 - self.learning_rate
+        self.q_table *= (decay ** counts).reshape(self.q_table.shape)
+        weights = self.learning_rate * decay ** later
+        np.add.at(self.q_table, (states[order], actions[order]), weights * rewards[order])
+    
+    def get_state(self):
+        """Arrays to store in a checkpoint"""
+        return {'q_table': self.q_table}
+    
+    def set_state(self, data):
+        self.q_table = data['q_table'].copy()
 
 class PenneysRLTrainer:
-    def __init__(self):
-        self.env = PenneysGameEnvironment()
-        self.agent = QLearningAgent()
-        self.win_rates = []
+    # Number of recent win-rate windows kept in memory
+    WIN_RATE_HISTORY = 1000
+    
+    def __init__(self, k=3, agent=None, env_mode='simulate', reward_matrix=None):
+        """agent may be None or 'q-learning' (epsilon-greedy Q-learning), a bandit
+        name from bandit_agents.AGENTS ('ucb1', 'kl-ucb', 'thompson'), or an agent instance.
+        env_mode='surrogate' trains on Bernoulli rewards drawn from reward_matrix
+        (exact win matrix by default) instead of simulated games."""
+        self.k = k
+        self.env = PenneysGameEnvironment(k, env_mode, reward_matrix)
+        if agent is None or agent == 'q-learning':
+            agent = QLearningAgent(k=k)
+        elif isinstance(agent, str):
+            if agent not in AGENTS:
+                raise ValueError(f"Unknown agent: {agent}")
+            agent = make_agent(agent, k, self.env.win_matrix())
+        self.agent = agent
+        self.win_rates = deque(maxlen=self.WIN_RATE_HISTORY)
         
     def train(self, episodes=1000000):
         """Train the agent for specified number of episodes"""
@@ -60,7 +182,7 @@ class PenneysRLTrainer:
         
         for episode in range(episodes):
             # Player 1 chooses random sequence
-            player1_seq_idx = random.randint(0, 7)
+            player1_seq_idx = random.randint(0, len(self.env.sequences) - 1)
             player1_seq = self.env.sequences[player1_seq_idx]
             
             # Agent (Player 2) chooses action based on Player 1's choice
@@ -91,37 +213,201 @@ class PenneysRLTrainer:
                 
         print("Training completed!")
     
-    def evaluate_policy(self, test_games=100000):
-        """Evaluate the learned policy"""
+    def train_batched(self, episodes=1000000, num_envs=4096, seed=None):
+        """Train the agent with num_envs parallel environments per iteration"""
+        rng = np.random.default_rng(seed)
+        num_states = len(self.env.sequences)
         wins = 0
-        results = {}
+        total_games = 0
+        next_report = 10000
+        episode = 0
         
-        for player1_seq_idx in range(8):
-            player1_seq = self.env.sequences[player1_seq_idx]
-            seq_wins = 0
+        while episode < episodes:
+            batch = min(num_envs, episodes - episode)
+            wins += self._train_step(batch, rng)
+            total_games += batch
+            episode += batch
             
-            for _ in range(test_games // 8):
-                action = self.agent.get_best_action(player1_seq_idx)
-                player2_seq = self.env.sequences[action]
+            # Track win rate roughly every 10000 episodes
+            if episode >= next_report and episode < episodes:
+                win_rate = wins / total_games
+                self.win_rates.append(win_rate)
+                print(f"Episode {episode}, Win Rate: {win_rate:.3f}")
                 
-                winner = self.env.simulate_game(player1_seq, player2_seq)
-                if winner == 2:
-                    seq_wins += 1
-                    wins += 1
+                wins = 0
+                total_games = 0
+                next_report = (episode // 10000 + 1) * 10000
+        
+        print("Training completed!")
+    
+    def _train_step(self, batch, rng):
+        """Play and learn from one batch of parallel episodes. Returns the number of agent wins."""
+        # Player 1 chooses random sequences, agent responds to each
+        states = rng.integers(0, len(self.env.sequences), size=batch)
+        actions = self.agent.choose_actions(states, rng)
+        
+        # Simulate all games in one vectorized call
+        winners = self.env.simulate_matchups(states, actions, rng)
+        rewards = np.where(winners == 2, 1.0, -1.0)
+        
+        self.agent.update_q_table_batch(states, actions, rewards)
+        return int(np.count_nonzero(winners == 2))
+    
+    def train_streaming(self, episodes, checkpoint_path, chunk_size=1000000,
+                        checkpoint_every=10, num_envs=4096, seed=None):
+        """Train in fixed-size chunks with periodic atomic checkpoints.
+        
+        If checkpoint_path already exists, training resumes from it and produces
+        exactly the same Q-table as an uninterrupted run with the same settings.
+        Only a bounded window of recent chunk win rates is kept in memory.
+        """
+        config = {'k': self.k, 'chunk_size': chunk_size, 'num_envs': num_envs,
+                  'agent': type(self.agent).__name__}
+        if self.env.mode != 'simulate':
+            config['env_mode'] = self.env.mode
+        
+        if os.path.exists(checkpoint_path):
+            rng, episode, total_wins = self.load_checkpoint(checkpoint_path, config)
+            print(f"Resuming from episode {episode}")
+        else:
+            rng = np.random.default_rng(seed)
+            episode = 0
+            total_wins = 0
+        
+        chunks_since_checkpoint = 0
+        
+        while episode < episodes:
+            chunk = min(chunk_size, episodes - episode)
+            chunk_wins = 0
+            done = 0
+            while done < chunk:
+                batch = min(num_envs, chunk - done)
+                chunk_wins += self._train_step(batch, rng)
+                done += batch
+            
+            episode += chunk
+            total_wins += chunk_wins
+            self.win_rates.append(chunk_wins / chunk)
+            _, policy_win_rate = self.evaluate_policy()
+            print(f"Episode {episode}, Win Rate: {chunk_wins / chunk:.3f}, "
+                  f"Greedy Policy Win Rate: {policy_win_rate:.3f}")
+            
+            chunks_since_checkpoint += 1
+            if chunks_since_checkpoint >= checkpoint_every or episode >= episodes:
+                self.save_checkpoint(checkpoint_path, rng, episode, total_wins, config)
+                chunks_since_checkpoint = 0
+        
+        print("Training completed!")
+        return total_wins / episode if episode else 0.0
+    
+    def save_checkpoint(self, path, rng, episode, total_wins, config):
+        """Atomically write agent state, RNG state, episode counter and rolling stats to path"""
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            np.savez(
+                f,
+                **self.agent.get_state(),
+                win_rates=np.array(self.win_rates, dtype=np.float64),
+                episode=np.int64(episode),
+                total_wins=np.int64(total_wins),
+                rng_state=json.dumps(rng.bit_generator.state),
+                config=json.dumps(config),
+            )
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    
+    def load_checkpoint(self, path, config):
+        """Restore training state from path. Returns (rng, episode, total_wins)."""
+        with np.load(path) as data:
+            saved_config = json.loads(str(data['config']))
+            if saved_config != config:
+                raise ValueError(f"Checkpoint settings {saved_config} do not match {config}")
             
-            win_rate = seq_wins / (test_games // 8)
-            results[player1_seq] = {
-                'best_response': self.env.sequences[action],
-                'win_rate': win_rate
-            }
+            self.agent.set_state(data)
+            self.win_rates = deque(data['win_rates'].tolist(), maxlen=self.WIN_RATE_HISTORY)
+            episode = int(data['episode'])
+            total_wins = int(data['total_wins'])
+            rng_state = json.loads(str(data['rng_state']))
         
-        overall_win_rate = wins / test_games
+        rng = np.random.default_rng()
+        rng.bit_generator.state = rng_state
+        return rng, episode, total_wins
+    
+    EVALUATION_MODES = ('exact', 'monte_carlo', 'both')
+    
+    def policy_matrix(self, policy=None):
+        """Return a row-stochastic (n_states, n_actions) policy matrix.
+        
+        policy may be None (greedy policy from the Q-table), an array of one action
+        per state (deterministic), or an (n_states, n_actions) array of action
+        probabilities (mixed).
+        """
+        n = len(self.env.sequences)
+        if policy is None:
+            policy = np.argmax(self.agent.q_table, axis=1)
+        
+        policy = np.asarray(policy)
+        if policy.ndim == 1:
+            matrix = np.zeros((n, n))
+            matrix[np.arange(n), policy] = 1.0
+            return matrix
+        
+        if policy.shape != (n, n):
+            raise ValueError(f"Policy must have shape ({n},) or ({n}, {n}), got {policy.shape}")
+        return policy / policy.sum(axis=1, keepdims=True)
+    
+    def evaluate_policy(self, test_games=100000, policy=None, mode='exact', seed=None):
+        """Evaluate a policy against a uniformly random opponent.
+        
+        mode='exact' scores the policy from the exact win-probability matrix,
+        mode='monte_carlo' plays test_games simulated games, and mode='both'
+        reports the exact rates plus the simulated ones as a cross-check.
+        Simulated games are always played in full, even in surrogate mode.
+        Returns (results, overall_win_rate).
+        """
+        if mode not in self.EVALUATION_MODES:
+            raise ValueError(f"Unknown evaluation mode: {mode}")
+        
+        matrix = self.policy_matrix(policy)
+        num_states = len(self.env.sequences)
+        best_responses = np.argmax(matrix, axis=1)
+        
+        # Win rate per opponent sequence: row-wise dot product of policy and win matrix
+        exact_rates = np.einsum('ij,ij->i', matrix, self.env.win_matrix())
+        
+        if mode != 'exact':
+            rng = np.random.default_rng(seed)
+            games_per_state = test_games // num_states
+            states = np.repeat(np.arange(num_states), games_per_state)
+            # Sample each game's action from its state's policy row
+            cumulative = np.cumsum(matrix, axis=1)
+            actions = (rng.random(states.size)[:, None] > cumulative[states]).sum(axis=1)
+            actions = np.minimum(actions, num_states - 1)
+            winners = simulate_matchups(states, actions, self.k, rng)
+            simulated_rates = np.bincount(states, weights=winners == 2, minlength=num_states) / games_per_state
+        
+        results = {}
+        for player1_seq_idx, player1_seq in enumerate(self.env.sequences):
+            result = {'best_response': self.env.sequences[best_responses[player1_seq_idx]]}
+            if mode == 'monte_carlo':
+                result['win_rate'] = float(simulated_rates[player1_seq_idx])
+            else:
+                result['win_rate'] = float(exact_rates[player1_seq_idx])
+            if mode == 'both':
+                result['simulated_win_rate'] = float(simulated_rates[player1_seq_idx])
+            results[player1_seq] = result
+        
+        if mode == 'monte_carlo':
+            overall_win_rate = float(simulated_rates.mean())
+        else:
+            overall_win_rate = float(exact_rates.mean())
         return results, overall_win_rate
     
     def get_decision_log(self):
         """Extract the final policy as a decision log"""
         decision_log = {}
-        for player1_seq_idx in range(8):
+        for player1_seq_idx in range(len(self.env.sequences)):
             player1_seq = self.env.sequences[player1_seq_idx]
             best_action = self.agent.get_best_action(player1_seq_idx)
             player2_seq = self.env.sequences[best_action]
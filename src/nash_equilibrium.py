@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+동시 선택 페니의 게임 내시 균형
+두 플레이어가 상대의 선택을 모른 채 길이 k 패턴을 동시에 고르는 영합 게임의
+혼합 전략 균형을 정확한 승률 행렬로부터 계산
+
+payoff[i, j] = 행 플레이어가 패턴 i, 열 플레이어가 패턴 j를 골랐을 때 행 플레이어의 승리 확률
+(열 플레이어는 1 - payoff 를 얻음). 게임이 대칭이므로 균형 값은 항상 1/2이고,
+관심 대상은 균형 전략과 그 지지 집합(support), 그리고 주어진 전략의 착취 가능도
+
+    linprog (HiGHS)            : 정확한 균형, k <= LINPROG_MAX_K 에서 기본
+    multiplicative_weights     : 낙관적 곱셈 가중치 (평균 반복이 균형으로 수렴, 반복당 O(4^k))
+    fictitious_play            : 가상 플레이 (반복당 O(2^k), 느리게 수렴)
+
+사용법:
+    python src/nash_equilibrium.py -k 3
+    python src/nash_equilibrium.py -k 10 --method mwu
+"""
+
+import argparse
+
+import numpy as np
+
+from exact_probability import win_probability_array
+from pattern_automaton import decode_sequence
+
+METHODS = ('auto', 'linprog', 'mwu', 'fictitious')
+
+# 이보다 큰 k에서는 auto가 반복 알고리즘을 사용 (k=10의 LP는 수 초, k=11부터 수십 초)
+LINPROG_MAX_K = 9
+
+# 반복 알고리즘이 수렴을 확인하는 간격
+CHECK_EVERY = 100
+
+
+def payoff_matrix(k=3, p_heads=0.5):
+    """payoff[i, j] = 패턴 i가 패턴 j를 이길 확률 (정확한 엔진)"""
+    codes = np.arange(1 << k)
+    # win_probability_array(a, b) = P(b가 a를 이김) 이므로 전치
+    return win_probability_array(codes[:, None], codes[None, :], k, p_heads).T
+
+
+def exploitability(payoff, row_strategy, column_strategy=None, value=0.5):
+    """혼합 전략의 착취 가능도
+
+    열 전략이 없으면 행 전략이 최선 응답에게 잃는 양 value - min_j (x A)_j
+    (value 기본값은 대칭 게임의 값 1/2), 있으면 두 전략의 쌍대 간극
+    max_i (A y)_i - min_j (x A)_j 를 반환. 균형에서 0
+    """
+    payoff = np.asarray(payoff)
+    guaranteed = float((row_strategy @ payoff).min())
+    if column_strategy is None:
+        return value - guaranteed
+    return float((payoff @ column_strategy).max()) - guaranteed
+
+
+def solve_linprog(payoff):
+    """선형 계획법(HiGHS)으로 (행 전략, 열 전략, 게임 값) 계산
+
+    max v  s.t.  A^T x >= v, sum(x) = 1, x >= 0.  열 전략은 부등식 제약의 쌍대 변수
+    """
+    from scipy import sparse
+    from scipy.optimize import linprog
+
+    payoff = np.asarray(payoff, dtype=np.float64)
+    rows, columns = payoff.shape
+    objective = np.zeros(rows + 1)
+    objective[-1] = -1.0
+    # 열마다 v - sum_i x_i A[i, j] <= 0
+    upper = sparse.hstack([-sparse.csr_matrix(payoff.T), np.ones((columns, 1))], format='csr')
+    equality = np.append(np.ones(rows), 0.0)[None, :]
+    bounds = [(0, None)] * rows + [(None, None)]
+
+    result = linprog(objective, A_ub=upper, b_ub=np.zeros(columns), A_eq=equality, b_eq=[1.0],
+                     bounds=bounds, method='highs')
+    if not result.success:
+        raise RuntimeError(f"linprog failed: {result.message}")
+
+    row_strategy = np.clip(result.x[:rows], 0.0, None)
+    column_strategy = np.clip(-result.ineqlin.marginals, 0.0, None)
+    return (row_strategy / row_strategy.sum(), column_strategy / column_strategy.sum(),
+            float(-result.fun))
+
+
+def multiplicative_weights(payoff, iterations=5000, tolerance=1e-5, learning_rate=10.0):
+    """낙관적 곱셈 가중치(optimistic Hedge)로 균형 근사
+
+    두 플레이어가 동시에 지수 가중치로 갱신하며, 직전 이득을 한 번 더 반영하는 낙관적
+    갱신으로 평균 전략의 쌍대 간극이 O(1 / (learning_rate * T))로 줄어든다.
+    learning_rate가 크면 빨리 줄지만 작은 k에서 진동하므로 k = 3..10 에서 모두 안정적인 10을 기본으로 한다.
+    간극이 tolerance 이하면 중단. 반환: (행 전략, 열 전략, 게임 값 추정, 반복 수)
+    """
+    payoff = np.ascontiguousarray(payoff, dtype=np.float64)
+    rows, columns = payoff.shape
+
+    row_totals = np.zeros(rows)
+    column_totals = np.zeros(columns)
+    row_last = np.zeros(rows)
+    column_last = np.zeros(columns)
+    row_average = np.zeros(rows)
+    column_average = np.zeros(columns)
+
+    for iteration in range(1, iterations + 1):
+        row_strategy = _softmax(learning_rate * (row_totals + row_last))
+        column_strategy = _softmax(-learning_rate * (column_totals + column_last))
+
+        row_last = payoff @ column_strategy
+        column_last = row_strategy @ payoff
+        row_totals += row_last
+        column_totals += column_last
+        row_average += row_strategy
+        column_average += column_strategy
+
+        if iteration % CHECK_EVERY == 0 or iteration == iterations:
+            x = row_average / iteration
+            y = column_average / iteration
+            if exploitability(payoff, x, y) <= tolerance:
+                break
+
+    x = row_average / iteration
+    y = column_average / iteration
+    return x, y, float(x @ payoff @ y), iteration
+
+
+def fictitious_play(payoff, iterations=100000, tolerance=1e-4):
+    """가상 플레이: 매 반복 상대의 경험적 혼합 전략에 대한 순수 최선 응답을 추가
+
+    누적 이득을 행/열 하나씩만 더해 갱신하므로 반복당 O(2^k) 이지만 수렴은 느리다.
+    반환: (행 전략, 열 전략, 게임 값 추정, 반복 수)
+    """
+    payoff = np.asarray(payoff, dtype=np.float64)
+    rows, columns = payoff.shape
+    row_counts = np.zeros(rows)
+    column_counts = np.zeros(columns)
+    # row_payoffs[i] = 지금까지 열 선택들에 대한 행 i의 누적 이득
+    row_payoffs = np.zeros(rows)
+    column_payoffs = np.zeros(columns)
+
+    row_choice, column_choice = 0, 0
+    for iteration in range(1, iterations + 1):
+        row_counts[row_choice] += 1
+        column_counts[column_choice] += 1
+        row_payoffs += payoff[:, column_choice]
+        column_payoffs += payoff[row_choice]
+        row_choice = int(np.argmax(row_payoffs))
+        column_choice = int(np.argmin(column_payoffs))
+
+        if iteration % CHECK_EVERY == 0:
+            # 누적 이득으로 쌍대 간극을 바로 계산 (행렬 곱 없음)
+            if (row_payoffs.max() - column_payoffs.min()) / iteration <= tolerance:
+                break
+
+    x = row_counts / iteration
+    y = column_counts / iteration
+    return x, y, float(x @ payoff @ y), iteration
+
+
+def _softmax(values):
+    weights = np.exp(values - values.max())
+    return weights / weights.sum()
+
+
+def solve_equilibrium(k=3, p_heads=0.5, method='auto', tolerance=None, iterations=None):
+    """길이 k 동시 선택 게임의 균형 결과 사전
+
+    strategy는 행 플레이어의 균형 혼합 전략, exploitability는 찾은 전략 쌍의 쌍대 간극
+    (선형 계획법에서는 수치 오차 수준), support는 확률이 있는 패턴과 확률 목록
+    """
+    if method not in METHODS:
+        raise ValueError(f"Unknown equilibrium method: {method}")
+    if method == 'auto':
+        method = 'linprog' if k <= LINPROG_MAX_K else 'mwu'
+
+    payoff = payoff_matrix(k, p_heads)
+    options = {}
+    if tolerance is not None:
+        options['tolerance'] = tolerance
+    if iterations is not None:
+        options['iterations'] = iterations
+
+    if method == 'linprog':
+        row_strategy, column_strategy, value = solve_linprog(payoff)
+        iteration = None
+    elif method == 'mwu':
+        row_strategy, column_strategy, value, iteration = multiplicative_weights(payoff, **options)
+    else:
+        row_strategy, column_strategy, value, iteration = fictitious_play(payoff, **options)
+
+    order = np.argsort(-row_strategy, kind='stable')
+    support = [(decode_sequence(int(code), k), float(row_strategy[code]))
+               for code in order if row_strategy[code] > 1e-9]
+    return {
+        'k': k,
+        'method': method,
+        'value': value,
+        'strategy': row_strategy,
+        'column_strategy': column_strategy,
+        'exploitability': exploitability(payoff, row_strategy, column_strategy),
+        'uniform_exploitability': exploitability(payoff, np.full(len(row_strategy), 1 / len(row_strategy))),
+        'support': support,
+        'iterations': iteration,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="동시 선택 페니의 게임 내시 균형")
+    parser.add_argument('-k', type=int, default=3)
+    parser.add_argument('--p-heads', type=float, default=0.5, help="앞면 확률")
+    parser.add_argument('--method', choices=METHODS, default='auto')
+    parser.add_argument('--top', type=int, default=16, help="출력할 지지 패턴 수")
+    args = parser.parse_args()
+
+    result = solve_equilibrium(args.k, args.p_heads, args.method)
+    print(f"k={result['k']} ({result['method']}"
+          + (f", {result['iterations']} iterations" if result['iterations'] else "") + ")")
+    print(f"게임 값: {result['value']:.6f}")
+    print(f"균형 전략 착취 가능도(쌍대 간극): {result['exploitability']:.2e}")
+    print(f"균등 무작위 전략 착취 가능도: {result['uniform_exploitability']:.4f}")
+    print(f"지지 집합 크기: {len(result['support'])} / {1 << args.k}")
+    for sequence, probability in result['support'][:args.top]:
+        print(f"  {sequence}  {probability:.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+프로세스 풀 기반 병렬 몬테카를로 실행기
+작업을 고정 크기 샤드로 나누고 SeedSequence.spawn으로 샤드별 난수 스트림을 만들어
+작업자 수와 관계없이 같은 루트 시드에서 항상 동일한 결과를 보장
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from batch_simulator import count_pair_wins, count_wins, paired_differences
+
+DEFAULT_SHARD_SIZE = 1000000
+
+
+def _shard_sizes(num_games, shard_size):
+    """게임 수를 샤드 크기 단위로 분할 (작업자 수와 무관하게 결정됨)"""
+    full, rest = divmod(num_games, shard_size)
+    return [shard_size] * full + ([rest] if rest else [])
+
+
+def _count_shard(job):
+    """샤드 하나를 실행하여 seq2 승리 횟수 반환 (작업자 프로세스에서 실행)"""
+    seq1, seq2, num_games, seed_sequence, p_heads = job
+    return count_wins(seq1, seq2, num_games, np.random.default_rng(seed_sequence), p_heads=p_heads)
+
+
+def _run_jobs(jobs, max_workers, worker=_count_shard):
+    """샤드 작업 목록을 실행하여 결과 리스트 반환 (입력 순서 유지)"""
+    if max_workers == 1 or len(jobs) <= 1:
+        return [worker(job) for job in jobs]
+
+    workers = max_workers or os.cpu_count() or 1
+    chunksize = max(1, len(jobs) // (4 * workers))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(worker, jobs, chunksize=chunksize))
+
+
+def parallel_count_wins(seq1, seq2, num_games, seed=None, max_workers=None,
+                        shard_size=DEFAULT_SHARD_SIZE, p_heads=0.5):
+    """seq2의 승리 횟수를 여러 프로세스에서 나누어 계산"""
+    sizes = _shard_sizes(num_games, shard_size)
+    children = np.random.SeedSequence(seed).spawn(len(sizes))
+    jobs = [(seq1, seq2, size, child, p_heads) for size, child in zip(sizes, children)]
+
+    return sum(_run_jobs(jobs, max_workers))
+
+
+def parallel_win_matrix(sequences, num_games, seed=None, max_workers=None,
+                        shard_size=DEFAULT_SHARD_SIZE, p_heads=0.5):
+    """모든 대결 쌍의 승리 횟수 행렬. wins[i, j] = sequences[j]가 sequences[i]를 이긴 횟수"""
+    n = len(sequences)
+    sizes = _shard_sizes(num_games, shard_size)
+    pair_seeds = np.random.SeedSequence(seed).spawn(n * n)
+
+    jobs = []
+    for pair, pair_seed in enumerate(pair_seeds):
+        seq1, seq2 = sequences[pair // n], sequences[pair % n]
+        for size, child in zip(sizes, pair_seed.spawn(len(sizes))):
+            jobs.append((seq1, seq2, size, child, p_heads))
+
+    counts = np.array(_run_jobs(jobs, max_workers), dtype=np.int64)
+    return counts.reshape(n * n, len(sizes)).sum(axis=1).reshape(n, n)
+
+
+def _count_pairs_shard(job):
+    """스트림 샤드 하나에서 쌍별 승리 횟수 배열 반환 (작업자 프로세스에서 실행)"""
+    first, second, num_games, k, seed_sequence, p_heads = job
+    return count_pair_wins(first, second, num_games, k, np.random.default_rng(seed_sequence), p_heads=p_heads)
+
+
+def parallel_pair_wins(first, second, num_games, k=3, seed=None, max_workers=None,
+                       shard_size=DEFAULT_SHARD_SIZE, p_heads=0.5):
+    """count_pair_wins를 코인 스트림 샤드로 나누어 병렬 실행
+
+    샤드 s는 스트림 [s * shard_size, (s + 1) * shard_size)를 맡고, 쌍 i는 그중
+    앞쪽 num_games[i]개 스트림만 사용하므로 작업자 수와 관계없이 결과가 같다.
+    """
+    first = np.asarray(first, dtype=np.int64).ravel()
+    second = np.asarray(second, dtype=np.int64).ravel()
+    num_games = np.broadcast_to(np.asarray(num_games, dtype=np.int64), first.shape)
+    total = int(num_games.max()) if first.size else 0
+
+    sizes = _shard_sizes(total, shard_size)
+    children = np.random.SeedSequence(seed).spawn(len(sizes))
+    jobs = []
+    for index, (size, child) in enumerate(zip(sizes, children)):
+        used = np.clip(num_games - index * shard_size, 0, size)
+        jobs.append((first, second, used, k, child, p_heads))
+
+    results = _run_jobs(jobs, max_workers, _count_pairs_shard)
+    return np.sum(results, axis=0, dtype=np.int64) if results else np.zeros(first.size, dtype=np.int64)
+
+
+def _paired_shard(job):
+    """스트림 샤드 하나에서 짝 비교 합계 사전 반환 (작업자 프로세스에서 실행)"""
+    opponents, responses_a, responses_b, num_games, k, seed_sequence, antithetic = job
+    return paired_differences(opponents, responses_a, responses_b, num_games, k,
+                              np.random.default_rng(seed_sequence), antithetic=antithetic)
+
+
+def parallel_paired_differences(opponents, responses_a, responses_b, num_games, k=3, seed=None,
+                                max_workers=None, shard_size=DEFAULT_SHARD_SIZE, antithetic=True):
+    """paired_differences를 코인 스트림 샤드로 나누어 병렬 실행하고 합계를 더함"""
+    sizes = _shard_sizes(num_games, shard_size)
+    children = np.random.SeedSequence(seed).spawn(len(sizes))
+    jobs = [(opponents, responses_a, responses_b, size, k, child, antithetic)
+            for size, child in zip(sizes, children)]
+
+    results = _run_jobs(jobs, max_workers, _paired_shard)
+    return {name: sum(result[name] for result in results) for name in results[0]}
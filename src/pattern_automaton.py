@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+페니의 게임 패턴 오토마톤
+임의 길이 k의 패턴 집합을 {H, T} 위의 DFA(Aho–Corasick)로 컴파일하여
+시뮬레이터, 정확한 확률 계산, 강화학습 환경이 공유하는 게임 엔진 핵심
+"""
+
+from collections import deque
+from functools import lru_cache
+from itertools import product
+
+import numpy as np
+
+COINS = 'HT'  # 동전 코드: H=0, T=1
+
+
+def all_patterns(k):
+    """길이 k의 모든 패턴 (HH...H부터 TT...T까지, 정수 코드 순서)"""
+    return [''.join(p) for p in product(COINS, repeat=k)]
+
+
+def encode_sequence(sequence):
+    """배열 문자열을 정수 코드로 변환 (H=0, T=1, 첫 동전이 최상위 비트)"""
+    code = 0
+    for coin in sequence:
+        if coin not in COINS:
+            raise ValueError(f"Invalid sequence: {sequence}")
+        code = (code << 1) | COINS.index(coin)
+    return code
+
+
+def decode_sequence(code, length=3):
+    """정수 코드를 길이 length의 배열 문자열로 변환"""
+    return ''.join(COINS[(code >> shift) & 1] for shift in range(length - 1, -1, -1))
+
+
+class PatternAutomaton:
+    """패턴 집합을 인식하는 결정적 유한 오토마톤
+
+    transitions[state, coin] -> 다음 상태 (밀집 int32 테이블)
+    accept[state] -> 해당 상태에서 완성되는 패턴의 인덱스 (없으면 -1)
+    상태 0은 게임 시작 상태이며, 모든 상태는 지금까지 나온 동전 열의
+    접미사 중 어떤 패턴의 접두사인 가장 긴 것에 대응한다.
+    """
+
+    def __init__(self, patterns):
+        self.patterns = list(patterns)
+        if not self.patterns:
+            raise ValueError("At least one pattern is required")
+        for pattern in self.patterns:
+            if not pattern or any(coin not in COINS for coin in pattern):
+                raise ValueError(f"Invalid sequence: {pattern}")
+
+        # 1단계: 트라이 구성
+        children = [[-1, -1]]
+        depth = [0]
+        accept = [-1]
+        for index, pattern in enumerate(self.patterns):
+            state = 0
+            for coin in pattern:
+                c = COINS.index(coin)
+                if children[state][c] == -1:
+                    children[state][c] = len(children)
+                    children.append([-1, -1])
+                    depth.append(depth[state] + 1)
+                    accept.append(-1)
+                state = children[state][c]
+            if accept[state] == -1:
+                accept[state] = index
+
+        # 2단계: 실패 링크를 따라 BFS로 완전한 전이 테이블 구성
+        n_states = len(children)
+        transitions = np.zeros((n_states, 2), dtype=np.int32)
+        failure = [0] * n_states
+        queue = deque()
+
+        for c in range(2):
+            child = children[0][c]
+            if child == -1:
+                transitions[0, c] = 0
+            else:
+                transitions[0, c] = child
+                queue.append(child)
+
+        while queue:
+            state = queue.popleft()
+            # 접미사에서 완성되는 패턴도 인식 (길이가 다른 패턴 집합용)
+            if accept[state] == -1:
+                accept[state] = accept[failure[state]]
+            for c in range(2):
+                child = children[state][c]
+                if child == -1:
+                    transitions[state, c] = transitions[failure[state], c]
+                else:
+                    failure[child] = int(transitions[failure[state], c])
+                    transitions[state, c] = child
+                    queue.append(child)
+
+        self.transitions = transitions
+        self.accept = np.array(accept, dtype=np.int32)
+        self.depth = np.array(depth, dtype=np.int32)
+        self.n_states = n_states
+
+        # 스칼라 루프용 파이썬 리스트 사본 (numpy 스칼라 인덱싱보다 빠름)
+        self.transition_list = transitions.tolist()
+        self.accept_list = accept
+
+    def step(self, states, coins):
+        """상태 배열과 동전 배열(0/1)로부터 다음 상태 배열 계산"""
+        return self.transitions[states, coins]
+
+    def run(self, coin_sequence):
+        """동전 열을 처리하여 처음 완성된 패턴의 (인덱스, 동전 수) 반환. 없으면 (-1, 길이)"""
+        state = 0
+        for flips, coin in enumerate(coin_sequence, 1):
+            state = self.transition_list[state][COINS.index(coin)]
+            if self.accept_list[state] != -1:
+                return self.accept_list[state], flips
+        return -1, len(coin_sequence)
+
+
+@lru_cache(maxsize=256)
+def get_automaton(patterns):
+    """패턴 집합별 오토마톤을 한 번만 컴파일하여 재사용"""
+    return PatternAutomaton(patterns)
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+페니의 게임 통합 명령줄 도구
+조회 명령(respond, table)은 미리 계산된 response_data만 불러와 빠르게 시작하고,
+NumPy/SciPy가 필요한 명령은 실행될 때 해당 모듈을 불러옴
+
+사용법:
+    python src/penney.py respond HTH              # 최적 응답과 정확한 승률
+    python src/penney.py respond HTH TTHH -p      # 여러 개, 승률만 백분율로
+    python src/penney.py table -k 4               # 전체 응답 테이블
+    python src/penney.py odds HTH HHT             # 두 배열의 정확한 승률
+    python src/penney.py simulate HTH HHT -n 1000000 --seed 1
+    python src/penney.py train --agent thompson --episodes 100000
+    python src/penney.py train --surrogate --episodes 100000000 --num-envs 1048576
+    python src/penney.py validate --games 100000
+    python src/penney.py nash -k 4                # 동시 선택 게임의 균형 혼합 전략
+"""
+
+import argparse
+import sys
+from math import gcd
+
+COINS = 'HT'
+
+
+def _parse_sequence(text):
+    sequence = text.upper()
+    if not sequence or any(coin not in COINS for coin in sequence):
+        raise argparse.ArgumentTypeError(f"Invalid sequence: {text}")
+    return sequence
+
+
+def _encode(sequence):
+    code = 0
+    for coin in sequence:
+        code = (code << 1) | COINS.index(coin)
+    return code
+
+
+def _decode(code, length):
+    return ''.join(COINS[(code >> shift) & 1] for shift in range(length - 1, -1, -1))
+
+
+def _format_probability(numerator, denominator, percent):
+    """분수(약분)와 백분율 문자열"""
+    if percent:
+        return f"{100 * numerator / denominator:.2f}%"
+    divisor = gcd(numerator, denominator)
+    return f"{numerator // divisor}/{denominator // divisor} ({100 * numerator / denominator:.2f}%)"
+
+
+def lookup(sequence):
+    """(최적 응답, 응답 승리 비율, 상대 승리 비율). 미리 계산된 범위를 넘으면 구조적 탐색으로 계산"""
+    import response_data
+
+    k = len(sequence)
+    if k <= response_data.MAX_K:
+        code = _encode(sequence)
+        response = _decode(response_data.RESPONSES[k][code], k)
+        response_odds, opponent_odds = response_data.WIN_ODDS[k][code]
+    else:
+        from best_response import best_response
+
+        response, probability = best_response(sequence)
+        response_odds = probability.numerator
+        opponent_odds = probability.denominator - probability.numerator
+    return response, response_odds, opponent_odds
+
+
+def command_respond(args):
+    for sequence in args.sequences:
+        response, response_odds, opponent_odds = lookup(sequence)
+        probability = _format_probability(response_odds, response_odds + opponent_odds, args.percent)
+        print(f"{sequence} -> {response}  {probability}")
+    return 0
+
+
+def command_table(args):
+    import response_data
+
+    if not 1 <= args.k <= response_data.MAX_K:
+        print(f"k must be between 1 and {response_data.MAX_K}", file=sys.stderr)
+        return 2
+    for code in range(1 << args.k):
+        sequence = _decode(code, args.k)
+        response, response_odds, opponent_odds = lookup(sequence)
+        probability = _format_probability(response_odds, response_odds + opponent_odds, args.percent)
+        print(f"{sequence} -> {response}  {probability}")
+    return 0
+
+
+def command_odds(args):
+    from exact_probability import conway_win_probability
+
+    probability = conway_win_probability(args.first, args.second, args.p_heads)
+    if args.p_heads == 0.5:
+        text = _format_probability(probability.numerator, probability.denominator, args.percent)
+    else:
+        text = f"{100 * float(probability):.4f}%"
+    print(f"P({args.second} beats {args.first}) = {text}")
+    return 0
+
+
+def command_simulate(args):
+    from batch_simulator import count_wins
+    from sequential_testing import wilson_interval
+
+    wins = count_wins(args.first, args.second, args.games, args.seed,
+                      p_heads=args.p_heads, method=args.method)
+    lower, upper = wilson_interval(wins, args.games)
+    print(f"{args.second} beat {args.first} in {wins:,}/{args.games:,} games "
+          f"= {wins / args.games:.4%} (95% CI {lower:.4%} - {upper:.4%})")
+    return 0
+
+
+def command_train(args):
+    from main_rl_trainer import PenneysRLTrainer
+
+    trainer = PenneysRLTrainer(k=args.k, agent=args.agent,
+                               env_mode='surrogate' if args.surrogate else 'simulate')
+    trainer.train_batched(args.episodes, num_envs=args.num_envs, seed=args.seed)
+    _, overall_win_rate = trainer.evaluate_policy()
+    for opponent, response in trainer.get_decision_log().items():
+        print(f"{opponent} -> {response}")
+    print(f"Exact win rate of learned policy: {overall_win_rate:.4f}")
+    return 0
+
+
+def command_validate(args):
+    from corrected_strategy import StrategyValidator
+
+    StrategyValidator(seed=args.seed, max_workers=args.workers).validate_strategy(args.games)
+    return 0
+
+
+def command_nash(args):
+    from nash_equilibrium import solve_equilibrium
+
+    result = solve_equilibrium(args.k, args.p_heads, args.method)
+    print(f"Equilibrium for k={args.k} ({result['method']}), value {result['value']:.6f}, "
+          f"exploitability {result['exploitability']:.2e}")
+    for sequence, probability in result['support']:
+        print(f"{sequence}  {probability:.4f}")
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='penney', description="페니의 게임 전략 도구")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    respond = commands.add_parser('respond', help="상대 배열에 대한 최적 응답")
+    respond.add_argument('sequences', nargs='+', type=_parse_sequence, metavar='SEQUENCE')
+    respond.add_argument('-p', '--percent', action='store_true', help="승률을 백분율로만 표시")
+    respond.set_defaults(handler=command_respond)
+
+    table = commands.add_parser('table', help="길이 k의 전체 최적 응답 테이블")
+    table.add_argument('-k', type=int, default=3)
+    table.add_argument('-p', '--percent', action='store_true', help="승률을 백분율로만 표시")
+    table.set_defaults(handler=command_table)
+
+    odds = commands.add_parser('odds', help="second가 first를 이길 정확한 확률")
+    odds.add_argument('first', type=_parse_sequence)
+    odds.add_argument('second', type=_parse_sequence)
+    odds.add_argument('--p-heads', type=float, default=0.5, help="앞면 확률")
+    odds.add_argument('-p', '--percent', action='store_true', help="승률을 백분율로만 표시")
+    odds.set_defaults(handler=command_odds)
+
+    simulate = commands.add_parser('simulate', help="몬테카를로 시뮬레이션")
+    simulate.add_argument('first', type=_parse_sequence)
+    simulate.add_argument('second', type=_parse_sequence)
+    simulate.add_argument('-n', '--games', type=int, default=1000000)
+    simulate.add_argument('--seed', type=int)
+    simulate.add_argument('--p-heads', type=float, default=0.5, help="앞면 확률")
+    simulate.add_argument('--method', choices=('automaton', 'wave'), default='automaton')
+    simulate.set_defaults(handler=command_simulate)
+
+    train = commands.add_parser('train', help="강화학습/bandit 에이전트 훈련")
+    train.add_argument('-k', type=int, default=3)
+    train.add_argument('--agent', choices=('q-learning', 'ucb1', 'kl-ucb', 'thompson'), default='q-learning')
+    train.add_argument('--episodes', type=int, default=1000000)
+    train.add_argument('--num-envs', type=int, default=4096)
+    train.add_argument('--seed', type=int)
+    train.add_argument('--surrogate', action='store_true',
+                       help="게임 대신 정확한 승률 행렬의 베르누이 보상으로 훈련")
+    train.set_defaults(handler=command_train)
+
+    validate = commands.add_parser('validate', help="콘웨이 전략 시뮬레이션 검증")
+    validate.add_argument('--games', type=int, default=1000000)
+    validate.add_argument('--seed', type=int)
+    validate.add_argument('--workers', type=int, default=1)
+    validate.set_defaults(handler=command_validate)
+
+    nash = commands.add_parser('nash', help="동시 선택 게임의 혼합 전략 내시 균형")
+    nash.add_argument('-k', type=int, default=3)
+    nash.add_argument('--p-heads', type=float, default=0.5, help="앞면 확률")
+    nash.add_argument('--method', choices=('auto', 'linprog', 'mwu', 'fictitious'), default='auto')
+    nash.set_defaults(handler=command_nash)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
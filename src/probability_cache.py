@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+대결 확률 캐시 (SQLite 디스크 저장)
+(pattern_a, pattern_b, coin_bias, k) 별로 정확한 확률과 몬테카를로 표본(승리 수, 게임 수)을
+저장하고, 새 표본은 기존 표본에 누적하여 모든 분석 스크립트가 공유
+"""
+
+import os
+import sqlite3
+from fractions import Fraction
+
+from exact_probability import conway_win_probability
+from sequential_testing import wilson_interval
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.dirname(__file__), '..', 'results', 'probability_cache.sqlite')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS probabilities (
+    pattern_a TEXT NOT NULL,
+    pattern_b TEXT NOT NULL,
+    coin_bias REAL NOT NULL,
+    k INTEGER NOT NULL,
+    exact_numerator INTEGER,
+    exact_denominator INTEGER,
+    wins INTEGER NOT NULL DEFAULT 0,
+    games INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (pattern_a, pattern_b, coin_bias, k)
+)
+"""
+
+
+class ProbabilityCache:
+    """pattern_b가 pattern_a를 이길 확률의 영구 캐시"""
+
+    def __init__(self, path=DEFAULT_CACHE_PATH):
+        self.path = path
+        if path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.connection = sqlite3.connect(path)
+        self.connection.execute(_SCHEMA)
+        self.connection.commit()
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _ensure_row(self, pattern_a, pattern_b, coin_bias):
+        self.connection.execute(
+            "INSERT OR IGNORE INTO probabilities (pattern_a, pattern_b, coin_bias, k) VALUES (?, ?, ?, ?)",
+            (pattern_a, pattern_b, float(coin_bias), len(pattern_a))
+        )
+
+    def get(self, pattern_a, pattern_b, coin_bias=0.5, confidence=0.95):
+        """저장된 결과 조회. 없으면 None
+
+        반환: dict(exact, wins, games, probability, ci_lower, ci_upper)
+        exact는 Fraction 또는 None, probability는 정확한 값이 있으면 그 값, 없으면 표본 승률
+        """
+        row = self.connection.execute(
+            "SELECT exact_numerator, exact_denominator, wins, games FROM probabilities "
+            "WHERE pattern_a = ? AND pattern_b = ? AND coin_bias = ? AND k = ?",
+            (pattern_a, pattern_b, float(coin_bias), len(pattern_a))
+        ).fetchone()
+        if row is None:
+            return None
+
+        numerator, denominator, wins, games = row
+        exact = Fraction(numerator, denominator) if denominator else None
+        ci_lower, ci_upper = wilson_interval(wins, games, confidence)
+
+        if exact is not None:
+            probability = float(exact)
+        elif games:
+            probability = wins / games
+        else:
+            probability = None
+
+        return {
+            'exact': exact,
+            'wins': wins,
+            'games': games,
+            'probability': probability,
+            'ci_lower': ci_lower,
+            'ci_upper': ci_upper,
+        }
+
+    def put_exact(self, pattern_a, pattern_b, probability, coin_bias=0.5):
+        """정확한 확률(Fraction) 저장"""
+        probability = Fraction(probability)
+        self._ensure_row(pattern_a, pattern_b, coin_bias)
+        self.connection.execute(
+            "UPDATE probabilities SET exact_numerator = ?, exact_denominator = ? "
+            "WHERE pattern_a = ? AND pattern_b = ? AND coin_bias = ? AND k = ?",
+            (probability.numerator, probability.denominator,
+             pattern_a, pattern_b, float(coin_bias), len(pattern_a))
+        )
+        self.connection.commit()
+
+    def add_samples(self, pattern_a, pattern_b, wins, games, coin_bias=0.5):
+        """몬테카를로 표본을 기존 표본에 누적"""
+        self._ensure_row(pattern_a, pattern_b, coin_bias)
+        self.connection.execute(
+            "UPDATE probabilities SET wins = wins + ?, games = games + ? "
+            "WHERE pattern_a = ? AND pattern_b = ? AND coin_bias = ? AND k = ?",
+            (int(wins), int(games), pattern_a, pattern_b, float(coin_bias), len(pattern_a))
+        )
+        self.connection.commit()
+
+    def exact_probability(self, pattern_a, pattern_b, coin_bias=0.5):
+        """정확한 확률 조회 (없으면 콘웨이 공식으로 계산 후 저장)
+
+        공정한 동전이나 Fraction 편향은 Fraction을 그대로 저장하고 반환한다.
+        float 편향의 결과는 float이므로 그 이진 값을 손실 없이 Fraction으로 저장하고 float로 반환
+        """
+        fraction_result = coin_bias == 0.5 or isinstance(coin_bias, Fraction)
+        cached = self.get(pattern_a, pattern_b, coin_bias)
+        if cached is not None and cached['exact'] is not None:
+            return cached['exact'] if fraction_result else float(cached['exact'])
+
+        probability = conway_win_probability(pattern_a, pattern_b, coin_bias)
+        self.put_exact(pattern_a, pattern_b, probability, coin_bias)
+        return probability
+
+    def monte_carlo(self, pattern_a, pattern_b, num_games, sample, coin_bias=0.5):
+        """최소 num_games개의 표본 확보. 부족한 만큼만 sample(n)으로 시뮬레이션하여 누적
+
+        sample(n)은 n게임을 진행하여 pattern_b의 승리 횟수를 반환하는 함수.
+        반환: (wins, games) 누적 표본
+        """
+        cached = self.get(pattern_a, pattern_b, coin_bias)
+        wins, games = (cached['wins'], cached['games']) if cached else (0, 0)
+
+        if games < num_games:
+            new_games = num_games - games
+            new_wins = sample(new_games)
+            self.add_samples(pattern_a, pattern_b, new_wins, new_games, coin_bias)
+            wins += new_wins
+            games += new_games
+
+        return wins, games
+
+    def monte_carlo_pairs(self, pairs, num_games, sample_pairs, coin_bias=0.5):
+        """여러 대결 쌍에 대해 각각 최소 num_games개의 표본 확보 (한 번의 sample_pairs 호출)
+
+        sample_pairs(unique_pairs, missing)는 중복을 뺀 쌍 목록과 쌍별 부족한 게임 수 배열을 받아
+        쌍별 승리 횟수 배열을 반환하는 함수.
+        반환: [(wins, games), ...] 누적 표본 (pairs 순서)
+        """
+        unique_pairs = list(dict.fromkeys(pairs))
+        totals = {}
+        missing = []
+        for pattern_a, pattern_b in unique_pairs:
+            cached = self.get(pattern_a, pattern_b, coin_bias)
+            totals[(pattern_a, pattern_b)] = (cached['wins'], cached['games']) if cached else (0, 0)
+            missing.append(max(0, num_games - totals[(pattern_a, pattern_b)][1]))
+
+        if any(missing):
+            new_wins = sample_pairs(unique_pairs, missing)
+            for (pattern_a, pattern_b), wins_added, games_added in zip(unique_pairs, new_wins, missing):
+                if games_added:
+                    self.add_samples(pattern_a, pattern_b, int(wins_added), games_added, coin_bias)
+                    wins, games = totals[(pattern_a, pattern_b)]
+                    totals[(pattern_a, pattern_b)] = (wins + int(wins_added), games + games_added)
+
+        return [totals[pair] for pair in pairs]
+
+
+_default_cache = None
+
+
+def default_cache():
+    """분석 스크립트가 공유하는 기본 캐시 (results/probability_cache.sqlite)"""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = ProbabilityCache()
+    return _default_cache
@@ -0,0 +1,449 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+미리 계산된 최적 응답 테이블 (자동 생성: response_table.generate_response_data)
+RESPONSES[k][code] -> 최적 응답 코드, WIN_ODDS[k][code] -> (응답 승리, 상대 승리) 정수 비율
+"""
+
+MAX_K = 10
+
+RESPONSES = {
+    1: (
+        0, 0,
+    ),
+    2: (
+        2, 0, 1, 1,
+    ),
+    3: (
+        4, 4, 1, 1, 6, 6, 3, 3,
+    ),
+    4: (
+        8, 8, 1, 1, 10, 2, 3, 3, 12, 12, 13, 5, 14, 14, 7, 7,
+    ),
+    5: (
+        16, 16, 1, 1, 2, 2, 3, 3, 20, 20, 5, 5, 22, 6, 7, 7, 24, 24, 25, 9, 26, 26, 11, 11, 28, 28,
+        29, 29, 30, 30, 15, 15,
+    ),
+    6: (
+        32, 32, 1, 1, 2, 2, 3, 3, 36, 4, 5, 5, 6, 6, 7, 7, 40, 40, 41, 41, 10, 10, 11, 11, 44, 44,
+        13, 13, 46, 14, 15, 15, 48, 48, 49, 17, 50, 50, 19, 19, 52, 52, 53, 53, 22, 22, 23, 23, 56,
+        56, 57, 57, 58, 58, 59, 27, 60, 60, 61, 61, 62, 62, 31, 31,
+    ),
+    7: (
+        64, 64, 1, 1, 2, 2, 3, 3, 4, 4, 5, 5, 6, 6, 7, 7, 72, 72, 9, 9, 10, 10, 11, 11, 76, 12, 13,
+        13, 14, 14, 15, 15, 80, 80, 81, 81, 82, 82, 19, 19, 84, 84, 21, 21, 86, 22, 23, 23, 88, 88,
+        89, 89, 90, 26, 27, 27, 92, 92, 29, 29, 94, 30, 31, 31, 96, 96, 97, 33, 98, 98, 35, 35,
+        100, 100, 101, 37, 38, 38, 39, 39, 104, 104, 105, 41, 106, 106, 43, 43, 108, 108, 45, 45,
+        46, 46, 47, 47, 112, 112, 113, 113, 114, 114, 115, 51, 116, 116, 117, 117, 118, 118, 55,
+        55, 120, 120, 121, 121, 122, 122, 123, 123, 124, 124, 125, 125, 126, 126, 63, 63,
+    ),
+    8: (
+        128, 128, 1, 1, 2, 2, 3, 3, 4, 4, 5, 5, 6, 6, 7, 7, 136, 8, 9, 9, 10, 10, 11, 11, 12, 12,
+        13, 13, 14, 14, 15, 15, 144, 144, 145, 145, 18, 18, 19, 19, 148, 20, 21, 21, 22, 22, 23,
+        23, 152, 152, 25, 25, 26, 26, 27, 27, 156, 28, 29, 29, 30, 30, 31, 31, 160, 160, 161, 161,
+        162, 162, 35, 35, 164, 164, 37, 37, 166, 38, 39, 39, 168, 168, 169, 169, 42, 42, 43, 43,
+        172, 172, 45, 45, 174, 46, 47, 47, 176, 176, 177, 177, 178, 50, 179, 179, 180, 180, 53, 53,
+        54, 54, 55, 55, 184, 184, 185, 185, 186, 58, 59, 59, 188, 188, 61, 61, 190, 62, 63, 63,
+        192, 192, 193, 65, 194, 194, 67, 67, 196, 196, 197, 69, 70, 70, 71, 71, 200, 200, 201, 201,
+        202, 202, 75, 75, 76, 76, 205, 77, 78, 78, 79, 79, 208, 208, 209, 81, 210, 210, 83, 83,
+        212, 212, 213, 213, 86, 86, 87, 87, 216, 216, 217, 89, 218, 218, 91, 91, 220, 220, 93, 93,
+        94, 94, 95, 95, 224, 224, 225, 225, 226, 226, 227, 99, 228, 228, 229, 229, 230, 230, 103,
+        103, 232, 232, 233, 233, 234, 234, 235, 107, 236, 236, 237, 237, 110, 110, 111, 111, 240,
+        240, 241, 241, 242, 242, 243, 243, 244, 244, 245, 245, 246, 246, 247, 119, 248, 248, 249,
+        249, 250, 250, 251, 251, 252, 252, 253, 253, 254, 254, 127, 127,
+    ),
+    9: (
+        256, 256, 1, 1, 2, 2, 3, 3, 4, 4, 5, 5, 6, 6, 7, 7, 8, 8, 9, 9, 10, 10, 11, 11, 12, 12, 13,
+        13, 14, 14, 15, 15, 272, 272, 17, 17, 18, 18, 19, 19, 20, 20, 21, 21, 22, 22, 23, 23, 280,
+        24, 25, 25, 26, 26, 27, 27, 28, 28, 29, 29, 30, 30, 31, 31, 288, 288, 289, 289, 290, 290,
+        35, 35, 36, 36, 37, 37, 38, 38, 39, 39, 296, 296, 41, 41, 42, 42, 43, 43, 300, 44, 45, 45,
+        46, 46, 47, 47, 304, 304, 305, 305, 50, 50, 51, 51, 308, 52, 53, 53, 54, 54, 55, 55, 312,
+        312, 57, 57, 58, 58, 59, 59, 316, 60, 61, 61, 62, 62, 63, 63, 320, 320, 321, 321, 322, 322,
+        67, 67, 324, 324, 69, 69, 326, 70, 71, 71, 328, 328, 329, 329, 74, 74, 75, 75, 332, 332,
+        77, 77, 334, 78, 79, 79, 336, 336, 337, 337, 338, 338, 83, 83, 340, 340, 85, 85, 342, 86,
+        87, 87, 344, 344, 345, 345, 90, 90, 91, 91, 348, 348, 93, 93, 350, 94, 95, 95, 352, 352,
+        353, 353, 354, 98, 355, 355, 356, 356, 101, 101, 358, 358, 103, 103, 360, 360, 361, 361,
+        362, 106, 107, 107, 364, 364, 109, 109, 366, 110, 111, 111, 368, 368, 369, 369, 370, 114,
+        371, 371, 372, 372, 117, 117, 374, 118, 119, 119, 376, 376, 377, 377, 378, 122, 123, 123,
+        380, 380, 125, 125, 382, 126, 127, 127, 384, 384, 385, 129, 386, 386, 131, 131, 388, 388,
+        389, 133, 134, 134, 135, 135, 392, 392, 393, 137, 394, 394, 139, 139, 140, 140, 397, 141,
+        142, 142, 143, 143, 400, 400, 401, 145, 402, 402, 147, 147, 404, 404, 405, 149, 150, 150,
+        151, 151, 408, 408, 153, 153, 410, 410, 155, 155, 156, 156, 413, 157, 158, 158, 159, 159,
+        416, 416, 417, 161, 418, 418, 163, 163, 420, 420, 421, 421, 166, 166, 167, 167, 424, 424,
+        425, 169, 426, 426, 171, 171, 428, 428, 173, 173, 174, 174, 175, 175, 432, 432, 433, 177,
+        434, 434, 179, 179, 436, 436, 437, 437, 182, 182, 183, 183, 440, 440, 441, 185, 442, 442,
+        187, 187, 444, 444, 189, 189, 190, 190, 191, 191, 448, 448, 449, 449, 450, 450, 451, 195,
+        452, 452, 453, 453, 454, 454, 199, 199, 456, 456, 457, 457, 458, 458, 459, 203, 460, 460,
+        461, 461, 206, 206, 207, 207, 464, 464, 465, 465, 466, 466, 467, 211, 468, 468, 469, 469,
+        470, 470, 215, 215, 472, 472, 473, 473, 474, 474, 475, 475, 476, 476, 221, 221, 222, 222,
+        223, 223, 480, 480, 481, 481, 482, 482, 483, 483, 484, 484, 485, 485, 486, 486, 487, 231,
+        488, 488, 489, 489, 490, 490, 491, 491, 492, 492, 493, 493, 494, 494, 239, 239, 496, 496,
+        497, 497, 498, 498, 499, 499, 500, 500, 501, 501, 502, 502, 503, 503, 504, 504, 505, 505,
+        506, 506, 507, 507, 508, 508, 509, 509, 510, 510, 255, 255,
+    ),
+    10: (
+        512, 512, 1, 1, 2, 2, 3, 3, 4, 4, 5, 5, 6, 6, 7, 7, 8, 8, 9, 9, 10, 10, 11, 11, 12, 12, 13,
+        13, 14, 14, 15, 15, 528, 16, 17, 17, 18, 18, 19, 19, 20, 20, 21, 21, 22, 22, 23, 23, 24,
+        24, 25, 25, 26, 26, 27, 27, 28, 28, 29, 29, 30, 30, 31, 31, 544, 544, 545, 545, 34, 34, 35,
+        35, 36, 36, 37, 37, 38, 38, 39, 39, 552, 40, 41, 41, 42, 42, 43, 43, 44, 44, 45, 45, 46,
+        46, 47, 47, 560, 560, 49, 49, 50, 50, 51, 51, 52, 52, 53, 53, 54, 54, 55, 55, 568, 56, 57,
+        57, 58, 58, 59, 59, 60, 60, 61, 61, 62, 62, 63, 63, 576, 576, 577, 577, 578, 578, 67, 67,
+        580, 580, 69, 69, 70, 70, 71, 71, 584, 584, 73, 73, 74, 74, 75, 75, 588, 76, 77, 77, 78,
+        78, 79, 79, 592, 592, 593, 593, 82, 82, 83, 83, 596, 84, 85, 85, 86, 86, 87, 87, 600, 600,
+        89, 89, 90, 90, 91, 91, 604, 92, 93, 93, 94, 94, 95, 95, 608, 608, 609, 609, 98, 98, 611,
+        611, 612, 100, 101, 101, 102, 102, 103, 103, 616, 616, 105, 105, 106, 106, 107, 107, 620,
+        108, 109, 109, 110, 110, 111, 111, 624, 624, 625, 625, 114, 114, 115, 115, 628, 116, 117,
+        117, 118, 118, 119, 119, 632, 632, 121, 121, 122, 122, 123, 123, 636, 124, 125, 125, 126,
+        126, 127, 127, 640, 640, 641, 641, 642, 642, 131, 131, 644, 644, 133, 133, 646, 134, 135,
+        135, 648, 648, 649, 649, 138, 138, 139, 139, 652, 652, 141, 141, 654, 142, 143, 143, 656,
+        656, 657, 657, 658, 658, 147, 147, 148, 148, 149, 149, 662, 150, 151, 151, 664, 664, 665,
+        665, 154, 154, 155, 155, 668, 668, 157, 157, 670, 158, 159, 159, 672, 672, 673, 673, 674,
+        674, 163, 163, 676, 676, 677, 677, 678, 166, 167, 167, 680, 680, 681, 681, 170, 170, 171,
+        171, 684, 684, 173, 173, 686, 174, 175, 175, 688, 688, 689, 689, 690, 690, 179, 179, 692,
+        692, 181, 181, 694, 182, 183, 183, 696, 696, 697, 697, 186, 186, 187, 187, 700, 700, 189,
+        189, 702, 190, 191, 191, 704, 704, 705, 705, 706, 194, 707, 707, 708, 708, 197, 197, 710,
+        710, 199, 199, 712, 712, 713, 713, 714, 202, 203, 203, 716, 716, 205, 205, 718, 206, 207,
+        207, 720, 720, 721, 721, 722, 210, 723, 723, 724, 724, 213, 213, 214, 214, 215, 215, 728,
+        728, 729, 729, 730, 218, 219, 219, 732, 732, 221, 221, 734, 222, 223, 223, 736, 736, 737,
+        737, 738, 226, 739, 739, 740, 740, 229, 229, 742, 230, 743, 743, 744, 744, 745, 745, 746,
+        234, 235, 235, 748, 748, 237, 237, 238, 238, 239, 239, 752, 752, 753, 753, 754, 242, 755,
+        755, 756, 756, 245, 245, 758, 246, 247, 247, 760, 760, 761, 761, 762, 250, 251, 251, 764,
+        764, 253, 253, 766, 254, 255, 255, 768, 768, 769, 257, 770, 770, 259, 259, 772, 772, 773,
+        261, 262, 262, 263, 263, 776, 776, 777, 265, 778, 778, 267, 267, 268, 268, 781, 269, 270,
+        270, 271, 271, 784, 784, 785, 785, 786, 786, 275, 275, 788, 788, 789, 277, 278, 278, 279,
+        279, 280, 280, 793, 281, 794, 794, 283, 283, 284, 284, 797, 285, 286, 286, 287, 287, 800,
+        800, 801, 289, 802, 802, 291, 291, 804, 804, 805, 293, 294, 294, 295, 295, 808, 808, 809,
+        809, 810, 810, 299, 299, 300, 300, 813, 301, 302, 302, 303, 303, 816, 816, 817, 305, 818,
+        818, 307, 307, 820, 820, 821, 309, 310, 310, 311, 311, 824, 824, 313, 313, 826, 826, 315,
+        315, 316, 316, 829, 317, 318, 318, 319, 319, 832, 832, 833, 321, 834, 834, 323, 323, 836,
+        836, 837, 837, 326, 326, 327, 327, 840, 840, 841, 329, 842, 842, 331, 331, 844, 844, 333,
+        333, 334, 334, 335, 335, 848, 848, 849, 337, 850, 850, 339, 339, 852, 852, 853, 853, 342,
+        342, 343, 343, 856, 856, 857, 345, 346, 346, 347, 347, 860, 860, 349, 349, 350, 350, 351,
+        351, 864, 864, 865, 353, 866, 866, 355, 355, 868, 868, 869, 869, 358, 358, 359, 359, 872,
+        872, 873, 361, 874, 874, 875, 875, 876, 876, 365, 365, 366, 366, 367, 367, 880, 880, 881,
+        369, 882, 882, 371, 371, 884, 884, 885, 885, 374, 374, 375, 375, 888, 888, 889, 377, 890,
+        890, 379, 379, 892, 892, 381, 381, 382, 382, 383, 383, 896, 896, 897, 897, 898, 898, 899,
+        387, 900, 900, 901, 901, 902, 902, 391, 391, 904, 904, 905, 905, 906, 906, 907, 395, 908,
+        908, 909, 909, 398, 398, 399, 399, 912, 912, 913, 913, 914, 914, 915, 403, 916, 916, 917,
+        917, 918, 918, 407, 407, 920, 920, 921, 921, 922, 922, 923, 411, 412, 412, 925, 925, 414,
+        414, 415, 415, 928, 928, 929, 929, 930, 930, 931, 419, 932, 932, 933, 933, 934, 934, 423,
+        423, 936, 936, 937, 937, 938, 938, 939, 427, 940, 940, 941, 941, 430, 430, 431, 431, 944,
+        944, 945, 945, 946, 946, 947, 435, 948, 948, 949, 949, 950, 950, 439, 439, 952, 952, 953,
+        953, 954, 954, 443, 443, 956, 956, 445, 445, 446, 446, 447, 447, 960, 960, 961, 961, 962,
+        962, 963, 963, 964, 964, 965, 965, 966, 966, 967, 455, 968, 968, 969, 969, 970, 970, 971,
+        971, 972, 972, 973, 973, 974, 974, 463, 463, 976, 976, 977, 977, 978, 978, 979, 979, 980,
+        980, 981, 981, 982, 982, 983, 471, 984, 984, 985, 985, 986, 986, 987, 987, 988, 988, 989,
+        989, 478, 478, 479, 479, 992, 992, 993, 993, 994, 994, 995, 995, 996, 996, 997, 997, 998,
+        998, 999, 999, 1000, 1000, 1001, 1001, 1002, 1002, 1003, 1003, 1004, 1004, 1005, 1005,
+        1006, 1006, 1007, 495, 1008, 1008, 1009, 1009, 1010, 1010, 1011, 1011, 1012, 1012, 1013,
+        1013, 1014, 1014, 1015, 1015, 1016, 1016, 1017, 1017, 1018, 1018, 1019, 1019, 1020, 1020,
+        1021, 1021, 1022, 1022, 511, 511,
+    ),
+}
+
+WIN_ODDS = {
+    1: (
+        (1, 1), (1, 1),
+    ),
+    2: (
+        (3, 1), (2, 2), (1, 1), (3, 1),
+    ),
+    3: (
+        (7, 1), (3, 1), (4, 2), (4, 2), (4, 2), (4, 2), (3, 1), (7, 1),
+    ),
+    4: (
+        (15, 1), (7, 1), (8, 4), (8, 4), (9, 5), (10, 4), (8, 4), (8, 4), (8, 4), (8, 4), (10, 4),
+        (9, 5), (8, 4), (8, 4), (7, 1), (15, 1),
+    ),
+    5: (
+        (31, 1), (15, 1), (16, 8), (16, 8), (16, 8), (16, 8), (16, 8), (16, 8), (17, 7), (17, 7),
+        (20, 6), (16, 6), (17, 9), (18, 8), (16, 8), (16, 8), (16, 8), (16, 8), (18, 8), (17, 9),
+        (16, 6), (20, 6), (17, 7), (17, 7), (16, 8), (16, 8), (16, 8), (16, 8), (16, 8), (16, 8),
+        (15, 1), (31, 1),
+    ),
+    6: (
+        (63, 1), (31, 1), (32, 16), (32, 16), (32, 16), (32, 16), (32, 16), (32, 16), (35, 17),
+        (36, 16), (32, 16), (32, 16), (32, 16), (32, 16), (32, 16), (32, 16), (33, 15), (33, 15),
+        (35, 15), (31, 15), (30, 12), (42, 12), (32, 16), (32, 16), (33, 15), (33, 15), (32, 14),
+        (36, 14), (33, 17), (34, 16), (32, 16), (32, 16), (32, 16), (32, 16), (34, 16), (33, 17),
+        (36, 14), (32, 14), (33, 15), (33, 15), (32, 16), (32, 16), (42, 12), (30, 12), (31, 15),
+        (35, 15), (33, 15), (33, 15), (32, 16), (32, 16), (32, 16), (32, 16), (32, 16), (32, 16),
+        (36, 16), (35, 17), (32, 16), (32, 16), (32, 16), (32, 16), (32, 16), (32, 16), (31, 1),
+        (63, 1),
+    ),
+    7: (
+        (127, 1), (63, 1), (64, 32), (64, 32), (64, 32), (64, 32), (64, 32), (64, 32), (64, 32),
+        (64, 32), (64, 32), (64, 32), (64, 32), (64, 32), (64, 32), (64, 32), (67, 29), (67, 29),
+        (72, 28), (64, 28), (64, 32), (64, 32), (64, 32), (64, 32), (67, 33), (68, 32), (64, 32),
+        (64, 32), (64, 32), (64, 32), (64, 32), (64, 32), (65, 31), (65, 31), (67, 31), (63, 31),
+        (73, 29), (61, 29), (64, 32), (64, 32), (65, 31), (65, 31), (84, 22), (64, 22), (65, 33),
+        (66, 32), (64, 32), (64, 32), (65, 31), (65, 31), (63, 31), (67, 31), (65, 33), (66, 32),
+        (72, 28), (64, 28), (65, 31), (65, 31), (64, 30), (68, 30), (65, 33), (66, 32), (64, 32),
+        (64, 32), (64, 32), (64, 32), (66, 32), (65, 33), (68, 30), (64, 30), (65, 31), (65, 31),
+        (64, 28), (72, 28), (66, 32), (65, 33), (67, 31), (63, 31), (65, 31), (65, 31), (64, 32),
+        (64, 32), (66, 32), (65, 33), (64, 22), (84, 22), (65, 31), (65, 31), (64, 32), (64, 32),
+        (61, 29), (73, 29), (63, 31), (67, 31), (65, 31), (65, 31), (64, 32), (64, 32), (64, 32),
+        (64, 32), (64, 32), (64, 32), (68, 32), (67, 33), (64, 32), (64, 32), (64, 32), (64, 32),
+        (64, 28), (72, 28), (67, 29), (67, 29), (64, 32), (64, 32), (64, 32), (64, 32), (64, 32),
+        (64, 32), (64, 32), (64, 32), (64, 32), (64, 32), (64, 32), (64, 32), (64, 32), (64, 32),
+        (63, 1), (127, 1),
+    ),
+    8: (
+        (255, 1), (127, 1), (128, 64), (128, 64), (128, 64), (128, 64), (128, 64), (128, 64),
+        (128, 64), (128, 64), (128, 64), (128, 64), (128, 64), (128, 64), (128, 64), (128, 64),
+        (135, 65), (136, 64), (128, 64), (128, 64), (128, 64), (128, 64), (128, 64), (128, 64),
+        (128, 64), (128, 64), (128, 64), (128, 64), (128, 64), (128, 64), (128, 64), (128, 64),
+        (131, 61), (131, 61), (135, 61), (127, 61), (144, 56), (128, 56), (128, 64), (128, 64),
+        (131, 65), (132, 64), (128, 64), (128, 64), (128, 64), (128, 64), (128, 64), (128, 64),
+        (131, 61), (131, 61), (128, 60), (136, 60), (128, 64), (128, 64), (128, 64), (128, 64),
+        (131, 65), (132, 64), (128, 64), (128, 64), (128, 64), (128, 64), (128, 64), (128, 64),
+        (129, 63), (129, 63), (131, 63), (127, 63), (137, 61), (125, 61), (128, 64), (128, 64),
+        (129, 55), (145, 55), (132, 62), (128, 62), (129, 65), (130, 64), (128, 64), (128, 64),
+        (129, 63), (129, 63), (131, 63), (127, 63), (126, 44), (170, 44), (128, 64), (128, 64),
+        (129, 63), (129, 63), (132, 62), (128, 62), (129, 65), (130, 64), (128, 64), (128, 64),
+        (129, 63), (129, 63), (127, 63), (131, 63), (129, 65), (130, 64), (135, 61), (127, 61),
+        (129, 63), (129, 63), (128, 62), (132, 62), (126, 56), (146, 56), (128, 64), (128, 64),
+        (129, 63), (129, 63), (127, 63), (131, 63), (129, 65), (130, 64), (128, 60), (136, 60),
+        (129, 63), (129, 63), (128, 62), (132, 62), (129, 65), (130, 64), (128, 64), (128, 64),
+        (128, 64), (128, 64), (130, 64), (129, 65), (132, 62), (128, 62), (129, 63), (129, 63),
+        (136, 60), (128, 60), (130, 64), (129, 65), (131, 63), (127, 63), (129, 63), (129, 63),
+        (128, 64), (128, 64), (146, 56), (126, 56), (132, 62), (128, 62), (129, 63), (129, 63),
+        (127, 61), (135, 61), (130, 64), (129, 65), (131, 63), (127, 63), (129, 63), (129, 63),
+        (128, 64), (128, 64), (130, 64), (129, 65), (128, 62), (132, 62), (129, 63), (129, 63),
+        (128, 64), (128, 64), (170, 44), (126, 44), (127, 63), (131, 63), (129, 63), (129, 63),
+        (128, 64), (128, 64), (130, 64), (129, 65), (128, 62), (132, 62), (145, 55), (129, 55),
+        (128, 64), (128, 64), (125, 61), (137, 61), (127, 63), (131, 63), (129, 63), (129, 63),
+        (128, 64), (128, 64), (128, 64), (128, 64), (128, 64), (128, 64), (132, 64), (131, 65),
+        (128, 64), (128, 64), (128, 64), (128, 64), (136, 60), (128, 60), (131, 61), (131, 61),
+        (128, 64), (128, 64), (128, 64), (128, 64), (128, 64), (128, 64), (132, 64), (131, 65),
+        (128, 64), (128, 64), (128, 56), (144, 56), (127, 61), (135, 61), (131, 61), (131, 61),
+        (128, 64), (128, 64), (128, 64), (128, 64), (128, 64), (128, 64), (128, 64), (128, 64),
+        (128, 64), (128, 64), (128, 64), (128, 64), (128, 64), (128, 64), (136, 64), (135, 65),
+        (128, 64), (128, 64), (128, 64), (128, 64), (128, 64), (128, 64), (128, 64), (128, 64),
+        (128, 64), (128, 64), (128, 64), (128, 64), (128, 64), (128, 64), (127, 1), (255, 1),
+    ),
+    9: (
+        (511, 1), (255, 1), (256, 128), (256, 128), (256, 128), (256, 128), (256, 128), (256, 128),
+        (256, 128), (256, 128), (256, 128), (256, 128), (256, 128), (256, 128), (256, 128),
+        (256, 128), (256, 128), (256, 128), (256, 128), (256, 128), (256, 128), (256, 128),
+        (256, 128), (256, 128), (256, 128), (256, 128), (256, 128), (256, 128), (256, 128),
+        (256, 128), (256, 128), (256, 128), (263, 121), (263, 121), (272, 120), (256, 120),
+        (256, 128), (256, 128), (256, 128), (256, 128), (256, 128), (256, 128), (256, 128),
+        (256, 128), (256, 128), (256, 128), (256, 128), (256, 128), (263, 129), (264, 128),
+        (256, 128), (256, 128), (256, 128), (256, 128), (256, 128), (256, 128), (256, 128),
+        (256, 128), (256, 128), (256, 128), (256, 128), (256, 128), (256, 128), (256, 128),
+        (259, 125), (259, 125), (263, 125), (255, 125), (271, 121), (255, 121), (256, 128),
+        (256, 128), (252, 112), (292, 112), (256, 128), (256, 128), (256, 128), (256, 128),
+        (256, 128), (256, 128), (259, 125), (259, 125), (264, 124), (256, 124), (256, 128),
+        (256, 128), (256, 128), (256, 128), (259, 129), (260, 128), (256, 128), (256, 128),
+        (256, 128), (256, 128), (256, 128), (256, 128), (259, 125), (259, 125), (255, 125),
+        (263, 125), (256, 128), (256, 128), (272, 120), (256, 120), (259, 129), (260, 128),
+        (256, 128), (256, 128), (256, 128), (256, 128), (256, 128), (256, 128), (259, 125),
+        (259, 125), (256, 124), (264, 124), (256, 128), (256, 128), (256, 128), (256, 128),
+        (259, 129), (260, 128), (256, 128), (256, 128), (256, 128), (256, 128), (256, 128),
+        (256, 128), (257, 127), (257, 127), (259, 127), (255, 127), (265, 125), (253, 125),
+        (256, 128), (256, 128), (273, 119), (257, 119), (260, 126), (256, 126), (257, 129),
+        (258, 128), (256, 128), (256, 128), (257, 127), (257, 127), (291, 111), (255, 111),
+        (262, 124), (258, 124), (256, 128), (256, 128), (257, 127), (257, 127), (260, 126),
+        (256, 126), (257, 129), (258, 128), (256, 128), (256, 128), (257, 127), (257, 127),
+        (259, 127), (255, 127), (257, 125), (261, 125), (256, 128), (256, 128), (257, 127),
+        (257, 127), (340, 86), (256, 86), (257, 129), (258, 128), (256, 128), (256, 128),
+        (257, 127), (257, 127), (259, 127), (255, 127), (254, 124), (266, 124), (256, 128),
+        (256, 128), (257, 127), (257, 127), (260, 126), (256, 126), (257, 129), (258, 128),
+        (256, 128), (256, 128), (257, 127), (257, 127), (255, 127), (259, 127), (257, 129),
+        (258, 128), (263, 125), (255, 125), (257, 127), (257, 127), (256, 126), (260, 126),
+        (273, 121), (253, 121), (256, 128), (256, 128), (257, 127), (257, 127), (255, 127),
+        (259, 127), (257, 129), (258, 128), (264, 124), (256, 124), (257, 127), (257, 127),
+        (256, 110), (292, 110), (257, 129), (258, 128), (256, 128), (256, 128), (257, 127),
+        (257, 127), (255, 127), (259, 127), (257, 129), (258, 128), (255, 125), (263, 125),
+        (257, 127), (257, 127), (256, 126), (260, 126), (257, 129), (258, 128), (272, 120),
+        (256, 120), (257, 127), (257, 127), (255, 127), (259, 127), (257, 129), (258, 128),
+        (256, 124), (264, 124), (257, 127), (257, 127), (256, 126), (260, 126), (257, 129),
+        (258, 128), (256, 128), (256, 128), (256, 128), (256, 128), (258, 128), (257, 129),
+        (260, 126), (256, 126), (257, 127), (257, 127), (264, 124), (256, 124), (258, 128),
+        (257, 129), (259, 127), (255, 127), (257, 127), (257, 127), (256, 120), (272, 120),
+        (258, 128), (257, 129), (260, 126), (256, 126), (257, 127), (257, 127), (263, 125),
+        (255, 125), (258, 128), (257, 129), (259, 127), (255, 127), (257, 127), (257, 127),
+        (256, 128), (256, 128), (258, 128), (257, 129), (292, 110), (256, 110), (257, 127),
+        (257, 127), (256, 124), (264, 124), (258, 128), (257, 129), (259, 127), (255, 127),
+        (257, 127), (257, 127), (256, 128), (256, 128), (253, 121), (273, 121), (260, 126),
+        (256, 126), (257, 127), (257, 127), (255, 125), (263, 125), (258, 128), (257, 129),
+        (259, 127), (255, 127), (257, 127), (257, 127), (256, 128), (256, 128), (258, 128),
+        (257, 129), (256, 126), (260, 126), (257, 127), (257, 127), (256, 128), (256, 128),
+        (266, 124), (254, 124), (255, 127), (259, 127), (257, 127), (257, 127), (256, 128),
+        (256, 128), (258, 128), (257, 129), (256, 86), (340, 86), (257, 127), (257, 127),
+        (256, 128), (256, 128), (261, 125), (257, 125), (255, 127), (259, 127), (257, 127),
+        (257, 127), (256, 128), (256, 128), (258, 128), (257, 129), (256, 126), (260, 126),
+        (257, 127), (257, 127), (256, 128), (256, 128), (258, 124), (262, 124), (255, 111),
+        (291, 111), (257, 127), (257, 127), (256, 128), (256, 128), (258, 128), (257, 129),
+        (256, 126), (260, 126), (257, 119), (273, 119), (256, 128), (256, 128), (253, 125),
+        (265, 125), (255, 127), (259, 127), (257, 127), (257, 127), (256, 128), (256, 128),
+        (256, 128), (256, 128), (256, 128), (256, 128), (260, 128), (259, 129), (256, 128),
+        (256, 128), (256, 128), (256, 128), (264, 124), (256, 124), (259, 125), (259, 125),
+        (256, 128), (256, 128), (256, 128), (256, 128), (256, 128), (256, 128), (260, 128),
+        (259, 129), (256, 120), (272, 120), (256, 128), (256, 128), (263, 125), (255, 125),
+        (259, 125), (259, 125), (256, 128), (256, 128), (256, 128), (256, 128), (256, 128),
+        (256, 128), (260, 128), (259, 129), (256, 128), (256, 128), (256, 128), (256, 128),
+        (256, 124), (264, 124), (259, 125), (259, 125), (256, 128), (256, 128), (256, 128),
+        (256, 128), (256, 128), (256, 128), (292, 112), (252, 112), (256, 128), (256, 128),
+        (255, 121), (271, 121), (255, 125), (263, 125), (259, 125), (259, 125), (256, 128),
+        (256, 128), (256, 128), (256, 128), (256, 128), (256, 128), (256, 128), (256, 128),
+        (256, 128), (256, 128), (256, 128), (256, 128), (256, 128), (256, 128), (264, 128),
+        (263, 129), (256, 128), (256, 128), (256, 128), (256, 128), (256, 128), (256, 128),
+        (256, 128), (256, 128), (256, 128), (256, 128), (256, 128), (256, 128), (256, 120),
+        (272, 120), (263, 121), (263, 121), (256, 128), (256, 128), (256, 128), (256, 128),
+        (256, 128), (256, 128), (256, 128), (256, 128), (256, 128), (256, 128), (256, 128),
+        (256, 128), (256, 128), (256, 128), (256, 128), (256, 128), (256, 128), (256, 128),
+        (256, 128), (256, 128), (256, 128), (256, 128), (256, 128), (256, 128), (256, 128),
+        (256, 128), (256, 128), (256, 128), (256, 128), (256, 128), (255, 1), (511, 1),
+    ),
+    10: (
+        (1023, 1), (511, 1), (512, 256), (512, 256), (512, 256), (512, 256), (512, 256),
+        (512, 256), (512, 256), (512, 256), (512, 256), (512, 256), (512, 256), (512, 256),
+        (512, 256), (512, 256), (512, 256), (512, 256), (512, 256), (512, 256), (512, 256),
+        (512, 256), (512, 256), (512, 256), (512, 256), (512, 256), (512, 256), (512, 256),
+        (512, 256), (512, 256), (512, 256), (512, 256), (527, 257), (528, 256), (512, 256),
+        (512, 256), (512, 256), (512, 256), (512, 256), (512, 256), (512, 256), (512, 256),
+        (512, 256), (512, 256), (512, 256), (512, 256), (512, 256), (512, 256), (512, 256),
+        (512, 256), (512, 256), (512, 256), (512, 256), (512, 256), (512, 256), (512, 256),
+        (512, 256), (512, 256), (512, 256), (512, 256), (512, 256), (512, 256), (512, 256),
+        (512, 256), (519, 249), (519, 249), (527, 249), (511, 249), (544, 240), (512, 240),
+        (512, 256), (512, 256), (512, 256), (512, 256), (512, 256), (512, 256), (512, 256),
+        (512, 256), (512, 256), (512, 256), (519, 257), (520, 256), (512, 256), (512, 256),
+        (512, 256), (512, 256), (512, 256), (512, 256), (512, 256), (512, 256), (512, 256),
+        (512, 256), (512, 256), (512, 256), (512, 256), (512, 256), (519, 249), (519, 249),
+        (512, 248), (528, 248), (512, 256), (512, 256), (512, 256), (512, 256), (512, 256),
+        (512, 256), (512, 256), (512, 256), (512, 256), (512, 256), (512, 256), (512, 256),
+        (519, 257), (520, 256), (512, 256), (512, 256), (512, 256), (512, 256), (512, 256),
+        (512, 256), (512, 256), (512, 256), (512, 256), (512, 256), (512, 256), (512, 256),
+        (512, 256), (512, 256), (515, 253), (515, 253), (519, 253), (511, 253), (527, 249),
+        (511, 249), (512, 256), (512, 256), (547, 241), (507, 241), (512, 256), (512, 256),
+        (512, 256), (512, 256), (512, 256), (512, 256), (515, 253), (515, 253), (584, 220),
+        (512, 220), (512, 256), (512, 256), (512, 256), (512, 256), (515, 257), (516, 256),
+        (512, 256), (512, 256), (512, 256), (512, 256), (512, 256), (512, 256), (515, 253),
+        (515, 253), (519, 253), (511, 253), (512, 248), (528, 248), (512, 256), (512, 256),
+        (515, 257), (516, 256), (512, 256), (512, 256), (512, 256), (512, 256), (512, 256),
+        (512, 256), (515, 253), (515, 253), (520, 252), (512, 252), (512, 256), (512, 256),
+        (512, 256), (512, 256), (515, 257), (516, 256), (512, 256), (512, 256), (512, 256),
+        (512, 256), (512, 256), (512, 256), (515, 253), (515, 253), (511, 253), (519, 253),
+        (512, 256), (512, 256), (527, 249), (511, 249), (515, 257), (516, 256), (512, 256),
+        (512, 256), (544, 240), (512, 240), (512, 256), (512, 256), (515, 253), (515, 253),
+        (512, 252), (520, 252), (512, 256), (512, 256), (512, 256), (512, 256), (515, 257),
+        (516, 256), (512, 256), (512, 256), (512, 256), (512, 256), (512, 256), (512, 256),
+        (515, 253), (515, 253), (511, 253), (519, 253), (512, 256), (512, 256), (512, 248),
+        (528, 248), (515, 257), (516, 256), (512, 256), (512, 256), (512, 256), (512, 256),
+        (512, 256), (512, 256), (515, 253), (515, 253), (512, 252), (520, 252), (512, 256),
+        (512, 256), (512, 256), (512, 256), (515, 257), (516, 256), (512, 256), (512, 256),
+        (512, 256), (512, 256), (512, 256), (512, 256), (513, 255), (513, 255), (515, 255),
+        (511, 255), (521, 253), (509, 253), (512, 256), (512, 256), (529, 247), (513, 247),
+        (516, 254), (512, 254), (513, 257), (514, 256), (512, 256), (512, 256), (513, 239),
+        (545, 239), (515, 255), (511, 255), (518, 252), (514, 252), (512, 256), (512, 256),
+        (513, 255), (513, 255), (516, 254), (512, 254), (513, 257), (514, 256), (512, 256),
+        (512, 256), (513, 255), (513, 255), (515, 255), (511, 255), (585, 221), (509, 221),
+        (512, 256), (512, 256), (510, 250), (526, 250), (516, 254), (512, 254), (513, 257),
+        (514, 256), (512, 256), (512, 256), (513, 255), (513, 255), (515, 255), (511, 255),
+        (518, 252), (514, 252), (512, 256), (512, 256), (513, 255), (513, 255), (516, 254),
+        (512, 254), (513, 257), (514, 256), (512, 256), (512, 256), (513, 255), (513, 255),
+        (515, 255), (511, 255), (513, 253), (517, 253), (512, 256), (512, 256), (513, 255),
+        (513, 255), (523, 251), (511, 251), (513, 257), (514, 256), (512, 256), (512, 256),
+        (513, 255), (513, 255), (515, 255), (511, 255), (510, 172), (682, 172), (512, 256),
+        (512, 256), (513, 255), (513, 255), (516, 254), (512, 254), (513, 257), (514, 256),
+        (512, 256), (512, 256), (513, 255), (513, 255), (515, 255), (511, 255), (513, 253),
+        (517, 253), (512, 256), (512, 256), (513, 255), (513, 255), (516, 246), (528, 246),
+        (513, 257), (514, 256), (512, 256), (512, 256), (513, 255), (513, 255), (515, 255),
+        (511, 255), (510, 252), (522, 252), (512, 256), (512, 256), (513, 255), (513, 255),
+        (516, 254), (512, 254), (513, 257), (514, 256), (512, 256), (512, 256), (513, 255),
+        (513, 255), (511, 255), (515, 255), (513, 257), (514, 256), (519, 253), (511, 253),
+        (513, 255), (513, 255), (512, 254), (516, 254), (529, 249), (509, 249), (512, 256),
+        (512, 256), (513, 255), (513, 255), (511, 255), (515, 255), (513, 257), (514, 256),
+        (520, 252), (512, 252), (513, 239), (545, 239), (512, 254), (516, 254), (513, 257),
+        (514, 256), (512, 256), (512, 256), (513, 255), (513, 255), (511, 255), (515, 255),
+        (513, 257), (514, 256), (519, 253), (511, 253), (513, 255), (513, 255), (512, 254),
+        (516, 254), (510, 248), (530, 248), (512, 256), (512, 256), (513, 255), (513, 255),
+        (511, 255), (515, 255), (513, 257), (514, 256), (584, 220), (512, 220), (513, 255),
+        (513, 255), (512, 254), (516, 254), (513, 257), (514, 256), (512, 256), (512, 256),
+        (513, 255), (513, 255), (511, 255), (515, 255), (513, 257), (514, 256), (511, 253),
+        (519, 253), (513, 255), (513, 255), (512, 254), (516, 254), (513, 257), (514, 256),
+        (527, 249), (511, 249), (513, 255), (513, 255), (511, 255), (515, 255), (513, 257),
+        (514, 256), (512, 252), (520, 252), (513, 255), (513, 255), (512, 254), (516, 254),
+        (510, 240), (546, 240), (512, 256), (512, 256), (513, 255), (513, 255), (511, 255),
+        (515, 255), (513, 257), (514, 256), (511, 253), (519, 253), (513, 255), (513, 255),
+        (512, 254), (516, 254), (513, 257), (514, 256), (512, 248), (528, 248), (513, 255),
+        (513, 255), (511, 255), (515, 255), (513, 257), (514, 256), (512, 252), (520, 252),
+        (513, 255), (513, 255), (512, 254), (516, 254), (513, 257), (514, 256), (512, 256),
+        (512, 256), (512, 256), (512, 256), (514, 256), (513, 257), (516, 254), (512, 254),
+        (513, 255), (513, 255), (520, 252), (512, 252), (514, 256), (513, 257), (515, 255),
+        (511, 255), (513, 255), (513, 255), (528, 248), (512, 248), (514, 256), (513, 257),
+        (516, 254), (512, 254), (513, 255), (513, 255), (519, 253), (511, 253), (514, 256),
+        (513, 257), (515, 255), (511, 255), (513, 255), (513, 255), (512, 256), (512, 256),
+        (546, 240), (510, 240), (516, 254), (512, 254), (513, 255), (513, 255), (520, 252),
+        (512, 252), (514, 256), (513, 257), (515, 255), (511, 255), (513, 255), (513, 255),
+        (511, 249), (527, 249), (514, 256), (513, 257), (516, 254), (512, 254), (513, 255),
+        (513, 255), (519, 253), (511, 253), (514, 256), (513, 257), (515, 255), (511, 255),
+        (513, 255), (513, 255), (512, 256), (512, 256), (514, 256), (513, 257), (516, 254),
+        (512, 254), (513, 255), (513, 255), (512, 220), (584, 220), (514, 256), (513, 257),
+        (515, 255), (511, 255), (513, 255), (513, 255), (512, 256), (512, 256), (530, 248),
+        (510, 248), (516, 254), (512, 254), (513, 255), (513, 255), (511, 253), (519, 253),
+        (514, 256), (513, 257), (515, 255), (511, 255), (513, 255), (513, 255), (512, 256),
+        (512, 256), (514, 256), (513, 257), (516, 254), (512, 254), (545, 239), (513, 239),
+        (512, 252), (520, 252), (514, 256), (513, 257), (515, 255), (511, 255), (513, 255),
+        (513, 255), (512, 256), (512, 256), (509, 249), (529, 249), (516, 254), (512, 254),
+        (513, 255), (513, 255), (511, 253), (519, 253), (514, 256), (513, 257), (515, 255),
+        (511, 255), (513, 255), (513, 255), (512, 256), (512, 256), (514, 256), (513, 257),
+        (512, 254), (516, 254), (513, 255), (513, 255), (512, 256), (512, 256), (522, 252),
+        (510, 252), (511, 255), (515, 255), (513, 255), (513, 255), (512, 256), (512, 256),
+        (514, 256), (513, 257), (528, 246), (516, 246), (513, 255), (513, 255), (512, 256),
+        (512, 256), (517, 253), (513, 253), (511, 255), (515, 255), (513, 255), (513, 255),
+        (512, 256), (512, 256), (514, 256), (513, 257), (512, 254), (516, 254), (513, 255),
+        (513, 255), (512, 256), (512, 256), (682, 172), (510, 172), (511, 255), (515, 255),
+        (513, 255), (513, 255), (512, 256), (512, 256), (514, 256), (513, 257), (511, 251),
+        (523, 251), (513, 255), (513, 255), (512, 256), (512, 256), (517, 253), (513, 253),
+        (511, 255), (515, 255), (513, 255), (513, 255), (512, 256), (512, 256), (514, 256),
+        (513, 257), (512, 254), (516, 254), (513, 255), (513, 255), (512, 256), (512, 256),
+        (514, 252), (518, 252), (511, 255), (515, 255), (513, 255), (513, 255), (512, 256),
+        (512, 256), (514, 256), (513, 257), (512, 254), (516, 254), (526, 250), (510, 250),
+        (512, 256), (512, 256), (509, 221), (585, 221), (511, 255), (515, 255), (513, 255),
+        (513, 255), (512, 256), (512, 256), (514, 256), (513, 257), (512, 254), (516, 254),
+        (513, 255), (513, 255), (512, 256), (512, 256), (514, 252), (518, 252), (511, 255),
+        (515, 255), (545, 239), (513, 239), (512, 256), (512, 256), (514, 256), (513, 257),
+        (512, 254), (516, 254), (513, 247), (529, 247), (512, 256), (512, 256), (509, 253),
+        (521, 253), (511, 255), (515, 255), (513, 255), (513, 255), (512, 256), (512, 256),
+        (512, 256), (512, 256), (512, 256), (512, 256), (516, 256), (515, 257), (512, 256),
+        (512, 256), (512, 256), (512, 256), (520, 252), (512, 252), (515, 253), (515, 253),
+        (512, 256), (512, 256), (512, 256), (512, 256), (512, 256), (512, 256), (516, 256),
+        (515, 257), (528, 248), (512, 248), (512, 256), (512, 256), (519, 253), (511, 253),
+        (515, 253), (515, 253), (512, 256), (512, 256), (512, 256), (512, 256), (512, 256),
+        (512, 256), (516, 256), (515, 257), (512, 256), (512, 256), (512, 256), (512, 256),
+        (520, 252), (512, 252), (515, 253), (515, 253), (512, 256), (512, 256), (512, 240),
+        (544, 240), (512, 256), (512, 256), (516, 256), (515, 257), (511, 249), (527, 249),
+        (512, 256), (512, 256), (519, 253), (511, 253), (515, 253), (515, 253), (512, 256),
+        (512, 256), (512, 256), (512, 256), (512, 256), (512, 256), (516, 256), (515, 257),
+        (512, 256), (512, 256), (512, 256), (512, 256), (512, 252), (520, 252), (515, 253),
+        (515, 253), (512, 256), (512, 256), (512, 256), (512, 256), (512, 256), (512, 256),
+        (516, 256), (515, 257), (512, 256), (512, 256), (528, 248), (512, 248), (511, 253),
+        (519, 253), (515, 253), (515, 253), (512, 256), (512, 256), (512, 256), (512, 256),
+        (512, 256), (512, 256), (516, 256), (515, 257), (512, 256), (512, 256), (512, 256),
+        (512, 256), (512, 220), (584, 220), (515, 253), (515, 253), (512, 256), (512, 256),
+        (512, 256), (512, 256), (512, 256), (512, 256), (507, 241), (547, 241), (512, 256),
+        (512, 256), (511, 249), (527, 249), (511, 253), (519, 253), (515, 253), (515, 253),
+        (512, 256), (512, 256), (512, 256), (512, 256), (512, 256), (512, 256), (512, 256),
+        (512, 256), (512, 256), (512, 256), (512, 256), (512, 256), (512, 256), (512, 256),
+        (520, 256), (519, 257), (512, 256), (512, 256), (512, 256), (512, 256), (512, 256),
+        (512, 256), (512, 256), (512, 256), (512, 256), (512, 256), (512, 256), (512, 256),
+        (528, 248), (512, 248), (519, 249), (519, 249), (512, 256), (512, 256), (512, 256),
+        (512, 256), (512, 256), (512, 256), (512, 256), (512, 256), (512, 256), (512, 256),
+        (512, 256), (512, 256), (512, 256), (512, 256), (520, 256), (519, 257), (512, 256),
+        (512, 256), (512, 256), (512, 256), (512, 256), (512, 256), (512, 256), (512, 256),
+        (512, 256), (512, 256), (512, 240), (544, 240), (511, 249), (527, 249), (519, 249),
+        (519, 249), (512, 256), (512, 256), (512, 256), (512, 256), (512, 256), (512, 256),
+        (512, 256), (512, 256), (512, 256), (512, 256), (512, 256), (512, 256), (512, 256),
+        (512, 256), (512, 256), (512, 256), (512, 256), (512, 256), (512, 256), (512, 256),
+        (512, 256), (512, 256), (512, 256), (512, 256), (512, 256), (512, 256), (512, 256),
+        (512, 256), (512, 256), (512, 256), (528, 256), (527, 257), (512, 256), (512, 256),
+        (512, 256), (512, 256), (512, 256), (512, 256), (512, 256), (512, 256), (512, 256),
+        (512, 256), (512, 256), (512, 256), (512, 256), (512, 256), (512, 256), (512, 256),
+        (512, 256), (512, 256), (512, 256), (512, 256), (512, 256), (512, 256), (512, 256),
+        (512, 256), (512, 256), (512, 256), (512, 256), (512, 256), (512, 256), (512, 256),
+        (511, 1), (1023, 1),
+    ),
+}
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+미리 계산된 최적 응답 테이블
+패턴의 정수 코드(H=0, T=1)로 인덱싱하여 최적 응답과 정확한 승률을 O(1)에 조회
+"""
+
+import os
+from fractions import Fraction
+from functools import lru_cache
+
+import numpy as np
+
+from exact_probability import win_odds_array, win_probability_array
+from pattern_automaton import all_patterns, encode_sequence
+
+# 한 번에 계산하는 (상대 × 후보) 블록의 최대 원소 수
+BLOCK_ELEMENTS = 1 << 22
+
+
+class ResponseTable:
+    """길이 k 패턴에 대한 컴파일된 최적 응답 테이블
+
+    responses[code] -> 최적 응답 패턴의 코드
+    win_odds[code] -> (응답 승리, 상대 승리) 정수 비율 (공정한 동전에서만, 정확한 승률)
+    win_probabilities[code] -> 응답의 승률 (float)
+    p_heads는 동전 앞면 확률 (기본 0.5)
+    """
+
+    def __init__(self, k=3, p_heads=0.5):
+        self.k = k
+        self.p_heads = p_heads
+        self.size = 1 << k
+        self.sequences = all_patterns(k)
+
+        candidates = np.arange(self.size, dtype=np.int64)
+        responses = np.empty(self.size, dtype=np.int64)
+        probabilities = np.empty(self.size)
+        response_odds = np.empty(self.size, dtype=np.int64)
+        opponent_odds = np.empty(self.size, dtype=np.int64)
+        fair = p_heads == 0.5
+
+        # 상대 패턴을 블록 단위로 나누어 모든 후보 응답과의 승률을 한 번에 계산
+        rows = max(1, BLOCK_ELEMENTS // self.size)
+        for start in range(0, self.size, rows):
+            opponents = candidates[start:start + rows]
+            block = np.arange(opponents.size)
+            if fair:
+                odds2, odds1 = win_odds_array(opponents[:, None], candidates[None, :], k)
+                matrix = odds2 / (odds2 + odds1)
+            else:
+                matrix = win_probability_array(opponents[:, None], candidates[None, :], k, p_heads)
+            best = np.argmax(matrix, axis=1)
+            responses[start:start + rows] = best
+            probabilities[start:start + rows] = matrix[block, best]
+            if fair:
+                response_odds[start:start + rows] = odds2[block, best]
+                opponent_odds[start:start + rows] = odds1[block, best]
+
+        self.responses = responses
+        self.win_probabilities = probabilities
+        self.win_odds = np.stack([response_odds, opponent_odds], axis=1) if fair else None
+
+        # 문자열 기반 조회용 사전 (한 번만 생성)
+        self.strategy = {seq: self.sequences[r] for seq, r in zip(self.sequences, responses)}
+
+    def lookup(self, codes):
+        """상대 코드 배열에 대한 (응답 코드 배열, 승률 배열)을 한 번의 gather로 반환"""
+        codes = np.asarray(codes)
+        return np.take(self.responses, codes), np.take(self.win_probabilities, codes)
+
+    def respond(self, sequence):
+        """상대 배열 문자열에 대한 최적 응답 문자열"""
+        return self.sequences[self.responses[self._code(sequence)]]
+
+    def win_probability(self, sequence):
+        """상대 배열에 대한 최적 응답의 승률 (공정한 동전은 정확한 Fraction, 그 외 float)"""
+        code = self._code(sequence)
+        if self.win_odds is None:
+            return float(self.win_probabilities[code])
+        response_odds, opponent_odds = self.win_odds[code]
+        return Fraction(int(response_odds), int(response_odds + opponent_odds))
+
+    def _code(self, sequence):
+        if len(sequence) != self.k:
+            raise ValueError(f"Invalid sequence: {sequence}")
+        return encode_sequence(sequence)
+
+
+@lru_cache(maxsize=None)
+def get_response_table(k=3, p_heads=0.5):
+    """(k, p_heads)별 응답 테이블을 한 번만 컴파일하여 재사용"""
+    return ResponseTable(k, p_heads)
+
+
+def bias_sweep(k, p_grid):
+    """여러 앞면 확률에 대한 최적 응답 테이블과 승률을 한 번에 계산
+
+    반환: (responses, win_probabilities), 모양은 (len(p_grid), 2^k)
+    """
+    p_grid = np.asarray(p_grid, dtype=np.float64)
+    size = 1 << k
+    codes = np.arange(size, dtype=np.int64)
+
+    # p와 무관한 부분(겹침 여부, 접두사의 뒷면 수)은 한 번만 계산
+    overlaps = np.empty((k, size, size), dtype=bool)
+    tails = np.empty((k, size), dtype=np.int64)
+    for m in range(1, k + 1):
+        prefix = codes >> (k - m)
+        overlaps[m - 1] = (codes[:, None] & ((1 << m) - 1)) == prefix[None, :]
+        tails[m - 1] = [bin(int(x)).count('1') for x in prefix]
+    lengths = np.arange(1, k + 1)[:, None]
+    overlap_weights = overlaps.astype(np.float64)
+
+    responses = np.empty((p_grid.size, size), dtype=np.int64)
+    probabilities = np.empty((p_grid.size, size))
+
+    # p 격자를 블록 단위로 나누어 (p, 상대, 후보) 텐서의 메모리 제한
+    rows = max(1, BLOCK_ELEMENTS // (size * size))
+    for start in range(0, p_grid.size, rows):
+        p = p_grid[start:start + rows, None, None]
+        # 1 / P(후보의 앞 m개) : 모양 (p, m, 후보)
+        inverse_prefix = p ** -(lengths - tails) * (1 - p) ** -tails
+        # corr[p, a, b] = sum_m overlaps[m, a, b] / P(b의 앞 m개)
+        corr = np.einsum('mab,pmb->pab', overlap_weights, inverse_prefix)
+        self_corr = np.einsum('paa->pa', corr)
+
+        seq2_odds = self_corr[:, :, None] - corr
+        seq1_odds = self_corr[:, None, :] - np.swapaxes(corr, 1, 2)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            matrix = seq2_odds / (seq2_odds + seq1_odds)
+        matrix[:, codes, codes] = 0.5
+
+        best = np.argmax(matrix, axis=2)
+        responses[start:start + rows] = best
+        probabilities[start:start + rows] = np.take_along_axis(matrix, best[:, :, None], axis=2)[:, :, 0]
+
+    return responses, probabilities
+
+
+RESPONSE_DATA_PATH = os.path.join(os.path.dirname(__file__), 'response_data.py')
+
+
+def _format_tuple(values, indent=8, width=100):
+    """정수(또는 정수 쌍) 튜플을 width 폭에 맞춰 여러 줄로 출력"""
+    lines = []
+    line = ' ' * indent
+    for value in values:
+        item = f"{value}, "
+        if len(line) + len(item) > width:
+            lines.append(line.rstrip())
+            line = ' ' * indent
+        line += item
+    lines.append(line.rstrip())
+    return '(\n' + '\n'.join(lines) + '\n    )'
+
+
+def generate_response_data(path=RESPONSE_DATA_PATH, max_k=10):
+    """k = 1..max_k 의 최적 응답 테이블을 numpy 없이 불러올 수 있는 파이썬 모듈로 저장
+
+    penney CLI의 조회 경로는 이 모듈만 불러오므로 빠르게 시작한다.
+    """
+    lines = [
+        '#!/usr/bin/env python3',
+        '# -*- coding: utf-8 -*-',
+        '"""',
+        '미리 계산된 최적 응답 테이블 (자동 생성: response_table.generate_response_data)',
+        'RESPONSES[k][code] -> 최적 응답 코드, WIN_ODDS[k][code] -> (응답 승리, 상대 승리) 정수 비율',
+        '"""',
+        '',
+        f'MAX_K = {max_k}',
+        '',
+        'RESPONSES = {',
+    ]
+    tables = [get_response_table(k) for k in range(1, max_k + 1)]
+    for table in tables:
+        lines.append(f'    {table.k}: {_format_tuple(table.responses.tolist())},')
+    lines += ['}', '', 'WIN_ODDS = {']
+    for table in tables:
+        odds = [tuple(pair) for pair in table.win_odds.tolist()]
+        lines.append(f'    {table.k}: {_format_tuple(odds)},')
+    lines += ['}', '']
+
+    with open(path, 'w') as f:
+        f.write('\n'.join(lines))
+
+
+if __name__ == "__main__":
+    generate_response_data()
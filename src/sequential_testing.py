@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+순차적 조기 종료 평가
+게임을 청크 단위로 진행하면서 신뢰 구간(Wilson, Clopper–Pearson) 또는 SPRT로
+결론이 나는 즉시 중단하여 필요한 시뮬레이션 수를 줄임
+"""
+
+import math
+from statistics import NormalDist
+
+INTERVAL_METHODS = ('wilson', 'clopper-pearson')
+
+
+def wilson_interval(wins, games, confidence=0.95):
+    """Wilson 점수 신뢰 구간"""
+    if games == 0:
+        return 0.0, 1.0
+
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    p = wins / games
+    denominator = 1 + z * z / games
+    center = (p + z * z / (2 * games)) / denominator
+    margin = z * math.sqrt(p * (1 - p) / games + z * z / (4 * games * games)) / denominator
+    return max(0.0, center - margin), min(1.0, center + margin)
+
+
+def clopper_pearson_interval(wins, games, confidence=0.95):
+    """Clopper–Pearson 정확 신뢰 구간 (베타 분포 분위수)"""
+    from scipy import stats
+
+    if games == 0:
+        return 0.0, 1.0
+
+    alpha = 1 - confidence
+    lower = stats.beta.ppf(alpha / 2, wins, games - wins + 1) if wins > 0 else 0.0
+    upper = stats.beta.ppf(1 - alpha / 2, wins + 1, games - wins) if wins < games else 1.0
+    return float(lower), float(upper)
+
+
+def confidence_interval(wins, games, confidence=0.95, method='wilson'):
+    """지정한 방법으로 신뢰 구간 계산"""
+    if method == 'wilson':
+        return wilson_interval(wins, games, confidence)
+    if method == 'clopper-pearson':
+        return clopper_pearson_interval(wins, games, confidence)
+    raise ValueError(f"Unknown interval method: {method}")
+
+
+def sprt_log_likelihood_ratio(wins, games, p0, p1):
+    """H1: p = p1 대 H0: p = p0 의 로그 우도비"""
+    return (wins * math.log(p1 / p0)
+            + (games - wins) * math.log((1 - p1) / (1 - p0)))
+
+
+def _look_confidence(confidence, look):
+    """look번째 중간 점검의 신뢰수준 (alpha / 2^look 으로 나누어 전체 오류율 유지)"""
+    return 1 - (1 - confidence) / 2 ** look
+
+
+def sequential_estimate(sample, threshold=0.5, confidence=0.95, method='wilson',
+                        delta=0.01, initial_chunk=1000, max_games=1000000):
+    """승률이 threshold보다 큰지 작은지 결정될 때까지 게임을 청크 단위로 진행
+
+    sample(n)은 n게임을 진행하여 승리 횟수를 반환하는 함수.
+    method가 'sprt'이면 p0 = threshold - delta, p1 = threshold + delta 의
+    Wald 순차 확률비 검정을 사용하고, 그 외에는 신뢰 구간이 threshold를
+    벗어날 때 중단한다. 청크 크기는 매번 두 배로 늘린다.
+    반환: dict(win_rate, ci_lower, ci_upper, games, decision)
+    decision은 1(threshold 초과), -1(미만), 0(max_games 도달 시 미결정)
+    """
+    if method != 'sprt' and method not in INTERVAL_METHODS:
+        raise ValueError(f"Unknown method: {method}")
+
+    alpha = 1 - confidence
+    wins = 0
+    games = 0
+    chunk = initial_chunk
+    look = 0
+    decision = 0
+
+    while games < max_games:
+        batch = min(chunk, max_games - games)
+        wins += sample(batch)
+        games += batch
+        chunk *= 2
+        look += 1
+
+        if method == 'sprt':
+            llr = sprt_log_likelihood_ratio(wins, games, threshold - delta, threshold + delta)
+            if llr >= math.log((1 - alpha) / alpha):
+                decision = 1
+            elif llr <= math.log(alpha / (1 - alpha)):
+                decision = -1
+        else:
+            lower, upper = confidence_interval(wins, games, _look_confidence(confidence, look), method)
+            if lower > threshold:
+                decision = 1
+            elif upper < threshold:
+                decision = -1
+
+        if decision:
+            break
+
+    lower, upper = confidence_interval(wins, games, confidence,
+                                       'wilson' if method == 'sprt' else method)
+    return {
+        'win_rate': wins / games if games else 0.0,
+        'ci_lower': lower,
+        'ci_upper': upper,
+        'games': games,
+        'decision': decision,
+    }
+
+
+def sequential_compare(sample_a, sample_b, confidence=0.95, method='wilson',
+                       initial_chunk=1000, max_games=1000000):
+    """두 전략의 승률 신뢰 구간이 서로 분리될 때까지 게임을 청크 단위로 진행
+
+    sample_a(n), sample_b(n)은 각 전략으로 n게임을 진행하여 승리 횟수를 반환.
+    반환: dict(win_rate_a, win_rate_b, interval_a, interval_b, games, decision)
+    decision은 1(a 우세), -1(b 우세), 0(미결정). games는 전략당 진행한 게임 수.
+    """
+    if method not in INTERVAL_METHODS:
+        raise ValueError(f"Unknown interval method: {method}")
+
+    wins_a = wins_b = 0
+    games = 0
+    chunk = initial_chunk
+    look = 0
+    decision = 0
+
+    while games < max_games:
+        batch = min(chunk, max_games - games)
+        wins_a += sample_a(batch)
+        wins_b += sample_b(batch)
+        games += batch
+        chunk *= 2
+        look += 1
+
+        # 두 구간을 동시에 보므로 오류율을 절반씩 나눔
+        level = 1 - (1 - _look_confidence(confidence, look)) / 2
+        lower_a, upper_a = confidence_interval(wins_a, games, level, method)
+        lower_b, upper_b = confidence_interval(wins_b, games, level, method)
+        if lower_a > upper_b:
+            decision = 1
+        elif lower_b > upper_a:
+            decision = -1
+
+        if decision:
+            break
+
+    return {
+        'win_rate_a': wins_a / games if games else 0.0,
+        'win_rate_b': wins_b / games if games else 0.0,
+        'interval_a': confidence_interval(wins_a, games, confidence, method),
+        'interval_b': confidence_interval(wins_b, games, confidence, method),
+        'games': games,
+        'decision': decision,
+    }
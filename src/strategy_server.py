@@ -0,0 +1,405 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+최적 전략 조회 서버 (asyncio, JSON lines)
+로컬 TCP 또는 Unix 소켓으로 최적 응답/승률 조회를 제공하고, 동시에 들어온 조회를
+짧은 시간 동안 모아 k별로 한 번의 벡터화된 테이블 조회로 처리 (긴 배열은 구조적 최적 응답 탐색)
+임의의 두 배열 대결 승률(odds)도 같은 배치에서 k별로 한 번의 벡터화된 계산으로 처리
+
+요청 (한 줄에 JSON 하나):
+    {"id": 1, "op": "respond", "sequence": "HTH"}
+    {"id": 2, "op": "odds", "first": "HTH", "second": "HHT"}
+    {"id": 3, "op": "stats"}
+응답:
+    {"id": 1, "sequence": "HTH", "response": "HHT", "win_probability": 0.666..., "win_odds": [2, 1]}
+    {"id": 2, "first": "HTH", "second": "HHT", "win_probability": 0.666..., "win_odds": [2, 1]}
+    {"id": 3, "requests": ..., "batches": ..., "mean_batch_size": ..., "latency_ms": {"p50": ..., ...}}
+win_probability는 second가 first를 이길 확률, win_odds는 공정한 동전에서만 포함
+오류는 {"id": ..., "error": "..."} 로 응답
+
+사용법:
+    python src/strategy_server.py --port 8765
+    python src/strategy_server.py --unix /tmp/penney.sock
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import math
+import time
+from collections import deque
+from fractions import Fraction
+
+import numpy as np
+
+from corrected_strategy import ConwaysOptimalStrategy
+from exact_probability import win_odds_array, win_probability_array
+from pattern_automaton import COINS, decode_sequence, encode_sequence
+
+# 지연 시간 백분위 계산에 쓰는 최근 요청 수
+LATENCY_HISTORY = 10000
+PERCENTILES = (50, 90, 99, 99.9)
+
+
+class StrategyServer:
+    """마이크로 배치 최적 응답 서버
+
+    max_batch개가 모이거나 첫 요청 후 max_delay초가 지나면 모인 요청을 한 번에 처리
+    짧은 배열은 응답 테이블, 긴 배열은 구조적 탐색으로 응답하며 max_k보다 긴 배열은 거절
+    """
+
+    def __init__(self, p_heads=0.5, max_batch=1024, max_delay=0.001, max_k=62):
+        self.p_heads = p_heads
+        self.max_k = max_k
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.strategies = {}
+        self.latencies = deque(maxlen=LATENCY_HISTORY)
+        self.requests = 0
+        self.batches = 0
+        self._queue = None
+        self._batcher = None
+        self._server = None
+
+    async def start(self, host='127.0.0.1', port=0, path=None):
+        """TCP(host, port) 또는 Unix 소켓(path)에서 서버 시작. 실제 주소 반환"""
+        self._queue = asyncio.Queue()
+        self._batcher = asyncio.create_task(self._run_batches())
+        if path is not None:
+            self._server = await asyncio.start_unix_server(self._handle_client, path=path)
+            return path
+        self._server = await asyncio.start_server(self._handle_client, host, port)
+        return self._server.sockets[0].getsockname()[:2]
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        if self._batcher is not None:
+            self._batcher.cancel()
+            try:
+                await self._batcher
+            except asyncio.CancelledError:
+                pass
+
+    async def serve_forever(self):
+        await self._server.serve_forever()
+
+    async def _strategy(self, k):
+        """길이 k의 전략 (처음 요청 시 테이블 계산은 이벤트 루프 밖에서 실행)"""
+        if k not in self.strategies:
+            loop = asyncio.get_running_loop()
+            self.strategies[k] = loop.run_in_executor(None, ConwaysOptimalStrategy, k, self.p_heads)
+        strategy = self.strategies[k]
+        if not isinstance(strategy, ConwaysOptimalStrategy):
+            strategy = self.strategies[k] = await strategy
+        return strategy
+
+    def _check_sequence(self, sequence):
+        if not sequence or any(coin not in COINS for coin in sequence):
+            raise ValueError(f"Invalid sequence: {sequence}")
+        if len(sequence) > self.max_k:
+            raise ValueError(f"Sequence longer than {self.max_k}: {sequence}")
+
+    async def _submit(self, op, payload):
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((op, payload, future))
+        return await future
+
+    async def respond(self, sequence):
+        """최적 응답 조회 (배치 대기열을 거쳐 처리)"""
+        self._check_sequence(sequence)
+        return await self._submit('respond', sequence)
+
+    async def odds(self, first, second):
+        """second가 first를 이길 확률 조회 (배치 대기열을 거쳐 처리)"""
+        self._check_sequence(first)
+        self._check_sequence(second)
+        if len(first) != len(second):
+            raise ValueError(f"Sequences must have the same length: {first}, {second}")
+        return await self._submit('odds', (first, second))
+
+    async def _run_batches(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_delay
+            while True:
+                while len(batch) < self.max_batch and not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+                remaining = deadline - loop.time()
+                if len(batch) >= self.max_batch or remaining <= 0:
+                    break
+                # 다른 연결의 요청이 대기열에 들어올 시간을 줌
+                await asyncio.sleep(remaining)
+            try:
+                await self._process(batch)
+            except Exception as error:
+                self._fail([(payload, future) for _, payload, future in batch], error)
+
+    async def _process(self, batch):
+        """모인 요청을 종류와 k별로 묶어 한 번의 gather 또는 벡터화된 계산으로 조회"""
+        self.batches += 1
+        groups = {}
+        for op, payload, future in batch:
+            k = len(payload) if op == 'respond' else len(payload[0])
+            groups.setdefault((op, k), []).append((payload, future))
+
+        for (op, k), items in groups.items():
+            # 한 묶음의 실패는 그 요청들에만 오류로 전달하고 배치 작업은 계속 실행
+            try:
+                results = await self._group_results(op, k, [payload for payload, _ in items])
+            except Exception as error:
+                self._fail(items, error)
+                continue
+            for (_, future), result in zip(items, results):
+                if not future.done():
+                    future.set_result(result)
+
+    async def _group_results(self, op, k, payloads):
+        """같은 종류, 같은 길이 k의 요청 묶음 결과 목록"""
+        if op == 'odds':
+            return self._odds_results(payloads, k, self.p_heads)
+
+        strategy = await self._strategy(k)
+        if strategy.response_table is not None:
+            return self._table_results(strategy, payloads)
+        # 테이블이 없는 긴 배열은 구조적 탐색 (이벤트 루프 밖에서 실행)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._search_results, strategy, payloads)
+
+    @staticmethod
+    def _fail(items, error):
+        for _, future in items:
+            if not future.done():
+                future.set_exception(error)
+
+    @staticmethod
+    def _odds_results(pairs, k, p_heads):
+        """같은 길이 k의 (first, second) 쌍들을 한 번의 벡터화된 계산으로 조회"""
+        firsts = np.fromiter((encode_sequence(first) for first, _ in pairs), dtype=np.int64, count=len(pairs))
+        seconds = np.fromiter((encode_sequence(second) for _, second in pairs), dtype=np.int64, count=len(pairs))
+        fair = p_heads == 0.5
+        if fair:
+            second_odds, first_odds = win_odds_array(firsts, seconds, k)
+            probabilities = second_odds / (second_odds + first_odds)
+        else:
+            probabilities = win_probability_array(firsts, seconds, k, p_heads)
+
+        results = []
+        for i, (first, second) in enumerate(pairs):
+            result = {'first': first, 'second': second, 'win_probability': float(probabilities[i])}
+            if fair:
+                divisor = math.gcd(int(second_odds[i]), int(first_odds[i]))
+                result['win_odds'] = [int(second_odds[i]) // divisor, int(first_odds[i]) // divisor]
+            results.append(result)
+        return results
+
+    @staticmethod
+    def _table_results(strategy, sequences):
+        """응답 테이블에서 한 번의 gather로 조회"""
+        k = strategy.k
+        codes = np.fromiter((encode_sequence(sequence) for sequence in sequences),
+                            dtype=np.int64, count=len(sequences))
+        responses, probabilities = strategy.get_optimal_responses(codes)
+        odds = strategy.response_table.win_odds
+        results = []
+        for i, sequence in enumerate(sequences):
+            result = {
+                'sequence': sequence,
+                'response': decode_sequence(int(responses[i]), k),
+                'win_probability': float(probabilities[i]),
+            }
+            if odds is not None:
+                response_odds, opponent_odds = (int(x) for x in odds[codes[i]])
+                divisor = math.gcd(response_odds, opponent_odds)
+                result['win_odds'] = [response_odds // divisor, opponent_odds // divisor]
+            results.append(result)
+        return results
+
+    @staticmethod
+    def _search_results(strategy, sequences):
+        """구조적 최적 응답 탐색으로 조회"""
+        results = []
+        for sequence in sequences:
+            probability = strategy.get_exact_win_probability(sequence)
+            result = {
+                'sequence': sequence,
+                'response': strategy.get_optimal_response(sequence),
+                'win_probability': float(probability),
+            }
+            if isinstance(probability, Fraction):
+                result['win_odds'] = [probability.numerator, probability.denominator - probability.numerator]
+            results.append(result)
+        return results
+
+    def stats(self):
+        """처리 통계와 최근 요청의 지연 시간 백분위(ms)"""
+        latencies = np.array(self.latencies) * 1000 if self.latencies else np.zeros(1)
+        return {
+            'requests': self.requests,
+            'batches': self.batches,
+            'mean_batch_size': self.requests / self.batches if self.batches else 0.0,
+            'latency_ms': {f"p{p:g}": float(np.percentile(latencies, p)) for p in PERCENTILES},
+        }
+
+    async def _handle_request(self, line, writer):
+        start = time.perf_counter()
+        request_id = None
+        try:
+            request = json.loads(line)
+            request_id = request.get('id')
+            op = request.get('op', 'respond')
+            if op == 'respond':
+                result = await self.respond(str(request.get('sequence', '')).upper())
+                self.requests += 1
+                self.latencies.append(time.perf_counter() - start)
+            elif op == 'odds':
+                result = await self.odds(str(request.get('first', '')).upper(),
+                                         str(request.get('second', '')).upper())
+                self.requests += 1
+                self.latencies.append(time.perf_counter() - start)
+            elif op == 'stats':
+                result = self.stats()
+            elif op == 'ping':
+                result = {}
+            else:
+                raise ValueError(f"Unknown op: {op}")
+        except Exception as error:
+            # 어떤 실패든 오류 응답을 보내 클라이언트가 응답을 기다리며 멈추지 않게 함
+            result = {'error': str(error) or type(error).__name__}
+
+        result['id'] = request_id
+        writer.write(json.dumps(result).encode() + b'\n')
+
+    async def _handle_client(self, reader, writer):
+        """연결 하나의 요청 줄들을 동시에 처리 (응답 순서는 id로 구분)"""
+        tasks = set()
+        try:
+            while line := await reader.readline():
+                if not line.strip():
+                    continue
+                task = asyncio.create_task(self._handle_request(line, writer))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+                if len(tasks) >= self.max_batch:
+                    await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                    await writer.drain()
+            if tasks:
+                await asyncio.wait(tasks)
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            for task in tasks:
+                task.cancel()
+            writer.close()
+
+
+class StrategyClient:
+    """서버에 연결하는 asyncio 클라이언트 (요청 id로 응답을 짝지어 동시 요청 지원)"""
+
+    def __init__(self):
+        self._reader = None
+        self._writer = None
+        self._pending = {}
+        self._ids = itertools.count()
+        self._receiver = None
+
+    @classmethod
+    async def connect(cls, host='127.0.0.1', port=None, path=None):
+        client = cls()
+        if path is not None:
+            client._reader, client._writer = await asyncio.open_unix_connection(path)
+        else:
+            client._reader, client._writer = await asyncio.open_connection(host, port)
+        client._receiver = asyncio.create_task(client._receive())
+        return client
+
+    async def close(self):
+        self._writer.close()
+        await self._writer.wait_closed()
+        self._receiver.cancel()
+        try:
+            await self._receiver
+        except asyncio.CancelledError:
+            pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def _receive(self):
+        while line := await self._reader.readline():
+            message = json.loads(line)
+            # 취소되거나 시간 초과된 요청의 늦은 응답은 무시
+            future = self._pending.pop(message.pop('id', None), None)
+            if future is not None and not future.done():
+                future.set_result(message)
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(ConnectionError("Server closed the connection"))
+
+    async def request(self, op, **fields):
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        try:
+            self._writer.write(json.dumps({'id': request_id, 'op': op, **fields}).encode() + b'\n')
+            await self._writer.drain()
+            message = await future
+        finally:
+            self._pending.pop(request_id, None)
+        if 'error' in message:
+            raise ValueError(message['error'])
+        return message
+
+    async def respond(self, sequence):
+        """최적 응답 조회 결과 사전"""
+        return await self.request('respond', sequence=sequence)
+
+    async def respond_many(self, sequences):
+        """여러 조회를 동시에 보내 서버에서 한 배치로 처리되도록 함"""
+        return await asyncio.gather(*(self.respond(sequence) for sequence in sequences))
+
+    async def odds(self, first, second):
+        """second가 first를 이길 확률 조회 결과 사전"""
+        return await self.request('odds', first=first, second=second)
+
+    async def stats(self):
+        return await self.request('stats')
+
+
+async def _serve(args):
+    server = StrategyServer(p_heads=args.p_heads, max_batch=args.max_batch,
+                            max_delay=args.max_delay_ms / 1000, max_k=args.max_k)
+    address = await server.start(args.host, args.port, args.unix)
+    print(f"Penney strategy server listening on {address}")
+    try:
+        await server.serve_forever()
+    finally:
+        await server.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="페니의 게임 최적 전략 조회 서버")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--unix', help="Unix 소켓 경로 (지정하면 TCP 대신 사용)")
+    parser.add_argument('--p-heads', type=float, default=0.5, help="앞면 확률")
+    parser.add_argument('--max-batch', type=int, default=1024)
+    parser.add_argument('--max-delay-ms', type=float, default=1.0)
+    parser.add_argument('--max-k', type=int, default=62, help="허용하는 최대 배열 길이")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(_serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+대규모 k의 비추이적 토너먼트 그래프 분석
+2^k x 2^k 정확한 승률 행렬을 병렬로 계산해 메모리 맵 파일로 저장하고,
+최적 응답 사상, 순환(비추이성), 강한 연결 요소를 조회
+"""
+
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from fractions import Fraction
+
+import numpy as np
+
+from exact_probability import leading_number_array
+from pattern_automaton import all_patterns, decode_sequence, encode_sequence
+
+PROBABILITY_FILE = 'probabilities.npy'
+ODDS_FILE = 'odds.npy'
+
+# 작업자 하나가 한 번에 계산하는 (행 × 열) 원소 수
+BLOCK_ELEMENTS = 1 << 22
+
+
+def _compute_block(job):
+    """행 블록 [start, stop)과 그 오른쪽 열들의 승률을 계산하여 대칭 위치까지 기록"""
+    directory, k, start, stop = job
+    size = 1 << k
+    probabilities = np.load(os.path.join(directory, PROBABILITY_FILE), mmap_mode='r+')
+    odds = np.load(os.path.join(directory, ODDS_FILE), mmap_mode='r+')
+
+    codes = np.arange(size, dtype=np.int64)
+    rows = codes[start:stop]
+    columns = codes[start:]
+
+    # 자기 상관값은 패턴마다 한 번만 계산하여 모든 쌍에서 재사용
+    self_corr = leading_number_array(codes, codes, k)
+
+    # P(B가 A를 이김) = (AA - AB) / ((AA - AB) + (BB - BA)), 열은 B >= start 만 계산
+    seq2_odds = self_corr[rows, None] - leading_number_array(rows[:, None], columns[None, :], k)
+    seq1_odds = self_corr[None, columns] - leading_number_array(columns[None, :], rows[:, None], k)
+    same = rows[:, None] == columns[None, :]
+    seq2_odds[same] = 1
+    seq1_odds[same] = 1
+    block = seq2_odds / (seq2_odds + seq1_odds)
+
+    # P(A가 B를 이김) = 1 - P(B가 A를 이김) 이므로 대칭 위치는 비율만 뒤집어 기록
+    probabilities[start:stop, start:] = block
+    probabilities[start:, start:stop] = 1 - block.T
+    odds[0, start:stop, start:] = seq2_odds
+    odds[1, start:stop, start:] = seq1_odds
+    odds[0, start:, start:stop] = seq1_odds.T
+    odds[1, start:, start:stop] = seq2_odds.T
+
+    probabilities.flush()
+    odds.flush()
+    return stop - start
+
+
+def build_win_matrix(k, directory=None, max_workers=None):
+    """2^k x 2^k 정확한 승률 행렬을 directory에 메모리 맵 파일로 생성
+
+    probabilities.npy[i, j] = 패턴 j가 패턴 i를 이길 확률 (float64)
+    odds.npy[:, i, j] = (j 승리, i 승리) 정수 비율 (정확한 유리수)
+    반환: TournamentGraph
+    """
+    if directory is None:
+        directory = tempfile.mkdtemp(prefix=f'penney_k{k}_')
+    os.makedirs(directory, exist_ok=True)
+
+    size = 1 << k
+    probabilities = np.lib.format.open_memmap(
+        os.path.join(directory, PROBABILITY_FILE), mode='w+', dtype=np.float64, shape=(size, size))
+    odds = np.lib.format.open_memmap(
+        os.path.join(directory, ODDS_FILE), mode='w+', dtype=np.int64, shape=(2, size, size))
+    del probabilities, odds
+
+    # 위쪽 삼각형만 계산하므로 행 블록마다 작업량이 다름: 작은 블록으로 나누어 균형 유지
+    rows = max(1, BLOCK_ELEMENTS // size)
+    jobs = [(directory, k, start, min(start + rows, size)) for start in range(0, size, rows)]
+
+    if max_workers == 1 or len(jobs) == 1:
+        for job in jobs:
+            _compute_block(job)
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(_compute_block, jobs))
+
+    return TournamentGraph(directory, k)
+
+
+class TournamentGraph:
+    """메모리 맵 승률 행렬 위의 토너먼트(지배) 그래프
+
+    간선 A -> B 는 B가 A를 1/2보다 높은 확률로 이긴다는 뜻 (B가 A를 지배)
+    """
+
+    def __init__(self, directory, k):
+        self.directory = directory
+        self.k = k
+        self.size = 1 << k
+        self.probabilities = np.load(os.path.join(directory, PROBABILITY_FILE), mmap_mode='r')
+        self.odds = np.load(os.path.join(directory, ODDS_FILE), mmap_mode='r')
+        self._best_responses = None
+
+    def probability(self, seq1, seq2):
+        """seq2가 seq1을 이길 확률 (float)"""
+        return float(self.probabilities[encode_sequence(seq1), encode_sequence(seq2)])
+
+    def exact_probability(self, seq1, seq2):
+        """seq2가 seq1을 이길 정확한 확률 (Fraction)"""
+        i, j = encode_sequence(seq1), encode_sequence(seq2)
+        seq2_odds, seq1_odds = int(self.odds[0, i, j]), int(self.odds[1, i, j])
+        return Fraction(seq2_odds, seq2_odds + seq1_odds)
+
+    def best_responses(self):
+        """각 패턴 코드에 대한 최적 응답 코드 배열"""
+        if self._best_responses is None:
+            rows = max(1, BLOCK_ELEMENTS // self.size)
+            best = np.empty(self.size, dtype=np.int64)
+            for start in range(0, self.size, rows):
+                best[start:start + rows] = np.argmax(self.probabilities[start:start + rows], axis=1)
+            self._best_responses = best
+        return self._best_responses
+
+    def best_response_map(self):
+        """{패턴: 최적 응답} 사전"""
+        patterns = all_patterns(self.k)
+        return {patterns[i]: patterns[j] for i, j in enumerate(self.best_responses())}
+
+    def best_response_cycles(self):
+        """최적 응답 사상을 반복할 때 나타나는 모든 순환 (패턴 문자열 리스트의 리스트)"""
+        best = self.best_responses()
+        visited = np.zeros(self.size, dtype=np.int8)  # 0: 미방문, 1: 현재 경로, 2: 완료
+        cycles = []
+
+        for start in range(self.size):
+            path = []
+            node = start
+            while visited[node] == 0:
+                visited[node] = 1
+                path.append(node)
+                node = int(best[node])
+            if visited[node] == 1:
+                cycle = path[path.index(node):]
+                cycles.append([decode_sequence(c, self.k) for c in cycle])
+            for c in path:
+                visited[c] = 2
+
+        return cycles
+
+    def dominance_matrix(self):
+        """지배 관계 희소 행렬 (A -> B: B가 A를 이길 확률 > 1/2)"""
+        from scipy import sparse
+
+        rows = max(1, BLOCK_ELEMENTS // self.size)
+        blocks = [sparse.csr_matrix(self.probabilities[start:start + rows] > 0.5)
+                  for start in range(0, self.size, rows)]
+        return sparse.vstack(blocks, format='csr')
+
+    def strongly_connected_components(self):
+        """지배 그래프의 강한 연결 요소 (크기 2 이상은 비추이적 순환을 포함)"""
+        from scipy.sparse.csgraph import connected_components
+
+        count, labels = connected_components(self.dominance_matrix(), directed=True, connection='strong')
+        components = [[] for _ in range(count)]
+        for code, label in enumerate(labels):
+            components[label].append(decode_sequence(code, self.k))
+        return sorted(components, key=len, reverse=True)
+
+    def is_nontransitive(self):
+        """지배 관계에 순환이 있는지 여부"""
+        return len(self.strongly_connected_components()[0]) > 1
+
+    def find_cycle(self, seq):
+        """seq를 포함하는 지배 순환 하나 (없으면 None). seq -> ... -> seq"""
+        from scipy.sparse.csgraph import breadth_first_order
+
+        graph = self.dominance_matrix()
+        start = encode_sequence(seq)
+        order, predecessors = breadth_first_order(graph, start, directed=True, return_predecessors=True)
+
+        # start로 되돌아오는 간선을 가진 도달 가능한 노드를 찾아 경로 복원
+        reachable = order[1:]
+        returning = reachable[np.asarray(graph[reachable, start].todense()).ravel() > 0]
+        if returning.size == 0:
+            return None
+
+        node = int(returning[0])
+        path = [node]
+        while node != start:
+            node = int(predecessors[node])
+            path.append(node)
+        path.reverse()
+        return [decode_sequence(c, self.k) for c in path] + [seq]
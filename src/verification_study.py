@@ -1,112 +1,162 @@
+import os
 import numpy as np
 import random
-from collections import defaultdict
-import matplotlib.pyplot as plt
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from statistics import NormalDist
+
+from batch_simulator import count_pair_wins, count_wins, paired_differences, simulate_single_game
+from exact_probability import conway_win_probability
+from pattern_automaton import all_patterns, encode_sequence
+from probability_cache import default_cache
+from sequential_testing import sequential_compare
 
 class PenneysGameVerification:
     """페니의 게임 전략 검증을 위한 클래스"""
     
-    def __init__(self):
-        self.sequences = ['HHH', 'HHT', 'HTH', 'HTT', 'THH', 'THT', 'TTH', 'TTT']
+    def __init__(self, k=3):
+        self.sequences = all_patterns(k)
         
-    def simulate_single_game(self, seq1, seq2):
-        """단일 게임 시뮬레이션 (더 정확한 구현)"""
-        if seq1 == seq2:
-            return random.choice([1, 2])
-        
-        coin_sequence = ""
-        max_length = 10000  # 무한 루프 방지
-        
-        for _ in range(max_length):
-            coin_sequence += random.choice(['H', 'T'])
-            if len(coin_sequence) >= 3:
-                recent = coin_sequence[-3:]
-                if recent == seq1:
-                    return 1
-                elif recent == seq2:
-                    return 2
-                    
-                # 더 긴 패턴도 체크 (겹치는 경우)
-                if len(coin_sequence) >= 4:
-                    recent_4 = coin_sequence[-4:]
-                    if recent_4[-3:] == seq1 and recent_4[:-1] != seq2:
-                        return 1
-                    elif recent_4[:-1] == seq2 and recent_4[-3:] != seq1:
-                        return 2
-        
-        return random.choice([1, 2])  # 극히 드문 경우
+    def simulate_single_game(self, seq1, seq2, rng=None):
+        """단일 게임 시뮬레이션 (패턴 오토마톤 기반)"""
+        return simulate_single_game(seq1, seq2, max_length=10000, rng=rng)
+
+def _training_worker(job):
+    """독립 훈련 한 번을 실행하여 공유 메모리의 해당 행에 정책과 Q-테이블 기록 (작업자 프로세스)"""
+    policy_name, q_name, run, num_runs, k, episodes, seed_sequence = job
+    n = 1 << k
+    policy_memory = shared_memory.SharedMemory(name=policy_name)
+    q_memory = shared_memory.SharedMemory(name=q_name)
+    try:
+        policies = np.ndarray((num_runs, n), dtype=np.int64, buffer=policy_memory.buf)
+        q_tables = np.ndarray((num_runs, n, n), dtype=np.float64, buffer=q_memory.buf)
+        
+        verification = MultipleTrainingVerification(k)
+        rng = random.Random(int(seed_sequence.generate_state(1, np.uint64)[0]))
+        q_table = verification.run_independent_training(episodes, rng)
+        q_tables[run] = q_table
+        policies[run] = np.argmax(q_table, axis=1)
+        del policies, q_tables
+    finally:
+        policy_memory.close()
+        q_memory.close()
+    return run
+
 
 class MultipleTrainingVerification:
     """여러 번의 독립적 RL 훈련을 통한 검증"""
     
-    def __init__(self):
-        self.env = PenneysGameVerification()
-        
-    def run_independent_training(self, episodes=100000):
-        """독립적인 Q-러닝 훈련 실행"""
-        q_table = defaultdict(lambda: np.zeros(8))
+    def __init__(self, k=3):
+        self.k = k
+        self.env = PenneysGameVerification(k)
+        self.agreement_matrix = None
+        self.response_counts = None
+        self.q_tables = []
+        
+    def run_independent_training(self, episodes=100000, rng=None):
+        """독립적인 Q-러닝 훈련 실행 (한 게임씩 순차 갱신), Q-테이블 반환
+
+        rng는 random.Random 인스턴스 (지정하지 않으면 전역 random 사용)
+        """
+        rng = rng or random
+        num_sequences = len(self.env.sequences)
+        q_table = np.zeros((num_sequences, num_sequences))
         learning_rate = 0.1
         epsilon = 0.1
         
         for episode in range(episodes):
             # 상태 (Player 1의 선택)
-            state = random.randint(0, 7)
+            state = rng.randint(0, num_sequences - 1)
             player1_seq = self.env.sequences[state]
             
             # 행동 선택 (epsilon-greedy)
-            if random.random() < epsilon:
-                action = random.randint(0, 7)
+            if rng.random() < epsilon:
+                action = rng.randint(0, num_sequences - 1)
             else:
                 action = np.argmax(q_table[state])
             
             player2_seq = self.env.sequences[action]
             
             # 게임 시뮬레이션
-            winner = self.env.simulate_single_game(player1_seq, player2_seq)
+            winner = self.env.simulate_single_game(player1_seq, player2_seq, rng)
             reward = 1 if winner == 2 else -1
             
             # Q-테이블 업데이트
             q_table[state][action] += learning_rate * (reward - q_table[state][action])
         
-        # 최종 정책 추출
-        policy = {}
-        for state in range(8):
-            best_action = np.argmax(q_table[state])
-            policy[self.env.sequences[state]] = self.env.sequences[best_action]
-        
-        return policy
+        return q_table
     
-    def verify_consistency(self, num_runs=5):
-        """여러 번의 독립적 훈련으로 일관성 검증"""
+    def verify_consistency(self, num_runs=5, episodes=100000, seed=None, max_workers=None):
+        """여러 번의 독립적 훈련으로 일관성 검증
+        
+        순차 훈련마다 SeedSequence.spawn으로 시드한 독립 random.Random을 주어 프로세스 풀에서 병렬 실행하고,
+        각 실행의 정책과 Q-테이블을 공유 메모리에 모아 합의/일치 행렬을 계산한다.
+        """
         print("🔬 여러 번의 독립적 RL 훈련을 통한 검증")
         print("=" * 60)
         
-        all_policies = []
-        
-        for run in range(num_runs):
-            print(f"훈련 실행 {run+1}/{num_runs}...")
-            policy = self.run_independent_training()
-            all_policies.append(policy)
-        
-        # 일관성 분석
+        n = len(self.env.sequences)
+        children = np.random.SeedSequence(seed).spawn(num_runs)
+        policy_memory = shared_memory.SharedMemory(create=True, size=num_runs * n * 8)
+        q_memory = shared_memory.SharedMemory(create=True, size=num_runs * n * n * 8)
+        try:
+            jobs = [(policy_memory.name, q_memory.name, run, num_runs, self.k, episodes, child)
+                    for run, child in enumerate(children)]
+            
+            print(f"훈련 실행 {num_runs}회 (실행당 {episodes:,} 에피소드)...")
+            if max_workers == 1 or num_runs <= 1:
+                for job in jobs:
+                    _training_worker(job)
+            else:
+                workers = max_workers or os.cpu_count() or 1
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    list(executor.map(_training_worker, jobs))
+            
+            policies = np.ndarray((num_runs, n), dtype=np.int64, buffer=policy_memory.buf).copy()
+            self.q_tables = np.ndarray((num_runs, n, n), dtype=np.float64, buffer=q_memory.buf).copy()
+        finally:
+            policy_memory.close()
+            policy_memory.unlink()
+            q_memory.close()
+            q_memory.unlink()
+        
+        # response_counts[s, a] = 상대 s에 응답 a를 고른 실행 수
+        # agreement_matrix[i, j] = 실행 i와 j의 정책이 일치하는 상대 배열 비율
+        self.response_counts = np.zeros((n, n), dtype=np.int64)
+        np.add.at(self.response_counts, (np.tile(np.arange(n), num_runs), policies.ravel()), 1)
+        self.agreement_matrix = (policies[:, None, :] == policies[None, :, :]).mean(axis=2)
+        
+        all_policies = [{self.env.sequences[state]: self.env.sequences[action]
+                         for state, action in enumerate(policy)} for policy in policies]
+        
+        # 일관성 분석 (실행 수가 많으면 실행별 열 대신 합의 응답과 비율만 표시)
         print(f"\n📊 {num_runs}번 독립 훈련 결과 비교")
         print("-" * 60)
+        show_runs = num_runs <= 10
         print("상대 배열 |", end="")
-        for i in range(num_runs):
-            print(f" 훈련{i+1} |", end="")
+        if show_runs:
+            for i in range(num_runs):
+                print(f" 훈련{i+1} |", end="")
+        else:
+            print(" 합의 응답 (비율) |", end="")
         print(" 일관성")
         print("-" * 60)
         
         consistency_count = 0
         total_cases = len(self.env.sequences)
         
-        for opponent in self.env.sequences:
-            responses = [policy[opponent] for policy in all_policies]
-            is_consistent = len(set(responses)) == 1
+        for state, opponent in enumerate(self.env.sequences):
+            is_consistent = self.response_counts[state].max() == num_runs
             
             print(f"   {opponent}   |", end="")
-            for response in responses:
-                print(f"  {response} |", end="")
+            if show_runs:
+                for policy in all_policies:
+                    print(f"  {policy[opponent]} |", end="")
+            else:
+                consensus = int(np.argmax(self.response_counts[state]))
+                share = self.response_counts[state, consensus] / num_runs
+                print(f"  {self.env.sequences[consensus]} ({share:6.1%}) |", end="")
             
             if is_consistent:
                 print(" ✓ 일관됨")
@@ -123,22 +173,26 @@ class MultipleTrainingVerification:
 class TheoreticalProbabilityAnalysis:
     """이론적 확률 분석"""
     
-    def __init__(self):
-        pass
+    def __init__(self, cache=None):
+        self.cache = cache
     
-    def calculate_exact_probability(self, seq1, seq2, num_simulations=1000000):
-        """정확한 확률 계산 (대규모 시뮬레이션)"""
+    def calculate_exact_probability(self, seq1, seq2, num_simulations=None):
+        """정확한 확률 계산 (콘웨이 공식, num_simulations 지정 시 시뮬레이션으로 추정)"""
         if seq1 == seq2:
             return 0.5
         
-        wins = 0
-        env = PenneysGameVerification()
+        if num_simulations is None:
+            if self.cache is not None:
+                return float(self.cache.exact_probability(seq1, seq2))
+            return float(conway_win_probability(seq1, seq2))
         
-        for _ in range(num_simulations):
-            winner = env.simulate_single_game(seq1, seq2)
-            if winner == 2:  # seq2 승리
-                wins += 1
+        if self.cache is not None:
+            wins, games = self.cache.monte_carlo(
+                seq1, seq2, num_simulations, lambda n: count_wins(seq1, seq2, n)
+            )
+            return wins / games
         
+        wins = count_wins(seq1, seq2, num_simulations)
         return wins / num_simulations
     
     def analyze_disputed_cases(self):
@@ -189,8 +243,10 @@ class TheoreticalProbabilityAnalysis:
 class HeadToHeadTournament:
     """AI 전략 vs 콘웨이 전략 직접 대결"""
     
-    def __init__(self):
+    def __init__(self, seed=None, cache=None):
         self.env = PenneysGameVerification()
+        self.rng = np.random.default_rng(seed)
+        self.cache = cache
         
         # AI 발견 전략
         self.ai_strategy = {
@@ -205,15 +261,27 @@ class HeadToHeadTournament:
             o1, o2, o3 = opponent[0], opponent[1], opponent[2]
             self.conway_strategy[opponent] = flip(o2) + o1 + o2
     
-    def tournament(self, games_per_case=100000):
-        """전면적 토너먼트"""
+    def tournament(self, games_per_case=100000, method='stream'):
+        """전면적 토너먼트
+        
+        method='stream'은 같은 코인 스트림들에서 모든 대결을 한 번에 판정하고,
+        'pairwise'는 대결마다 새 동전 열을 시뮬레이션한다.
+        """
+        if method not in ('stream', 'pairwise'):
+            raise ValueError(f"Unknown tournament method: {method}")
+        
         print("\n⚔️  AI 전략 vs 콘웨이 전략 직접 대결")
         print("=" * 60)
         
-        ai_total_wins = 0
-        conway_total_wins = 0
+        ai_rate_sum = 0
+        conway_rate_sum = 0
         total_games = 0
         
+        if method == 'stream':
+            pairs = ([(opponent, self.ai_strategy[opponent]) for opponent in self.env.sequences]
+                     + [(opponent, self.conway_strategy[opponent]) for opponent in self.env.sequences])
+            counts = dict(zip(pairs, self._count_pair_wins(pairs, games_per_case)))
+        
         print("상대 선택 | AI 응답 | 콘웨이 응답 | AI 승률 | 콘웨이 승률 | 승자")
         print("-" * 70)
         
@@ -221,26 +289,22 @@ class HeadToHeadTournament:
             ai_response = self.ai_strategy[opponent]
             conway_response = self.conway_strategy[opponent]
             
-            # AI 전략 테스트
-            ai_wins = 0
-            for _ in range(games_per_case):
-                winner = self.env.simulate_single_game(opponent, ai_response)
-                if winner == 2:
-                    ai_wins += 1
-            
-            # 콘웨이 전략 테스트  
-            conway_wins = 0
-            for _ in range(games_per_case):
-                winner = self.env.simulate_single_game(opponent, conway_response)
-                if winner == 2:
-                    conway_wins += 1
+            if method == 'stream':
+                ai_wins, ai_games = counts[(opponent, ai_response)]
+                conway_wins, conway_games = counts[(opponent, conway_response)]
+            else:
+                # AI 전략 테스트
+                ai_wins, ai_games = self._count_wins(opponent, ai_response, games_per_case)
+                
+                # 콘웨이 전략 테스트  
+                conway_wins, conway_games = self._count_wins(opponent, conway_response, games_per_case)
             
-            ai_winrate = ai_wins / games_per_case
-            conway_winrate = conway_wins / games_per_case
+            ai_winrate = ai_wins / ai_games
+            conway_winrate = conway_wins / conway_games
             
-            ai_total_wins += ai_wins
-            conway_total_wins += conway_wins
-            total_games += games_per_case * 2
+            ai_rate_sum += ai_winrate
+            conway_rate_sum += conway_winrate
+            total_games += ai_games + conway_games
             
             # 승자 결정
             if ai_winrate > conway_winrate:
@@ -252,9 +316,9 @@ class HeadToHeadTournament:
             
             print(f"   {opponent}   |  {ai_response}  |   {conway_response}   | {ai_winrate:.3f} | {conway_winrate:.3f} | {winner_mark}")
         
-        # 전체 결과
-        overall_ai = ai_total_wins / (games_per_case * len(self.env.sequences))
-        overall_conway = conway_total_wins / (games_per_case * len(self.env.sequences))
+        # 전체 결과 (케이스별 승률의 평균)
+        overall_ai = ai_rate_sum / len(self.env.sequences)
+        overall_conway = conway_rate_sum / len(self.env.sequences)
         
         print("-" * 70)
         print(f"전체 평균 | {'':7} | {'':9} | {overall_ai:.3f} | {overall_conway:.3f} |", end="")
@@ -267,6 +331,146 @@ class HeadToHeadTournament:
             print(" 🤝 동점!")
         
         return overall_ai, overall_conway
+    
+    def _count_wins(self, opponent, response, num_games):
+        """response의 (승리 수, 게임 수). 캐시가 있으면 기존 표본을 재사용"""
+        def sample(n):
+            return count_wins(opponent, response, n, self.rng)
+        
+        if self.cache is not None:
+            return self.cache.monte_carlo(opponent, response, num_games, sample)
+        return sample(num_games), num_games
+    
+    def _count_pair_wins(self, pairs, num_games):
+        """여러 (상대, 응답) 쌍의 [(승리 수, 게임 수), ...]를 공유 코인 스트림으로 한 번에 계산"""
+        def sample_pairs(unique_pairs, missing):
+            first = [encode_sequence(opponent) for opponent, _ in unique_pairs]
+            second = [encode_sequence(response) for _, response in unique_pairs]
+            return count_pair_wins(first, second, missing, len(unique_pairs[0][0]), self.rng)
+        
+        if self.cache is not None:
+            return self.cache.monte_carlo_pairs(pairs, num_games, sample_pairs)
+        wins = sample_pairs(pairs, [num_games] * len(pairs))
+        return [(int(w), num_games) for w in wins]
+    
+    def paired_tournament(self, games_per_case=20000, antithetic=True, confidence=0.95):
+        """공통 난수(같은 코인 스트림)로 두 전략을 짝지어 비교하는 토너먼트
+        
+        두 응답을 같은 스트림에서 대결시키므로 승률 차이의 분산이 독립 시뮬레이션보다
+        훨씬 작다. antithetic이면 앞/뒤를 뒤집은 보완 스트림도 사용 (게임 수 2배, 추가 비용 없음).
+        차이의 표준오차는 스트림 단위 차이의 표본 분산으로 계산하고, 같은 게임 수의
+        독립 비교와의 분산 비(= 같은 검정력에 필요한 게임 수 배율)도 함께 보고한다.
+        """
+        print("\n⚔️  AI 전략 vs 콘웨이 전략 짝 비교 (공통 난수)")
+        print("=" * 60)
+        
+        opponents = self.env.sequences
+        result = paired_differences(
+            [encode_sequence(o) for o in opponents],
+            [encode_sequence(self.ai_strategy[o]) for o in opponents],
+            [encode_sequence(self.conway_strategy[o]) for o in opponents],
+            games_per_case, len(opponents[0]), self.rng, antithetic=antithetic
+        )
+        
+        units = games_per_case
+        scale = 2 if antithetic else 1
+        games = units * scale
+        z_score = NormalDist().inv_cdf((1 + confidence) / 2)
+        
+        def paired_se(total, square):
+            variance = (square - total * total / units) / max(units - 1, 1)
+            return np.sqrt(max(variance, 0.0) / units)
+        
+        print("상대 선택 | AI 승률 | 콘웨이 승률 | 차이(AI-콘웨이) | 짝 표준오차 | 분산 감소")
+        print("-" * 80)
+        
+        cases = {}
+        for i, opponent in enumerate(opponents):
+            ai_rate = result['wins_a'][i] / games
+            conway_rate = result['wins_b'][i] / games
+            difference = result['differences'][i] / games
+            standard_error = paired_se(result['differences'][i], result['squares'][i]) / scale
+            independent_se = np.sqrt((ai_rate * (1 - ai_rate) + conway_rate * (1 - conway_rate)) / games)
+            reduction = f"x{independent_se ** 2 / standard_error ** 2:.1f}" if standard_error > 0 else "동일 응답"
+            
+            cases[opponent] = {
+                'ai_rate': ai_rate, 'conway_rate': conway_rate, 'difference': difference,
+                'standard_error': standard_error, 'independent_se': independent_se,
+                'ci_lower': difference - z_score * standard_error,
+                'ci_upper': difference + z_score * standard_error,
+            }
+            print(f"   {opponent}   | {ai_rate:.3f} | {conway_rate:.3f} | {difference:+.4f} | "
+                  f"{standard_error:.4f} | {reduction}")
+        
+        # 모든 상대가 같은 스트림을 공유하므로 전체 평균 차이의 표준오차는 단위 합계로 계산
+        n_cases = len(opponents)
+        overall = result['total_difference'] / (games * n_cases)
+        overall_se = paired_se(result['total_difference'], result['total_square']) / (scale * n_cases)
+        
+        print("-" * 80)
+        print(f"전체 평균 차이: {overall:+.4f} ± {z_score * overall_se:.4f} "
+              f"({confidence:.0%} 신뢰구간, 상대당 {games}게임)")
+        
+        return {
+            'cases': cases,
+            'difference': overall,
+            'standard_error': overall_se,
+            'ci_lower': overall - z_score * overall_se,
+            'ci_upper': overall + z_score * overall_se,
+            'games_per_case': games,
+        }
+    
+    def adaptive_tournament(self, confidence=0.95, max_games_per_case=100000, method='wilson'):
+        """신뢰 구간이 분리되는 즉시 중단하는 적응형 토너먼트"""
+        print("\n⚔️  AI 전략 vs 콘웨이 전략 적응형 대결")
+        print("=" * 60)
+        print("상대 선택 | AI 응답 | 콘웨이 응답 | AI 승률 | 콘웨이 승률 | 게임 수 | 승자")
+        print("-" * 80)
+        
+        results = {}
+        total_games = 0
+        
+        for opponent in self.env.sequences:
+            ai_response = self.ai_strategy[opponent]
+            conway_response = self.conway_strategy[opponent]
+            
+            if ai_response == conway_response:
+                # 같은 응답이면 비교할 필요 없음
+                results[opponent] = {'decision': 0, 'games': 0}
+                print(f"   {opponent}   |  {ai_response}  |   {conway_response}   |   -   |   -   | {0:>7} | 🤝 동일")
+                continue
+            
+            result = sequential_compare(
+                lambda n: count_wins(opponent, ai_response, n, self.rng),
+                lambda n: count_wins(opponent, conway_response, n, self.rng),
+                confidence=confidence, method=method, max_games=max_games_per_case
+            )
+            results[opponent] = result
+            total_games += result['games'] * 2
+            
+            if result['decision'] > 0:
+                winner_mark = "🔥 AI"
+            elif result['decision'] < 0:
+                winner_mark = "⭐ 콘웨이"
+            else:
+                winner_mark = "❓ 미결정"
+            
+            print(f"   {opponent}   |  {ai_response}  |   {conway_response}   | {result['win_rate_a']:.3f} | {result['win_rate_b']:.3f} | {result['games']:>7} | {winner_mark}")
+        
+        print("-" * 80)
+        print(f"사용한 총 게임 수: {total_games}")
+        
+        return results, total_games
+    
+    def exact_tournament(self):
+        """시뮬레이션 없이 정확한 확률로 두 전략의 평균 승률 계산"""
+        ai_rates = [conway_win_probability(o, self.ai_strategy[o]) for o in self.env.sequences]
+        conway_rates = [conway_win_probability(o, self.conway_strategy[o]) for o in self.env.sequences]
+        
+        overall_ai = float(sum(ai_rates) / len(ai_rates))
+        overall_conway = float(sum(conway_rates) / len(conway_rates))
+        
+        return overall_ai, overall_conway
 
 def main():
     """메인 검증 실행"""
@@ -278,12 +482,15 @@ def main():
     policies, consistency = verification.verify_consistency(num_runs=3)
     
     # 2단계: 이론적 확률 분석
-    theory_analysis = TheoreticalProbabilityAnalysis()
+    cache = default_cache()
+    theory_analysis = TheoreticalProbabilityAnalysis(cache=cache)
     probability_results = theory_analysis.analyze_disputed_cases()
     
     # 3단계: 직접 대결 토너먼트
-    tournament = HeadToHeadTournament()
+    tournament = HeadToHeadTournament(cache=cache)
     ai_performance, conway_performance = tournament.tournament()
+    exact_ai, exact_conway = tournament.exact_tournament()
+    paired = tournament.paired_tournament()
     
     # 최종 결론
     print(f"\n" + "🎯" * 30)
@@ -302,6 +509,9 @@ def main():
     print(f"3️⃣  직접 대결 결과:")
     print(f"   🤖 AI 전략 평균 승률: {ai_performance:.3f}")
     print(f"   📚 콘웨이 전략 평균 승률: {conway_performance:.3f}")
+    print(f"   📐 정확한 확률: AI {exact_ai:.4f} / 콘웨이 {exact_conway:.4f}")
+    print(f"   🔗 짝 비교 차이(AI-콘웨이): {paired['difference']:+.4f} "
+          f"[{paired['ci_lower']:+.4f}, {paired['ci_upper']:+.4f}]")
     
     if ai_performance > conway_performance:
         print("   🏆 결론: AI 전략이 실제로 더 우수함!")
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+구조적 최적 응답 탐색 회귀 테스트
+
+사용법:
+    python -m pytest tests
+"""
+
+import os
+import sys
+from fractions import Fraction
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from best_response import _exact_win_probability, best_response, win_probability
+
+
+def test_long_run_biased_coin_stays_a_probability():
+    # 긴 같은 면 연속에서 상관값 뺄셈의 자릿수 손실로 1을 넘던 경우
+    for p_heads in (0.3, 0.7):
+        for sequence in ('H' * 40, 'T' * 40, 'H' * 200):
+            _, probability = best_response(sequence, p_heads)
+            assert 0.0 <= probability <= 1.0
+
+
+def test_long_run_biased_coin_matches_exact():
+    seq1, seq2 = 'H' * 40, 'T' + 'H' * 39
+    expected = _exact_win_probability(seq1, seq2, Fraction(0.3))
+    assert win_probability(seq1, seq2, 0.3) == float(expected)
+    assert expected < 1